@@ -1,14 +1,18 @@
+from collections.abc import Callable
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.response_cache import catalog_etag, etag_matches
+from app.core.config import Settings, get_settings
+from app.db.catalog_snapshot import CatalogSnapshot, get_catalog_snapshot
 from app.db.repositories.cart_repo import CartRepo
 from app.db.repositories.customer_repo import CustomerRepo
 from app.db.repositories.extra_repo import ExtraRepo
 from app.db.repositories.order_repo import OrderRepo
 from app.db.repositories.pizza_repo import PizzaRepo
-from app.db.session import get_db_session
+from app.db.session import get_read_session_factory, get_session_factory
 from app.services.cart_service import CartService
 from app.services.catalog_service import CatalogService
 from app.services.order_service import OrderService
@@ -17,10 +21,22 @@ from app.services.order_service import OrderService
 from app.db.uow import UnitOfWork
 
 
-def get_uow(
-    session: Annotated[AsyncSession, Depends(get_db_session)]
-) -> UnitOfWork:
-    return UnitOfWork(session)
+async def get_uow(
+    session_factory: Annotated[
+        Callable[[], AsyncSession], Depends(get_session_factory)
+    ],
+    read_session_factory: Annotated[
+        Callable[[], AsyncSession] | None, Depends(get_read_session_factory)
+    ],
+    catalog: Annotated[CatalogSnapshot | None, Depends(get_catalog_snapshot)],
+) -> AsyncGenerator[UnitOfWork, None]:
+    uow = UnitOfWork(
+        session_factory, read_session_factory=read_session_factory, catalog=catalog
+    )
+    try:
+        yield uow
+    finally:
+        await uow.close()
 
 
 def get_catalog_service(
@@ -39,4 +55,29 @@ def get_cart_service(
     uow: Annotated[UnitOfWork, Depends(get_uow)],
     order_service: Annotated[OrderService, Depends(get_order_service)],
 ) -> CartService:
-    return CartService(uow, order_service)
\ No newline at end of file
+    return CartService(uow, order_service)
+
+
+def catalog_cache_headers(
+    request: Request,
+    response: Response,
+    catalog: Annotated[CatalogSnapshot | None, Depends(get_catalog_snapshot)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> None:
+    """ETag and Cache-Control for responses served from the catalog snapshot.
+
+    Use as a route dependency so a matching If-None-Match is answered with 304
+    before the endpoint, and with it any database or serialization work, runs.
+    """
+    # A database without the version triggers never bumps the version, so it
+    # can't vouch for the payload.
+    if catalog is None or not catalog.version:
+        return
+    etag = catalog_etag(catalog.version)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.CATALOG_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
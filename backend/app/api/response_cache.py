@@ -0,0 +1,152 @@
+import gzip
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from app.api.routing import FastJSONRoute
+from app.core.config import get_settings
+from app.db.catalog_snapshot import get_catalog_snapshot
+
+# Headers a cached response replays; everything else is recomputed per response.
+_REPLAYED_HEADERS = ("content-type", "etag", "cache-control")
+
+
+def catalog_etag(version: int) -> str:
+    return f'"catalog-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def normalize_query(request: Request) -> str:
+    """The query string with its parameters sorted, so equivalent URLs share an entry."""
+    return urlencode(sorted(request.query_params.multi_items()))
+
+
+class CachedResponse:
+    """The final bytes of one response, plus a gzipped copy when it is worth having."""
+
+    __slots__ = ("body", "gzip_body", "headers")
+
+    def __init__(self, body: bytes, headers: dict[str, str], compress_min_bytes: int) -> None:
+        self.body = body
+        self.headers = headers
+        self.gzip_body = (
+            gzip.compress(body, mtime=0)
+            if compress_min_bytes and len(body) >= compress_min_bytes
+            else None
+        )
+        if self.gzip_body is not None:
+            self.headers["vary"] = "Accept-Encoding"
+
+    def respond(self, request: Request) -> Response:
+        etag = self.headers["etag"]
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=self.headers)
+        if self.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            # Like nginx, a compressed variant only keeps a weak validator.
+            headers = {**self.headers, "etag": f"W/{etag}", "content-encoding": "gzip"}
+            return Response(self.gzip_body, headers=headers)
+        return Response(self.body, headers=self.headers)
+
+
+class ResponseCache:
+    """LRU of encoded responses for one catalog version.
+
+    Entries are keyed by path and normalized query. Storing a response for a newer
+    catalog version drops everything cached for older ones.
+    """
+
+    def __init__(self, max_entries: int, compress_min_bytes: int = 0) -> None:
+        self.max_entries = max_entries
+        self.compress_min_bytes = compress_min_bytes
+        self.version: int | None = None
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, version: int, key: tuple[str, str]) -> CachedResponse | None:
+        if version != self.version:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, version: int, key: tuple[str, str], response: Response) -> CachedResponse:
+        entry = CachedResponse(
+            response.body,
+            {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers},
+            self.compress_min_bytes,
+        )
+        if self.version is not None and version < self.version:
+            # A request that started on an older snapshot; its bytes are already stale.
+            return entry
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.version = None
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        settings = get_settings()
+        _response_cache = ResponseCache(
+            settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_COMPRESS_MIN_BYTES
+        )
+    return _response_cache
+
+
+class CatalogCacheRoute(FastJSONRoute):
+    """Route that replays the encoded response while the catalog version is unchanged.
+
+    A hit skips dependencies, the endpoint, response validation and JSON encoding.
+    Only successful responses that carry the catalog ETag are stored, so this
+    is inert unless the route also depends on ``catalog_cache_headers``.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def cached_route_handler(request: Request) -> Response:
+            # Resolved like the route's own dependency, so overrides see the same snapshot.
+            catalog = request.app.dependency_overrides.get(
+                get_catalog_snapshot, get_catalog_snapshot
+            )()
+            cache = get_response_cache()
+            if catalog is None or not catalog.version or not cache.max_entries:
+                return await handler(request)
+            key = (request.url.path, normalize_query(request))
+            entry = cache.get(catalog.version, key)
+            if entry is None:
+                response = await handler(request)
+                # The snapshot can move on while the endpoint runs; only keep bytes
+                # built from the version the key names.
+                etag = response.headers.get("etag")
+                if response.status_code != 200 or etag != catalog_etag(catalog.version):
+                    return response
+                entry = cache.put(catalog.version, key, response)
+            return entry.respond(request)
+
+        return cached_route_handler
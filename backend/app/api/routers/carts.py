@@ -3,6 +3,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Request
 
+from app.api.routing import FastJSONRoute
 from app.core.limiter import limiter
 from app.core.response import Response, ok
 from app.db.session import get_session_maker
@@ -15,7 +16,7 @@ from app.services.cart_service import CartService
 from app.core.config import get_settings
 from app.api.deps import get_cart_service
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/items", response_model=Response[CartOut])
@@ -8,12 +8,17 @@ from app.schemas.catalog import ExtraOut
 from app.services.catalog_service import CatalogService
 from app.db.repositories.extra_repo import ExtraRepo
 from app.db.repositories.pizza_repo import PizzaRepo
-from app.api.deps import get_catalog_service
+from app.api.deps import catalog_cache_headers, get_catalog_service
+from app.api.response_cache import CatalogCacheRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CatalogCacheRoute)
 
 
-@router.get("/", response_model=Response[list[ExtraOut]])
+@router.get(
+    "/",
+    response_model=Response[list[ExtraOut]],
+    dependencies=[Depends(catalog_cache_headers)],
+)
 async def list_extras(
     catalog_service: CatalogService = Depends(get_catalog_service),
 ):
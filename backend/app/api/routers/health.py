@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 
+from app.api.routing import FastJSONRoute
 from app.core.response import ok
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/")
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.api.routing import FastJSONRoute
+from app.core.response import ok
+from app.db.pool_metrics import get_pool_metrics
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+@router.get("/pool")
+async def pool_metrics():
+    """Connection-pool usage per engine: checked-out/idle connections, overflow, churn and checkout wait times."""
+    return ok({name: metrics.snapshot() for name, metrics in get_pool_metrics().items()})
@@ -1,20 +1,33 @@
 import uuid
+from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import FastJSONRoute
+from app.core.export import csv_stream, ndjson_stream
 from app.core.limiter import limiter
-from app.core.response import Response, ok, paginated
+from app.core.response import Response, cursor_paginated, ok, paginated
 from app.db.session import get_session_maker
 from app.db.repositories.cart_repo import CartRepo
 from app.db.repositories.order_repo import OrderRepo
-from app.schemas.order import OrderIn, OrderOut, QuoteOut, OrderLineIn
-from app.services.order_service import OrderService
-from app.core.config import get_settings
+from app.schemas.order import (
+    ExportFormat,
+    OrderIn,
+    OrderLineIn,
+    OrderOut,
+    OrderSummaryOut,
+    OrderView,
+    QuoteOut,
+)
+from app.schemas.pagination import CursorPageMeta, TotalMode
+from app.services.order_service import ORDER_CSV_COLUMNS, OrderService, order_csv_rows
+from app.core.config import Settings, get_settings
 from app.api.deps import get_order_service
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post(
@@ -55,6 +68,46 @@ async def quote_order(
     return ok(quote)
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+    summary="Export orders",
+    description="""
+Streams every matching order, oldest first, as newline-delimited JSON (one `OrderOut`
+per line) or as CSV with one row per order line.
+
+`created_from` is inclusive and `created_to` exclusive. Orders are read from the
+database in batches while the response is sent, so exports of any size use the same memory.
+""",
+)
+async def export_orders(
+    format: ExportFormat = "ndjson",
+    unique_identifier: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    order_service: OrderService = Depends(get_order_service),
+    settings: Settings = Depends(get_settings),
+):
+    orders = order_service.export_orders(
+        unique_identifier=unique_identifier,
+        created_from=created_from,
+        created_to=created_to,
+        batch_size=settings.ORDER_EXPORT_BATCH_SIZE,
+    )
+    if format == "csv":
+        body = csv_stream(orders, ORDER_CSV_COLUMNS, order_csv_rows)
+        media_type = "text/csv"
+    else:
+        body = ndjson_stream(orders)
+        media_type = "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"content-disposition": f'attachment; filename="orders.{format}"'},
+    )
+
+
 @router.get(
     "/{order_id}",
     response_model=Response[OrderOut],
@@ -71,20 +124,47 @@ async def get_order(
 
 @router.get(
     "/",
-    response_model=Response[list[OrderOut]],
+    response_model=Response[list[OrderOut] | list[OrderSummaryOut]],
     summary="Get all orders",
-    description="Retrieves a list of all orders.",
+    description="""
+Retrieves a list of all orders.
+
+Pages by `page` by default. Pass `cursor` (empty for the first page, then the previous
+page's `next_cursor`) to page by creation time instead, which stays fast and stable on deep pages.
+
+`total` picks how the matching orders are counted: `exact` (default), `estimate` from
+the query planner, which is much cheaper on large tables, or `none`.
+
+`view=summary` returns only each order's header: status, item count, totals and
+creation time, without lines or customer. Fetch `/api/orders/{order_id}` for the full order.
+""",
 )
 async def get_all_orders(
     unique_identifier: Optional[str] = None,
-    page: int = 1,
-    per_page: int = 10,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total: TotalMode = "exact",
+    view: OrderView = "full",
     order_service: OrderService = Depends(get_order_service),
 ):
     skip = (page - 1) * per_page
-    result = await order_service.get_all_orders(
-        unique_identifier=unique_identifier, skip=skip, limit=per_page
+    orders = await order_service.get_all_orders(
+        unique_identifier=unique_identifier,
+        skip=skip,
+        limit=per_page,
+        cursor=cursor,
+        total_mode=total,
+        view=view,
     )
+    meta = orders.meta
+    if isinstance(meta, CursorPageMeta):
+        return cursor_paginated(
+            orders.items,
+            size=per_page,
+            total=meta.total,
+            next_cursor=meta.next_cursor,
+        )
     return paginated(
-        result["items"], page=page, size=per_page, total=result["total"]
+        orders.items, page=page, size=per_page, total=meta.total, has_next=meta.has_next
     )
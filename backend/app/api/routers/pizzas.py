@@ -6,31 +6,46 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.response import Response, ok
-from app.schemas.catalog import PizzaOut
-from app.schemas.pagination import Page
+from app.schemas.catalog import PizzaOut, SearchMode
+from app.schemas.pagination import Page, TotalMode
 from app.services.catalog_service import CatalogService
-from app.api.deps import get_catalog_service
+from app.api.deps import catalog_cache_headers, get_catalog_service
+from app.api.response_cache import CatalogCacheRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CatalogCacheRoute)
 
 
-@router.get("/", response_model=Response[Page[PizzaOut]])
+@router.get(
+    "/",
+    response_model=Response[Page[PizzaOut]],
+    dependencies=[Depends(catalog_cache_headers)],
+)
 async def list_pizzas(
     search: str | None = None,
+    search_mode: SearchMode = "contains",
     ingredients: Annotated[list[str] | None, Query()] = None,
+    any_ingredients: Annotated[list[str] | None, Query()] = None,
+    exclude_ingredients: Annotated[list[str] | None, Query()] = None,
     min_price: float | None = None,
     max_price: float | None = None,
     page: int = 1,
     page_size: int = 10,
+    cursor: str | None = None,
+    total: TotalMode = "exact",
     catalog_service: CatalogService = Depends(get_catalog_service),
 ):
     pizzas = await catalog_service.list_pizzas(
         search=search,
         ingredients=ingredients,
+        any_ingredients=any_ingredients,
+        exclude_ingredients=exclude_ingredients,
         min_price=min_price,
         max_price=max_price,
         page=page,
         page_size=page_size,
+        search_mode=search_mode,
+        cursor=cursor,
+        total_mode=total,
     )
     return ok(pizzas)
 
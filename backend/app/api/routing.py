@@ -0,0 +1,57 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from app.core.response import ModelJSONResponse
+
+# Extra endpoint parameter through which FastAPI hands over the response that
+# dependencies set headers and status codes on.
+_SUB_RESPONSE = "_fast_json_sub_response"
+
+
+def _render_models(endpoint: Callable[..., Any], status_code: int | None) -> Callable[..., Any]:
+    signature = inspect.signature(endpoint)
+
+    @functools.wraps(endpoint)
+    async def render_models(*args: Any, **kwargs: Any) -> Any:
+        sub_response: Response = kwargs.pop(_SUB_RESPONSE)
+        content = await endpoint(*args, **kwargs)
+        if not isinstance(content, BaseModel):
+            return content
+        response = ModelJSONResponse(
+            content, status_code=sub_response.status_code or status_code or 200
+        )
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    render_models.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_SUB_RESPONSE, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ]
+    )
+    return render_models
+
+
+class FastJSONRoute(APIRoute):
+    """Route that renders the model its endpoint returns as-is.
+
+    FastAPI otherwise dumps the returned model, validates the dump against
+    ``response_model`` and runs it through ``jsonable_encoder`` and ``json.dumps``.
+    Here the model, already validated when it was built, is encoded once by
+    pydantic-core. ``response_model`` still documents the route, so endpoints
+    must return models of that shape, as the ``ok`` and ``paginated`` helpers do.
+    Anything that isn't a model takes FastAPI's usual path.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # include_router builds the route again from the already wrapped endpoint.
+        wrapped = _SUB_RESPONSE in inspect.signature(endpoint).parameters
+        if inspect.iscoroutinefunction(endpoint) and not wrapped:
+            endpoint = _render_models(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
@@ -19,9 +19,31 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "password"
     DB_NAME: str = "db"
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Read replicas for read-only units of work, as full SQLAlchemy URLs.
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # How often to check whether the cached pizza/extra catalog changed.
+    CATALOG_REFRESH_INTERVAL_SECONDS: float = 5.0
+    # How long browsers may reuse catalog responses before revalidating their ETag.
+    CATALOG_CACHE_MAX_AGE_SECONDS: int = 0
+    # Encoded catalog responses kept in memory per worker (0 disables), and the
+    # smallest body worth storing a gzipped copy of (0 never compresses).
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_COMPRESS_MIN_BYTES: int = 1024
+    # Orders fetched per server-side cursor round trip by the order export.
+    ORDER_EXPORT_BATCH_SIZE: int = 500
+
     API_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
-    @field_validator("API_CORS_ORIGINS", mode="before")
+    @field_validator("API_CORS_ORIGINS", "DB_REPLICA_URLS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
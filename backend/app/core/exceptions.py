@@ -1,3 +1,5 @@
+import uuid
+from collections.abc import Sequence
 from typing import Any, Dict, Optional
 
 
@@ -23,6 +25,13 @@ class NotFoundAppError(AppError):
         super().__init__("not_found", message)
 
 
+def not_found_message(label: str, ids: Sequence[uuid.UUID]) -> str:
+    """Message for one or more missing ``label`` rows, naming every id."""
+    if len(ids) == 1:
+        return f"{label} with id {ids[0]} not found"
+    return f"{label}s with ids {', '.join(str(i) for i in ids)} not found"
+
+
 class ConflictAppError(AppError):
     def __init__(self, message: str):
         super().__init__("conflict", message)
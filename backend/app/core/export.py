@@ -0,0 +1,44 @@
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Bytes gathered before handing a chunk to the server, so a large export goes out
+# in a few hundred writes rather than one per record.
+CHUNK_SIZE = 64 * 1024
+
+
+async def ndjson_stream(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Newline-delimited JSON, one model per line."""
+    chunk = bytearray()
+    async for item in items:
+        chunk += item.__pydantic_serializer__.to_json(item)
+        chunk += b"\n"
+        if len(chunk) >= CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+async def csv_stream(
+    items: AsyncIterable[T],
+    columns: Sequence[str],
+    to_rows: Callable[[T], Iterable[Sequence[object]]],
+) -> AsyncIterator[bytes]:
+    """CSV with a header of ``columns`` and the rows ``to_rows`` makes of each item."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for item in items:
+        writer.writerows(to_rows(item))
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
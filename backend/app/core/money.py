@@ -0,0 +1,120 @@
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+CENT = Decimal("0.01")
+
+
+class Money:
+    """An exact amount held as an integer number of minor units (cents).
+
+    Pricing adds and multiplies plain ints; amounts only become ``Decimal`` at the
+    database column and ``float`` in JSON responses.
+    """
+
+    __slots__ = ("cents",)
+
+    def __init__(self, cents: int = 0) -> None:
+        self.cents = cents
+
+    @classmethod
+    def of(cls, amount: "Money | Decimal | float | int | str") -> "Money":
+        """Money from an amount in major units, e.g. ``Money.of("12.99")``."""
+        if isinstance(amount, Money):
+            return amount
+        if isinstance(amount, int):
+            return cls(amount * 100)
+        if isinstance(amount, float):
+            # repr() is the shortest string that round-trips, so 12.99 stays 12.99.
+            amount = repr(amount)
+        value = Decimal(amount)
+        if value.as_tuple().exponent != -2:
+            value = value.quantize(CENT, rounding=ROUND_HALF_EVEN)
+        return cls(int(value.scaleb(2)))
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.cents).scaleb(-2)
+
+    def __float__(self) -> float:
+        return self.cents / 100
+
+    def __add__(self, other: "Money") -> "Money":
+        if isinstance(other, Money):
+            return Money(self.cents + other.cents)
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> "Money":
+        # Lets sum() start from its default 0.
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money") -> "Money":
+        if isinstance(other, Money):
+            return Money(self.cents - other.cents)
+        return NotImplemented
+
+    def __mul__(self, quantity: int) -> "Money":
+        if isinstance(quantity, int):
+            return Money(self.cents * quantity)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self.cents)
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Money):
+            return self.cents == other.cents
+        return NotImplemented
+
+    def __lt__(self, other: "Money") -> bool:
+        if isinstance(other, Money):
+            return self.cents < other.cents
+        return NotImplemented
+
+    def __le__(self, other: "Money") -> bool:
+        if isinstance(other, Money):
+            return self.cents <= other.cents
+        return NotImplemented
+
+    def __gt__(self, other: "Money") -> bool:
+        if isinstance(other, Money):
+            return self.cents > other.cents
+        return NotImplemented
+
+    def __ge__(self, other: "Money") -> bool:
+        if isinstance(other, Money):
+            return self.cents >= other.cents
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.cents)
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        from_amount = core_schema.no_info_plain_validator_function(cls.of)
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.chain_schema(
+                [core_schema.float_schema(), from_amount]
+            ),
+            python_schema=from_amount,
+            # The API keeps publishing amounts as JSON numbers in major units.
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                float, return_schema=core_schema.float_schema()
+            ),
+        )
@@ -1,23 +1,22 @@
-from decimal import Decimal, ROUND_HALF_EVEN
-from typing import List
+from typing import Iterable
 
+from app.core.money import Money
 from app.db.models import Extra, Pizza
 
 
 class PriceCalculator:
     @staticmethod
-    def calculate_unit_price(pizza: Pizza, extras: List[Extra]) -> Decimal:
-        unit_base = Decimal(pizza.base_price)
-        unit_extras = sum(Decimal(extra.price) for extra in extras)
-        return (unit_base + unit_extras).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_EVEN
+    def calculate_extras_total(extras: Iterable[Extra]) -> Money:
+        return Money(sum([Money.of(extra.price).cents for extra in extras]))
+
+    @staticmethod
+    def calculate_unit_price(pizza: Pizza, extras: Iterable[Extra]) -> Money:
+        return Money.of(pizza.base_price) + PriceCalculator.calculate_extras_total(
+            extras
         )
 
     @staticmethod
     def calculate_line_total(
-        pizza: Pizza, extras: List[Extra], quantity: int
-    ) -> Decimal:
-        unit_total = PriceCalculator.calculate_unit_price(pizza, extras)
-        return (unit_total * quantity).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_EVEN
-        )
+        pizza: Pizza, extras: Iterable[Extra], quantity: int
+    ) -> Money:
+        return PriceCalculator.calculate_unit_price(pizza, extras) * quantity
@@ -5,6 +5,18 @@ from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
+class ModelJSONResponse(JSONResponse):
+    """
+    JSON response that encodes a pydantic model straight to bytes with
+    pydantic-core, instead of dumping it to dicts for the stdlib encoder first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
+
+
 class ErrorResponse(BaseModel):
     type: str
     details: Optional[Dict[str, Any]] = None
@@ -25,16 +37,47 @@ def ok(data: Any, message: str = "Success") -> Response:
 
 
 def paginated(
-    data: Any, page: int, size: int, total: int, message: str = "Success"
+    data: Any,
+    page: int,
+    size: int,
+    total: Optional[int],
+    message: str = "Success",
+    has_next: Optional[bool] = None,
 ) -> Response:
     """
     Returns a paginated success response.
     """
+    meta = {"page": page, "size": size, "total": total}
+    if has_next is not None:
+        meta["has_next"] = has_next
+    return Response(
+        is_success=True,
+        data=data,
+        message=message,
+        meta=meta,
+    )
+
+
+def cursor_paginated(
+    data: Any,
+    size: int,
+    total: Optional[int],
+    next_cursor: Optional[str],
+    message: str = "Success",
+) -> Response:
+    """
+    Returns a keyset-paginated success response.
+    """
     return Response(
         is_success=True,
         data=data,
         message=message,
-        meta={"page": page, "size": size, "total": total},
+        meta={
+            "size": size,
+            "total": total,
+            "has_next": next_cursor is not None,
+            "next_cursor": next_cursor,
+        },
     )
 
 
@@ -10,4 +10,7 @@ class TimestampMixin:
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
 class BaseModel(Base, TimestampMixin):
-    __abstract__ = True
\ No newline at end of file
+    __abstract__ = True
+    # Fetch the timestamps with RETURNING on UPDATE as well as INSERT, so a flushed
+    # row never needs a follow-up SELECT before it is read.
+    __mapper_args__ = {"eager_defaults": True}
\ No newline at end of file
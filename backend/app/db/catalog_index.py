@@ -0,0 +1,176 @@
+import re
+import uuid
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice
+
+from app.db.models import Pizza
+
+# Minimum word similarity for a fuzzy name match, on both the pg_trgm and the
+# in-memory path. pg_trgm's own default (0.6) misses typos like "margarita".
+FUZZY_SEARCH_THRESHOLD = 0.5
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Positions of the set bits in ``mask``, lowest first."""
+    # One pass in C to a string beats peeling bits off a large int one at a time.
+    bits = bin(mask)[:1:-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+class IngredientIndex:
+    """Inverted index from ingredient to the pizzas containing it.
+
+    Each ingredient maps to a bitset over the pizzas' positions, so AND, OR and
+    exclude filters are a handful of integer operations however long the menu is.
+    Matching is exact, like the ``@>`` / ``&&`` array operators on the database path.
+    """
+
+    def __init__(self, pizzas: Sequence[Pizza]) -> None:
+        self.pizzas = tuple(pizzas)
+        self.all = (1 << len(self.pizzas)) - 1
+        self._bits: dict[str, int] = {}
+        for position, pizza in enumerate(self.pizzas):
+            for ingredient in pizza.ingredients or ():
+                self._bits[ingredient] = self._bits.get(ingredient, 0) | (1 << position)
+
+    def match(
+        self,
+        all_of: Iterable[str] | None = None,
+        any_of: Iterable[str] | None = None,
+        none_of: Iterable[str] | None = None,
+    ) -> int:
+        """Bitset of the pizzas with every ``all_of``, at least one ``any_of`` and no ``none_of`` ingredient."""
+        mask = self.all
+        for ingredient in all_of or ():
+            mask &= self._bits.get(ingredient, 0)
+        if any_of:
+            matches_any = 0
+            for ingredient in any_of:
+                matches_any |= self._bits.get(ingredient, 0)
+            mask &= matches_any
+        for ingredient in none_of or ():
+            mask &= ~self._bits.get(ingredient, 0)
+        return mask
+
+    def select(self, mask: int, start: int = 0, stop: int | None = None) -> list[Pizza]:
+        """The pizzas in ``mask``, in index order, optionally sliced without visiting the rest."""
+        positions = islice(iter_bits(mask), start, stop)
+        return [self.pizzas[position] for position in positions]
+
+
+class KeysetOrder:
+    """Index positions sorted by ``(created_at, id)``, the database's keyset order."""
+
+    def __init__(self, pizzas: Sequence[Pizza]) -> None:
+        keyed = sorted(
+            ((pizza.created_at, pizza.id), position)
+            for position, pizza in enumerate(pizzas)
+        )
+        self._keys = [key for key, _ in keyed]
+        self.positions = [position for _, position in keyed]
+
+    def after(self, key: tuple[datetime, uuid.UUID] | None = None) -> Iterator[int]:
+        """Positions strictly after ``key`` in keyset order, or all of them."""
+        start = bisect_right(self._keys, key) if key is not None else 0
+        return islice(self.positions, start, None)
+
+
+def word_trigrams(word: str) -> frozenset[str]:
+    # Padded the way pg_trgm pads words: two spaces in front, one behind.
+    padded = f"  {word} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def split_words(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def trigrams(text: str) -> frozenset[str]:
+    return frozenset().union(*(word_trigrams(word) for word in split_words(text)))
+
+
+class TrigramIndex:
+    """Trigram postings over pizza names for typo-tolerant, relevance-ranked search.
+
+    Scores approximate pg_trgm's ``word_similarity``: the best Jaccard similarity
+    between the query's trigrams and those of any run of consecutive words in the name.
+    """
+
+    def __init__(self, pizzas: Sequence[Pizza]) -> None:
+        self.pizzas = tuple(pizzas)
+        self._words: list[tuple[frozenset[str], ...]] = []
+        self._postings: dict[str, list[int]] = {}
+        # One shared set per distinct word, so per-query caches hit by identity.
+        by_word: dict[str, frozenset[str]] = {}
+        for position, pizza in enumerate(self.pizzas):
+            for word in split_words(pizza.name):
+                if word not in by_word:
+                    by_word[word] = word_trigrams(word)
+            words = tuple(by_word[word] for word in split_words(pizza.name))
+            self._words.append(words)
+            for trigram in frozenset().union(*words):
+                self._postings.setdefault(trigram, []).append(position)
+
+    @staticmethod
+    def _score(
+        query: frozenset[str],
+        words: tuple[frozenset[str], ...],
+        word_scores: dict[frozenset[str], float],
+    ) -> float:
+        # Words sharing nothing with the query only dilute an extent, so the best
+        # extent starts and ends on words that do.
+        hits = [i for i, word in enumerate(words) if not query.isdisjoint(word)]
+        best = 0.0
+        for i in hits:
+            word = words[i]
+            if (score := word_scores.get(word)) is None:
+                common = len(query & word)
+                score = word_scores[word] = common / (len(query) + len(word) - common)
+            best = max(best, score)
+        for n, first in enumerate(hits[:-1]):
+            extent, previous = words[first], first
+            for last in hits[n + 1 :]:
+                extent = extent.union(*words[previous + 1 : last + 1])
+                previous = last
+                common = len(query & extent)
+                best = max(best, common / (len(query) + len(extent) - common))
+        return best
+
+    def search(
+        self,
+        term: str,
+        positions: Iterable[int] | None = None,
+        threshold: float = FUZZY_SEARCH_THRESHOLD,
+    ) -> list[Pizza]:
+        """Pizzas whose name matches ``term``, most relevant first, then by name.
+
+        ``positions`` restricts the result to those index positions.
+        """
+        query = trigrams(term)
+        if not query:
+            return []
+        shared: Counter[int] = Counter()
+        for trigram in query:
+            shared.update(self._postings.get(trigram, ()))
+        allowed = set(positions) if positions is not None else None
+        # The trigrams a name shares with the query bound its score from above,
+        # so most candidates are dropped before scoring.
+        needed = threshold * len(query)
+        word_scores: dict[frozenset[str], float] = {}
+        scored = []
+        for position, common in shared.items():
+            if common < needed or (allowed is not None and position not in allowed):
+                continue
+            score = self._score(query, self._words[position], word_scores)
+            if score >= threshold:
+                scored.append((-score, self.pizzas[position].name, position))
+        scored.sort()
+        return [self.pizzas[position] for _, _, position in scored]
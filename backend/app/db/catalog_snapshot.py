@@ -0,0 +1,141 @@
+import asyncio
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog import get_logger
+
+from app.db.catalog_index import IngredientIndex, KeysetOrder, TrigramIndex
+from app.db.models import CatalogVersion, Extra, Pizza
+
+logger = get_logger(__name__)
+
+
+class CatalogSnapshot:
+    """Every pizza and extra as of one catalog version.
+
+    A snapshot is never modified after it is built; a newer version replaces it
+    wholesale. The rows are detached from any session and shared by all requests,
+    so treat them as read-only.
+    """
+
+    __slots__ = (
+        "version",
+        "pizzas",
+        "extras",
+        "active_extras",
+        "pizza_index",
+        "pizza_name_index",
+        "pizza_keyset",
+    )
+
+    def __init__(
+        self, version: int, pizzas: Iterable[Pizza], extras: Iterable[Extra]
+    ) -> None:
+        self.version = version
+        self.pizzas: Mapping[uuid.UUID, Pizza] = MappingProxyType(
+            {pizza.id: pizza for pizza in pizzas}
+        )
+        self.extras: Mapping[uuid.UUID, Extra] = MappingProxyType(
+            {extra.id: extra for extra in extras}
+        )
+        self.active_extras: tuple[Extra, ...] = tuple(
+            extra for extra in self.extras.values() if extra.is_active
+        )
+        # Active pizzas in the order they were loaded, which is the database
+        # listing's (name, id) order.
+        self.pizza_index = IngredientIndex(
+            [pizza for pizza in self.pizzas.values() if pizza.is_active]
+        )
+        # Same positions as pizza_index, so ingredient bitsets filter search hits directly.
+        self.pizza_name_index = TrigramIndex(self.pizza_index.pizzas)
+        self.pizza_keyset = KeysetOrder(self.pizza_index.pizzas)
+
+
+async def read_catalog_version(session: AsyncSession) -> int:
+    # Databases built without migrations have no counter row; treat them as version 0.
+    return await session.scalar(select(CatalogVersion.version)) or 0
+
+
+class CatalogCache:
+    """Holds the current snapshot and reloads it when the catalog version moves."""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self.snapshot: CatalogSnapshot | None = None
+        self._monitor: asyncio.Task | None = None
+
+    async def load(self) -> CatalogSnapshot:
+        async with self._session_factory() as session:
+            # Read the version first: a change that lands mid-load leaves the snapshot
+            # newer than its version, and the next poll reloads it.
+            version = await read_catalog_version(session)
+            pizzas = (
+                await session.scalars(select(Pizza).order_by(Pizza.name, Pizza.id))
+            ).all()
+            extras = (await session.scalars(select(Extra))).all()
+        self.snapshot = CatalogSnapshot(version, pizzas, extras)
+        logger.info(
+            "catalog_loaded", version=version, pizzas=len(pizzas), extras=len(extras)
+        )
+        return self.snapshot
+
+    async def refresh(self) -> bool:
+        """Reload the snapshot if the catalog changed since it was taken."""
+        async with self._session_factory() as session:
+            version = await read_catalog_version(session)
+        if self.snapshot is not None and version == self.snapshot.version:
+            return False
+        await self.load()
+        return True
+
+    async def _run_monitor(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep serving the last good snapshot until the database is back.
+                logger.warning("catalog_refresh_failed", exc_info=True)
+
+    def start_monitor(self, interval_seconds: float) -> None:
+        if self._monitor is None:
+            self._monitor = asyncio.create_task(self._run_monitor(interval_seconds))
+
+    async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+
+
+_catalog: CatalogCache | None = None
+
+
+async def init_catalog(
+    session_factory: Callable[[], AsyncSession], refresh_interval_seconds: float
+) -> CatalogCache:
+    """Load the process-wide snapshot and keep it current in the background."""
+    global _catalog
+    if _catalog is None:
+        _catalog = CatalogCache(session_factory)
+        await _catalog.load()
+        _catalog.start_monitor(refresh_interval_seconds)
+    return _catalog
+
+
+async def close_catalog() -> None:
+    global _catalog
+    if _catalog is not None:
+        await _catalog.close()
+    _catalog = None
+
+
+def get_catalog_snapshot() -> CatalogSnapshot | None:
+    """The current snapshot, or None when the catalog isn't cached in this process."""
+    return _catalog.snapshot if _catalog is not None else None
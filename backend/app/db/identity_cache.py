@@ -0,0 +1,33 @@
+import uuid
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityCache:
+    """Request-scoped lookup table of catalog rows already loaded by a unit of work.
+
+    Unlike the session identity map it survives the session being closed between
+    ``async with`` blocks, so services sharing a unit of work don't reload the same rows.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[type, dict[uuid.UUID, Any]] = {}
+
+    def get(self, model: type[T], key: uuid.UUID) -> T | None:
+        return self._rows.get(model, {}).get(key)
+
+    def get_many(self, model: type[T], keys: Iterable[uuid.UUID]) -> dict[uuid.UUID, T]:
+        rows = self._rows.get(model, {})
+        return {key: rows[key] for key in keys if key in rows}
+
+    def add(self, row: Any) -> None:
+        self._rows.setdefault(type(row), {})[row.id] = row
+
+    def add_all(self, rows: Iterable[Any]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def clear(self) -> None:
+        self._rows.clear()
@@ -1,13 +1,25 @@
 import uuid
 from typing import List
 
-from sqlalchemy import ARRAY, Boolean, ForeignKey, Numeric, String, Text
+from sqlalchemy import (
+    ARRAY,
+    DDL,
+    BigInteger,
+    Boolean,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.orm import relationship
 
 
-from app.db.base import BaseModel
+from app.core.money import Money
+from app.db.base import Base, BaseModel
+from app.db.types import MoneyType
 
 
 class CustomerInfo(BaseModel):
@@ -26,17 +38,36 @@ class CustomerInfo(BaseModel):
 
 class Pizza(BaseModel):
     __tablename__ = "pizzas"
+    __table_args__ = (
+        # Serves the @> (all of) and && (any of) ingredient filters.
+        Index("ix_pizzas_ingredients", "ingredients", postgresql_using="gin"),
+        # Serves ILIKE '%term%' and the %> fuzzy name match.
+        Index(
+            "ix_pizzas_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Keyset pagination order.
+        Index("ix_pizzas_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
-    base_price: Mapped[float] = mapped_column(Numeric(12, 2))
+    base_price: Mapped[Money] = mapped_column(MoneyType)
     image_url: Mapped[str] = mapped_column(Text, nullable=True)
     ingredients: Mapped[list[str]] = mapped_column(ARRAY(String))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
 
+# Lets metadata.create_all build the trigram index on databases set up without migrations.
+event.listen(
+    Pizza.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
 class Extra(BaseModel):
     __tablename__ = "extras"
 
@@ -44,10 +75,19 @@ class Extra(BaseModel):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
-    price: Mapped[float] = mapped_column(Numeric(12, 2))
+    price: Mapped[Money] = mapped_column(MoneyType)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
 
+class CatalogVersion(Base):
+    """Single-row counter that database triggers bump whenever pizzas or extras change."""
+
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, default=1, server_default="1")
+
+
 class Cart(BaseModel):
     __tablename__ = "carts"
 
@@ -55,6 +95,11 @@ class Cart(BaseModel):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     uniqueIdentifier: Mapped[str] = mapped_column(String(100), nullable=True, unique=True)
+    # Totals kept in step with the items, priced at catalog_version; 0 means they
+    # are unpriced and the next read recomputes them from the catalog.
+    subtotal: Mapped[Money] = mapped_column(MoneyType, default=Money(), server_default="0")
+    item_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    catalog_version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
     items: Mapped[List["CartItem"]] = relationship(back_populates="cart")
 
 
@@ -69,21 +114,35 @@ class CartItem(BaseModel):
     )
     pizza_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
     quantity: Mapped[int] = mapped_column()
-    selected_extras: Mapped[dict] = mapped_column(JSON)
+    selected_extras: Mapped[list[str]] = mapped_column(JSON)
+    # Pizza plus extras, priced at the cart's catalog_version.
+    unit_price: Mapped[Money | None] = mapped_column(MoneyType, nullable=True)
     cart: Mapped[Cart] = relationship(back_populates="items")
 
 
 class Order(BaseModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset pagination order, overall and per customer identifier.
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index(
+            "ix_orders_unique_identifier_created_at_id",
+            "uniqueIdentifier",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     uniqueIdentifier: Mapped[str] = mapped_column(String(100))
     status: Mapped[str] = mapped_column(String(50))
-    subtotal: Mapped[float] = mapped_column(Numeric(12, 2))
-    extras_total: Mapped[float] = mapped_column(Numeric(12, 2))
-    grand_total: Mapped[float] = mapped_column(Numeric(12, 2))
+    subtotal: Mapped[Money] = mapped_column(MoneyType)
+    extras_total: Mapped[Money] = mapped_column(MoneyType)
+    grand_total: Mapped[Money] = mapped_column(MoneyType)
+    # Pizzas across all lines, kept on the header so order listings skip order_items.
+    item_count: Mapped[int] = mapped_column(default=0, server_default="0")
     customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("customer_info.id")
     )
@@ -101,7 +160,7 @@ class OrderItem(BaseModel):
     order: Mapped[Order] = relationship(back_populates="items")
     pizza_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
     quantity: Mapped[int] = mapped_column()
-    selected_extras: Mapped[dict] = mapped_column(JSON)
-    unit_base_price: Mapped[float] = mapped_column(Numeric(12, 2))
-    unit_extras_total: Mapped[float] = mapped_column(Numeric(12, 2))
-    line_total: Mapped[float] = mapped_column(Numeric(12, 2))
+    selected_extras: Mapped[list[str]] = mapped_column(JSON)
+    unit_base_price: Mapped[Money] = mapped_column(MoneyType)
+    unit_extras_total: Mapped[Money] = mapped_column(MoneyType)
+    line_total: Mapped[Money] = mapped_column(MoneyType)
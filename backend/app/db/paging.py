@@ -0,0 +1,78 @@
+import json
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, Result, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.pagination import TotalMode
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    *,
+    order_by: Sequence[Any] = (),
+    limit: int,
+    offset: int = 0,
+    after: ColumnElement[bool] | None = None,
+    total_mode: TotalMode = "exact",
+) -> tuple[list[Any], int | None]:
+    """One page of ``query`` and the number of rows it matches.
+
+    A select of a single entity pages entities; a select of columns pages dicts
+    keyed by column name.
+    ``after`` is a keyset condition that narrows the page but not the total. The total
+    is None with ``total_mode="none"``.
+    """
+    single = len(query.column_descriptions) == 1
+    page = query.order_by(*order_by).offset(offset).limit(limit)
+    if after is not None:
+        page = page.where(after)
+
+    if total_mode != "exact":
+        result = await session.execute(page)
+        items: list[Any] = list(result.scalars()) if single else row_dicts(result)
+        if total_mode == "none":
+            return items, None
+        # The estimate can undershoot what the page itself proves exists.
+        return items, max(await estimate_count(session, query), offset + len(items))
+
+    count: ColumnElement[int]
+    if after is None:
+        # The window is evaluated after WHERE and before LIMIT, so every row carries the full count.
+        count = func.count().over()
+    else:
+        # The keyset condition is part of WHERE, so count the query without it instead.
+        count = select(func.count()).select_from(query.subquery()).scalar_subquery()
+    result = await session.execute(page.add_columns(count.label("total")))
+    keys = tuple(result.keys())[:-1]
+    rows = result.all()
+    if rows:
+        total = rows[0].total
+        if single:
+            return [row[0] for row in rows], total
+        # zip stops at the last query column, leaving the total out.
+        return [dict(zip(keys, row)) for row in rows], total
+    if offset == 0 and after is None:
+        return [], 0
+    # Past the last row there is nothing to carry the count; ask for it separately.
+    return [], await session.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+
+def row_dicts(result: Result) -> list[dict[str, Any]]:
+    """The rows of ``result`` as plain dicts, which validate several times faster than rows."""
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+async def estimate_count(session: AsyncSession, query: Select) -> int:
+    """The planner's row estimate for ``query``, which is not run."""
+    connection = await session.connection()
+    compiled = query.compile(dialect=connection.dialect)
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
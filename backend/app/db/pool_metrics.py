@@ -0,0 +1,147 @@
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# Upper bounds, in seconds, of the checkout wait-time histogram buckets.
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative = 0
+        buckets = []
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            cumulative += count
+            buckets.append({"le": bound, "count": cumulative})
+        return {"buckets": buckets, "sum": self.sum, "count": self.count}
+
+
+class PoolMetrics:
+    """Counters and gauges for one engine's connection pool."""
+
+    def __init__(self) -> None:
+        self.pool: Pool | None = None
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait = Histogram(WAIT_TIME_BUCKETS)
+
+    def snapshot(self) -> dict[str, Any]:
+        size = checked_out = idle = overflow = max_overflow = 0
+        if self.pool is not None:
+            size = self.pool.size()  # type: ignore[attr-defined]
+            checked_out = self.pool.checkedout()  # type: ignore[attr-defined]
+            idle = self.pool.checkedin()  # type: ignore[attr-defined]
+            # overflow() counts up from -pool_size, so only positive values are overflow.
+            overflow = max(self.pool.overflow(), 0)  # type: ignore[attr-defined]
+            max_overflow = max(self.pool._max_overflow, 0)  # type: ignore[attr-defined]
+        capacity = size + max_overflow
+        return {
+            "pool_size": size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "idle": idle,
+            "overflow": overflow,
+            "saturation": round(checked_out / capacity, 4) if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "checkout_timeouts": self.checkout_timeouts,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "invalidations": self.invalidations,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+        }
+
+
+class InstrumentedPoolMixin:
+    """Times how long callers wait for a pooled connection."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.checkout_timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.checkout_wait.observe(time.perf_counter() - start)
+
+    def recreate(self):  # type: ignore[no-untyped-def]
+        # engine.dispose() swaps in a recreated pool; keep reporting into the same metrics.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool) -> PoolMetrics:
+    metrics = PoolMetrics()
+    metrics.pool = pool
+    if isinstance(pool, InstrumentedPoolMixin):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        metrics.connects += 1
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        metrics.disconnects += 1
+
+    @event.listens_for(pool, "close_detached")
+    def _on_close_detached(dbapi_connection):  # type: ignore[no-untyped-def]
+        metrics.disconnects += 1
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):  # type: ignore[no-untyped-def]
+        metrics.invalidations += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):  # type: ignore[no-untyped-def]
+        metrics.checkouts += 1
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        metrics.checkins += 1
+
+    return metrics
+
+
+_registry: dict[str, PoolMetrics] = {}
+
+
+def register_engine(name: str, engine: AsyncEngine) -> PoolMetrics:
+    metrics = instrument_pool(engine.pool)
+    _registry[name] = metrics
+    return metrics
+
+
+def get_pool_metrics() -> dict[str, PoolMetrics]:
+    return dict(_registry)
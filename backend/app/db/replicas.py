@@ -0,0 +1,88 @@
+import asyncio
+from itertools import count
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds the replica is behind the primary. An idle primary leaves the last replay
+# timestamp behind, so a replica that has replayed everything it received counts as 0.
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.session_maker = async_sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+        )
+        # Replicas are trusted until the first lag check says otherwise.
+        self.healthy = True
+        self.lag: float | None = None
+
+
+class ReplicaRouter:
+    """Hands out read-only sessions round-robin across replicas that are reachable and caught up."""
+
+    def __init__(self, engines: list[AsyncEngine], max_lag_seconds: float) -> None:
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self._counter = count()
+        self._monitor: asyncio.Task | None = None
+
+    def session(self) -> AsyncSession | None:
+        """Open a session on the next healthy replica, or None when all of them are lagging or down."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if replica.healthy:
+                return replica.session_maker()
+        return None
+
+    async def check(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    replica.lag = float(await conn.scalar(REPLICA_LAG_SQL) or 0)
+                healthy = replica.lag <= self.max_lag_seconds
+            except Exception:
+                logger.warning("replica_unreachable", host=replica.engine.url.host, exc_info=True)
+                replica.lag = None
+                healthy = False
+            if healthy != replica.healthy:
+                logger.info(
+                    "replica_health_changed",
+                    host=replica.engine.url.host,
+                    healthy=healthy,
+                    lag=replica.lag,
+                )
+            replica.healthy = healthy
+
+    async def _run_monitor(self, interval_seconds: float) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(interval_seconds)
+
+    def start_monitor(self, interval_seconds: float) -> None:
+        if self._monitor is None:
+            self._monitor = asyncio.create_task(self._run_monitor(interval_seconds))
+
+    async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
@@ -1,10 +1,13 @@
 import uuid
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.money import Money
 from app.db.models import Cart, CartItem
 
 
@@ -21,24 +24,93 @@ class CartRepo:
         return result.scalars().first()
 
     async def create(self, unique_identifier: str) -> Cart:
-        cart = Cart(uniqueIdentifier=unique_identifier)
+        cart = Cart(uniqueIdentifier=unique_identifier, items=[])
         self._session.add(cart)
         await self._session.flush()
-        await self._session.refresh(cart)
         return cart
 
-    async def find_or_create(self, unique_identifier: str) -> Cart:
-        """Find existing cart by uniqueIdentifier or create a new one."""
-        if existing_cart := await self.get_by_unique_identifier(unique_identifier):
-            return existing_cart
-        return await self.create(unique_identifier)
+    async def find_or_create(self, unique_identifier: str, catalog_version: int = 0) -> Cart:
+        """Find existing cart by uniqueIdentifier or create a new one, with its items loaded.
+
+        One statement inserts the cart if it is missing and reads it back joined to its
+        items. Creating is ON CONFLICT DO NOTHING, so concurrent first requests for an
+        identifier share one cart instead of failing on the unique constraint. A new
+        cart's zero totals hold at any version, so it is stamped with ``catalog_version``.
+        """
+        carts = Cart.__table__
+        inserted = (
+            pg_insert(Cart)
+            .values(uniqueIdentifier=unique_identifier, catalog_version=catalog_version)
+            .on_conflict_do_nothing(index_elements=[Cart.uniqueIdentifier])
+            .returning(*carts.c)
+            .cte("inserted")
+        )
+        existing = select(carts).where(
+            Cart.uniqueIdentifier == unique_identifier, ~exists(inserted.select())
+        )
+        cart_row = aliased(Cart, union_all(select(inserted), existing).subquery("cart"))
+        stmt = (
+            select(cart_row)
+            .outerjoin(CartItem, CartItem.cart_id == cart_row.id)
+            .options(contains_eager(cart_row.items))
+            .execution_options(populate_existing=True)
+        )
+        cart = (await self._session.scalars(stmt)).unique().first()
+        if cart is None:
+            # The cart was inserted by a transaction that committed after this
+            # statement's snapshot was taken; a new statement sees it.
+            cart = (
+                await self._session.scalars(
+                    select(Cart)
+                    .where(Cart.uniqueIdentifier == unique_identifier)
+                    .options(selectinload(Cart.items))
+                )
+            ).one()
+        return cart
+
+    async def lock(self, cart: Cart) -> Cart:
+        """Lock the cart's row until the transaction ends and reload it with its items.
+
+        Items are read after the lock is granted, so they include everything
+        committed by writers that held it first.
+        """
+        stmt = (
+            select(Cart)
+            .where(Cart.id == cart.id)
+            .options(selectinload(Cart.items))
+            .with_for_update(of=Cart)
+            .execution_options(populate_existing=True)
+        )
+        return (await self._session.scalars(stmt)).one()
 
     async def add_item(self, item: CartItem) -> CartItem:
         self._session.add(item)
         await self._session.flush()
-        await self._session.refresh(item)
         return item
 
+    async def add_to_totals(
+        self, cart: Cart, subtotal: Money, item_count: int, catalog_version: int
+    ) -> bool:
+        """Add a change to the cart's stored totals, if they are priced at ``catalog_version``.
+
+        The increment happens in the UPDATE itself, so concurrent changes to the cart
+        all count; removals pass negative amounts. Returns False, changing nothing,
+        when the totals are priced at another version and need recomputing instead.
+        """
+        stmt = (
+            update(Cart)
+            .where(Cart.id == cart.id, Cart.catalog_version == catalog_version)
+            .values(subtotal=Cart.subtotal + subtotal, item_count=Cart.item_count + item_count)
+            .returning(Cart.subtotal, Cart.item_count)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self._session.execute(stmt)).first()
+        if row is None:
+            return False
+        set_committed_value(cart, "subtotal", row.subtotal)
+        set_committed_value(cart, "item_count", row.item_count)
+        return True
+
     async def get_item(self, item_id: uuid.UUID) -> Optional[CartItem]:
         return await self._session.get(CartItem, item_id)
 
@@ -47,6 +119,15 @@ class CartRepo:
         await self._session.flush()
 
     async def clear(self, cart: Cart) -> None:
-        for item in cart.items:
-            await self._session.delete(item)
-        await self._session.flush()
+        """Delete the cart's items and zero its totals, in one statement."""
+        cleared = delete(CartItem).where(CartItem.cart_id == cart.id).cte("cleared")
+        await self._session.execute(
+            update(Cart)
+            .where(Cart.id == cart.id)
+            .values(subtotal=Money(), item_count=0)
+            .add_cte(cleared)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(cart, "items", [])
+        set_committed_value(cart, "subtotal", Money())
+        set_committed_value(cart, "item_count", 0)
@@ -1,7 +1,8 @@
 import uuid
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import CustomerInfo
@@ -22,28 +23,58 @@ class CustomerRepo:
     async def create(self, customer: CustomerInfo) -> CustomerInfo:
         self._session.add(customer)
         await self._session.flush()
-        await self._session.refresh(customer)
         return customer
 
     async def update(self, customer: CustomerInfo) -> CustomerInfo:
         await self._session.flush()
-        await self._session.refresh(customer)
         return customer
 
     async def find_or_create(self, unique_identifier: str, fullname: str, full_address: str) -> CustomerInfo:
-        """Find existing customer by uniqueIdentifier or create a new one."""
-        if existing_customer := await self.get_by_unique_identifier(unique_identifier):
-            # Update existing customer info if provided data is different
-            if existing_customer.fullname != fullname:
-                existing_customer.fullname = fullname
-            if existing_customer.full_address != full_address:
-                existing_customer.full_address = full_address
-            return await self.update(existing_customer)
-
-        # Create new customer
-        new_customer = CustomerInfo(
+        """Find existing customer by uniqueIdentifier or create a new one.
+
+        One statement inserts the customer, updates a stored one whose name or address
+        changed, or reads back an unchanged one without writing it. Concurrent calls for
+        the same identifier can't both insert.
+        """
+        insert_stmt = pg_insert(CustomerInfo).values(
             uniqueIdentifier=unique_identifier,
             fullname=fullname,
             full_address=full_address,
         )
-        return await self.create(new_customer)
\ No newline at end of file
+        excluded = insert_stmt.excluded
+        upserted = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[CustomerInfo.uniqueIdentifier],
+                set_={
+                    "fullname": excluded.fullname,
+                    "full_address": excluded.full_address,
+                    "updated_at": func.now(),
+                },
+                where=or_(
+                    CustomerInfo.fullname.is_distinct_from(excluded.fullname),
+                    CustomerInfo.full_address.is_distinct_from(excluded.full_address),
+                ),
+            )
+            .returning(*CustomerInfo.__table__.c)
+            .cte("upserted")
+        )
+        # A conflict that changed nothing returns no row, so read the stored one instead.
+        unchanged = select(CustomerInfo.__table__).where(
+            CustomerInfo.uniqueIdentifier == unique_identifier,
+            ~exists(upserted.select()),
+        )
+        stmt = select(CustomerInfo).from_statement(
+            union_all(select(upserted), unchanged)
+        )
+        customer = await self._session.scalar(
+            stmt, execution_options={"populate_existing": True}
+        )
+        if customer is None:
+            # The conflicting row was inserted by a transaction that committed after
+            # this statement's snapshot was taken; a new statement sees it.
+            customer = (
+                await self._session.execute(
+                    select(CustomerInfo).where(CustomerInfo.uniqueIdentifier == unique_identifier)
+                )
+            ).scalar_one()
+        return customer
@@ -1,25 +1,64 @@
 import uuid
-from typing import Sequence
+from typing import Any, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.db.catalog_snapshot import CatalogSnapshot
+from app.db.identity_cache import IdentityCache
 from app.db.models import Extra
+from app.db.paging import row_dicts
 
 
 class ExtraRepo:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity: IdentityCache | None = None,
+        catalog: CatalogSnapshot | None = None,
+    ):
         self._session = session
+        self._identity = identity or IdentityCache()
+        self._catalog = catalog
 
     async def get(self, extra_id: uuid.UUID) -> Extra | None:
-        return await self._session.get(Extra, extra_id)
+        if extra := self._identity.get(Extra, extra_id):
+            return extra
+        if self._catalog is not None and (extra := self._catalog.extras.get(extra_id)):
+            return extra
+        if extra := await self._session.get(Extra, extra_id):
+            self._identity.add(extra)
+        return extra
 
     async def get_all(self) -> Sequence[Extra]:
+        """Active extras."""
+        if self._catalog is not None:
+            return self._catalog.active_extras
         result = await self._session.execute(select(Extra).where(Extra.is_active))
-        return result.scalars().all()
+        extras = result.scalars().all()
+        self._identity.add_all(extras)
+        return extras
 
-    async def get_many(self, extra_ids: list[uuid.UUID]) -> Sequence[Extra]:
+    async def get_listing(self) -> Sequence[Extra] | list[dict[str, Any]]:
+        """Active extras for the listing: the cached rows, or just their listing columns as dicts."""
+        if self._catalog is not None:
+            return self._catalog.active_extras
         result = await self._session.execute(
-            select(Extra).where(Extra.id.in_(extra_ids))
+            select(Extra.id, Extra.name, Extra.price, Extra.is_active).where(Extra.is_active)
         )
-        return result.scalars().all()
+        return row_dicts(result)
+
+    async def get_many(self, extra_ids: list[uuid.UUID]) -> Sequence[Extra]:
+        wanted = list(dict.fromkeys(extra_ids))
+        found = self._identity.get_many(Extra, wanted)
+        if self._catalog is not None:
+            rows = self._catalog.extras
+            found.update((extra_id, rows[extra_id]) for extra_id in wanted if extra_id in rows)
+        if missing := [extra_id for extra_id in wanted if extra_id not in found]:
+            result = await self._session.execute(
+                select(Extra).where(Extra.id.in_(missing))
+            )
+            for extra in result.scalars().all():
+                self._identity.add(extra)
+                found[extra.id] = extra
+        return [found[extra_id] for extra_id in wanted if extra_id in found]
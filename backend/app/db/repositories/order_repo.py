@@ -1,11 +1,54 @@
 import uuid
-from typing import Optional, List
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Optional, List
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.models import Order
+from app.db.models import Order, OrderItem
+from app.db.paging import fetch_page, row_dicts
+from app.schemas.pagination import Cursor, TotalMode
+
+
+# What an order listing renders, plus the keyset column.
+_LISTING_COLUMNS = (
+    Order.id,
+    Order.uniqueIdentifier,
+    Order.status,
+    Order.subtotal,
+    Order.extras_total,
+    Order.grand_total,
+    Order.created_at,
+)
+# Header fields of an order summary; a single read of the orders table.
+_SUMMARY_COLUMNS = (
+    Order.id,
+    Order.uniqueIdentifier,
+    Order.status,
+    Order.item_count,
+    Order.subtotal,
+    Order.extras_total,
+    Order.grand_total,
+    Order.created_at,
+)
+_ITEM_LISTING_COLUMNS = (
+    OrderItem.order_id,
+    OrderItem.id,
+    OrderItem.pizza_id,
+    OrderItem.quantity,
+    OrderItem.selected_extras,
+    OrderItem.unit_base_price,
+    OrderItem.unit_extras_total,
+    OrderItem.line_total,
+)
+# Orders with at least this many lines send them through COPY instead of a multi-row
+# INSERT (scripts/bench_order_insert.py). Shorter orders gain little from it and stay
+# a plain statement that SQLAlchemy's events and logging see. COPY goes through the
+# driver's cursor, not SQLAlchemy's, so its rows never reach the cursor events: neither
+# the statement-count instrumentation nor the e2e tests' query-count fixture see them.
+COPY_MIN_ITEMS = 20
 
 
 class OrderRepo:
@@ -37,23 +80,165 @@ class OrderRepo:
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
-    async def create(self, order: Order) -> Order:
+    async def create(
+        self,
+        order: Order,
+        items: Sequence[Mapping[str, Any]] = (),
+        *,
+        copy_min_items: int = COPY_MIN_ITEMS,
+    ) -> Order:
+        """Insert ``order``, then its ``items`` in one batch; nothing is read back.
+
+        Items are ``order_items`` column values, ``id`` and ``order_id`` included, rather than
+        ``OrderItem`` objects, so a long order costs one dict per line; ``order.items``
+        is left unloaded. Orders of at least ``copy_min_items`` lines are written with COPY.
+        """
         self._session.add(order)
         await self._session.flush()
-        await self._session.refresh(order, attribute_names=["items", "customer"])
+        if len(items) >= copy_min_items:
+            await self._copy_items(order, items)
+        elif items:
+            # RETURNING is what makes psycopg's dialect render one multi-row VALUES per
+            # page of lines; without it each line is its own pipelined statement.
+            await self._session.execute(insert(OrderItem).returning(OrderItem.id), items)
         return order
 
-    async def get_all(
+    async def _copy_items(self, order: Order, items: Sequence[Mapping[str, Any]]) -> None:
+        connection = await self._session.connection()
+        dialect = connection.dialect
+        columns = list(OrderItem.__table__.columns)
+        # The column types' own bind conversions (Money, JSON), as a statement would apply.
+        processors = [
+            column.type.dialect_impl(dialect).bind_processor(dialect) for column in columns
+        ]
+        # COPY skips column defaults; the header's timestamps are the same
+        # transaction-start now() the INSERT path would store.
+        stamps = {"created_at": order.created_at, "updated_at": order.updated_at}
+        names = ", ".join(dialect.identifier_preparer.quote(column.name) for column in columns)
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        assert driver is not None
+        async with driver.cursor() as cursor:
+            async with cursor.copy(f"COPY {OrderItem.__tablename__} ({names}) FROM STDIN") as copy:
+                # psycopg flushes the buffer as it fills, so rows are never all encoded at once.
+                for item in items:
+                    row = []
+                    for column, process in zip(columns, processors):
+                        value = item.get(column.name, stamps.get(column.name))
+                        row.append(process(value) if process is not None else value)
+                    await copy.write_row(row)
+
+    async def get_listing(
         self,
         unique_identifier: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Order]:
-        stmt = select(Order).options(
-            selectinload(Order.items), selectinload(Order.customer)
+        keyset: bool = False,
+        after: Optional[Cursor] = None,
+        total_mode: TotalMode = "exact",
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """A page of orders as dicts and the number of orders matching the filter.
+
+        Only the columns an order listing renders are selected, and each order's
+        ``items`` are dicts too, skipping ORM hydration and the customer load.
+
+        With ``keyset`` the page is ordered by ``(created_at, id)`` and starts after
+        the ``after`` cursor instead of at ``skip``. With ``keyset`` or
+        ``total_mode="none"`` it carries one row past ``limit`` when more follow.
+        """
+        stmt = select(*_LISTING_COLUMNS)
+        if unique_identifier:
+            stmt = stmt.where(Order.uniqueIdentifier == unique_identifier)
+        orders, total = await self._fetch_page(stmt, skip, limit, keyset, after, total_mode)
+        return await self._attach_item_rows(orders), total
+
+    async def get_summaries(
+        self,
+        unique_identifier: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        keyset: bool = False,
+        after: Optional[Cursor] = None,
+        total_mode: TotalMode = "exact",
+    ) -> tuple[list[dict], Optional[int]]:
+        """A page of order headers as dicts, paged like ``get_all``.
+
+        Lines and customers aren't loaded; the item count is stored on the order.
+        """
+        stmt = select(*_SUMMARY_COLUMNS)
+        if unique_identifier:
+            stmt = stmt.where(Order.uniqueIdentifier == unique_identifier)
+        return await self._fetch_page(stmt, skip, limit, keyset, after, total_mode)
+
+    async def stream(
+        self,
+        unique_identifier: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Order]:
+        """Matching orders with their items, oldest first, read through a server-side cursor.
+
+        Rows arrive ``batch_size`` at a time. The session's identity map only holds
+        unmodified orders weakly, so each batch is freed once the caller lets go of it
+        and memory stays flat however many orders match. ``created_to`` is exclusive.
+        """
+        stmt = (
+            select(Order)
+            .options(selectinload(Order.items))
+            .order_by(Order.created_at, Order.id)
+            .execution_options(yield_per=batch_size)
         )
         if unique_identifier:
             stmt = stmt.where(Order.uniqueIdentifier == unique_identifier)
-        stmt = stmt.offset(skip).limit(limit)
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        if created_from is not None:
+            stmt = stmt.where(Order.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(Order.created_at < created_to)
+        result = await self._session.stream_scalars(stmt)
+        async for batch in result.partitions():
+            for order in batch:
+                yield order
+
+    async def _attach_item_rows(self, orders: list[dict]) -> list[dict]:
+        items: dict[uuid.UUID, list[dict]] = {order["id"]: [] for order in orders}
+        if items:
+            result = await self._session.execute(
+                select(*_ITEM_LISTING_COLUMNS).where(OrderItem.order_id.in_(list(items)))
+            )
+            for item in row_dicts(result):
+                items[item["order_id"]].append(item)
+        for order in orders:
+            order["items"] = items[order["id"]]
+        return orders
+
+    async def _fetch_page(
+        self,
+        stmt: Select,
+        skip: int,
+        limit: int,
+        keyset: bool,
+        after: Optional[Cursor],
+        total_mode: TotalMode,
+    ) -> tuple[list, Optional[int]]:
+        if keyset:
+            return await fetch_page(
+                self._session,
+                stmt,
+                order_by=(Order.created_at, Order.id),
+                limit=limit + 1,
+                after=(
+                    tuple_(Order.created_at, Order.id) > tuple(after)
+                    if after is not None
+                    else None
+                ),
+                total_mode=total_mode,
+            )
+        return await fetch_page(
+            self._session,
+            stmt,
+            order_by=(Order.created_at, Order.id),
+            limit=limit + (total_mode == "none"),
+            offset=skip,
+            total_mode=total_mode,
+        )
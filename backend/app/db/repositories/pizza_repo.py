@@ -1,43 +1,283 @@
 import uuid
-from typing import Sequence
+from collections.abc import Callable, Iterator
+from itertools import islice
+from typing import Any, Sequence, TypedDict, Unpack
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.money import Money
+from app.db.catalog_index import FUZZY_SEARCH_THRESHOLD, iter_bits
+from app.db.catalog_snapshot import CatalogSnapshot
+from app.db.identity_cache import IdentityCache
 from app.db.models import Pizza
+from app.db.paging import fetch_page
+from app.schemas.catalog import SearchMode
+from app.schemas.pagination import Cursor, TotalMode
+
+
+# What a pizza listing renders, plus the keyset column.
+_LISTING_COLUMNS = (
+    Pizza.id,
+    Pizza.name,
+    Pizza.base_price,
+    Pizza.image_url,
+    Pizza.is_active,
+    Pizza.ingredients,
+    Pizza.created_at,
+)
+
+
+class PizzaFilters(TypedDict, total=False):
+    """Filters and paging for ``PizzaRepo.get_all`` and ``get_listing``.
+
+    ``ingredients`` must all be present, at least one of ``any_ingredients`` and
+    none of ``exclude_ingredients``. A fuzzy ``search`` orders by relevance.
+
+    With ``keyset`` the page is ordered by ``(created_at, id)`` and starts after
+    the ``after`` cursor instead of at ``page``. ``total`` always counts every
+    match, in the page query itself.
+
+    With ``keyset`` or ``total_mode="none"`` the page carries one row past
+    ``page_size`` when more follow.
+    """
+
+    search: str | None
+    search_mode: SearchMode
+    ingredients: list[str] | None
+    any_ingredients: list[str] | None
+    exclude_ingredients: list[str] | None
+    min_price: float | None
+    max_price: float | None
+    page: int
+    page_size: int
+    keyset: bool
+    after: Cursor | None
+    total_mode: TotalMode
 
 
 class PizzaRepo:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity: IdentityCache | None = None,
+        catalog: CatalogSnapshot | None = None,
+    ):
         self._session = session
+        self._identity = identity or IdentityCache()
+        self._catalog = catalog
 
     async def get(self, pizza_id: uuid.UUID) -> Pizza | None:
-        return await self._session.get(Pizza, pizza_id)
+        if pizza := self._identity.get(Pizza, pizza_id):
+            return pizza
+        if self._catalog is not None and (pizza := self._catalog.pizzas.get(pizza_id)):
+            return pizza
+        if pizza := await self._session.get(Pizza, pizza_id):
+            self._identity.add(pizza)
+        return pizza
+
+    async def get_many(self, pizza_ids: list[uuid.UUID]) -> Sequence[Pizza]:
+        wanted = list(dict.fromkeys(pizza_ids))
+        found = self._identity.get_many(Pizza, wanted)
+        if self._catalog is not None:
+            rows = self._catalog.pizzas
+            found.update((pizza_id, rows[pizza_id]) for pizza_id in wanted if pizza_id in rows)
+        if missing := [pizza_id for pizza_id in wanted if pizza_id not in found]:
+            result = await self._session.execute(
+                select(Pizza).where(Pizza.id.in_(missing))
+            )
+            for pizza in result.scalars().all():
+                self._identity.add(pizza)
+                found[pizza.id] = pizza
+        return [found[pizza_id] for pizza_id in wanted if pizza_id in found]
+
+    async def get_all(self, **filters: Unpack[PizzaFilters]) -> tuple[Sequence[Pizza], int | None]:
+        """Active pizzas matching ``filters``, as ORM rows."""
+        pizzas, total = await self._get_page(select(Pizza), **filters)
+        if self._catalog is None:
+            self._identity.add_all(pizzas)
+        return pizzas, total
 
-    async def get_all(
+    async def get_listing(
+        self, **filters: Unpack[PizzaFilters]
+    ) -> tuple[Sequence[Pizza] | list[dict[str, Any]], int | None]:
+        """Active pizzas for a listing page, filtered and paged like ``get_all``.
+
+        The cached rows when the catalog is cached; otherwise only the listing
+        columns are selected and returned as dicts, skipping ORM hydration.
+        """
+        return await self._get_page(select(*_LISTING_COLUMNS), **filters)
+
+    async def _get_page(
         self,
+        query: Select,
+        *,
         search: str | None = None,
+        search_mode: SearchMode = "contains",
         ingredients: list[str] | None = None,
+        any_ingredients: list[str] | None = None,
+        exclude_ingredients: list[str] | None = None,
         min_price: float | None = None,
         max_price: float | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[Sequence[Pizza], int]:
-        query = select(Pizza).where(Pizza.is_active)
-        if search:
+        keyset: bool = False,
+        after: Cursor | None = None,
+        total_mode: TotalMode = "exact",
+    ) -> tuple[Sequence[Any], int | None]:
+        """The cached catalog's page, or ``query`` narrowed to active matches and paged."""
+        if self._catalog is not None:
+            return self._get_all_cached(
+                self._catalog,
+                search=search,
+                search_mode=search_mode,
+                ingredients=ingredients,
+                any_ingredients=any_ingredients,
+                exclude_ingredients=exclude_ingredients,
+                min_price=min_price,
+                max_price=max_price,
+                page=page,
+                page_size=page_size,
+                keyset=keyset,
+                after=after,
+                total_mode=total_mode,
+            )
+        query = query.where(Pizza.is_active)
+        relevance = None
+        if search and search_mode == "fuzzy":
+            # name %> term is word_similarity(term, name) >= threshold, served by the trigram index.
+            await self._session.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.word_similarity_threshold",
+                        str(FUZZY_SEARCH_THRESHOLD),
+                        True,
+                    )
+                )
+            )
+            query = query.where(Pizza.name.op("%>", is_comparison=True)(search))
+            relevance = func.word_similarity(search, Pizza.name)
+        elif search:
             query = query.where(Pizza.name.ilike(f"%{search}%"))
         if ingredients:
             query = query.where(Pizza.ingredients.op("@>")(ingredients))
+        if any_ingredients:
+            query = query.where(
+                Pizza.ingredients.op("&&", is_comparison=True)(any_ingredients)
+            )
+        if exclude_ingredients:
+            query = query.where(
+                ~Pizza.ingredients.op("&&", is_comparison=True)(exclude_ingredients)
+            )
         if min_price:
             query = query.where(Pizza.base_price >= min_price)
         if max_price:
             query = query.where(Pizza.base_price <= max_price)
 
-        total_query = select(func.count()).select_from(query.subquery())
-        total = await self._session.scalar(total_query) or 0
+        if keyset:
+            pizzas, total = await fetch_page(
+                self._session,
+                query,
+                order_by=(Pizza.created_at, Pizza.id),
+                limit=page_size + 1,
+                after=(
+                    tuple_(Pizza.created_at, Pizza.id) > tuple(after)
+                    if after is not None
+                    else None
+                ),
+                total_mode=total_mode,
+            )
+        else:
+            pizzas, total = await fetch_page(
+                self._session,
+                query,
+                order_by=(
+                    (relevance.desc(), Pizza.name)
+                    if relevance is not None
+                    else (Pizza.name, Pizza.id)
+                ),
+                limit=page_size + (total_mode == "none"),
+                offset=(page - 1) * page_size,
+                total_mode=total_mode,
+            )
+        return pizzas, total
+
+
+    def _get_all_cached(
+        self,
+        catalog: CatalogSnapshot,
+        *,
+        search: str | None,
+        search_mode: SearchMode,
+        ingredients: list[str] | None,
+        any_ingredients: list[str] | None,
+        exclude_ingredients: list[str] | None,
+        min_price: float | None,
+        max_price: float | None,
+        page: int,
+        page_size: int,
+        keyset: bool,
+        after: Cursor | None,
+        total_mode: TotalMode,
+    ) -> tuple[Sequence[Pizza], int | None]:
+        index = catalog.pizza_index
+        mask = index.match(ingredients, any_ingredients, exclude_ingredients)
+        # A cursor alone says where the page starts, so keyset pages ignore ``page``.
+        start = 0 if keyset else (page - 1) * page_size
+        stop = start + page_size + (keyset or total_mode == "none")
+        # The term to rank by relevance; a plain search filters by substring instead.
+        fuzzy_term = search if search and search_mode == "fuzzy" else None
+        matches = _matcher(None if fuzzy_term else search, min_price, max_price)
+        # Counting in memory is cheap, so an estimated total is an exact one.
+        counted = total_mode != "none"
+        positions: Iterator[int] | None
+
+        if keyset:
+            positions = catalog.pizza_keyset.after(after)
+            if mask != index.all:
+                allowed = set(iter_bits(mask))
+                positions = (p for p in positions if p in allowed)
+            candidates = (index.pizzas[position] for position in positions)
+            if matches is None:
+                total = mask.bit_count() if counted else None
+                return list(islice(candidates, stop)), total
+            page_rows = list(islice(filter(matches, candidates), stop))
+            if not counted:
+                return page_rows, None
+            return page_rows, sum(1 for pizza in index.select(mask) if matches(pizza))
+
+        if fuzzy_term is None and matches is None:
+            # Ingredient filters alone: count the bits and only materialize the page.
+            return index.select(mask, start, stop), mask.bit_count() if counted else None
+
+        if fuzzy_term is not None:
+            positions = None if mask == index.all else iter_bits(mask)
+            pizzas = catalog.pizza_name_index.search(fuzzy_term, positions)
+        else:
+            pizzas = index.select(mask)
+        if matches is not None:
+            pizzas = [pizza for pizza in pizzas if matches(pizza)]
+        return pizzas[start:stop], len(pizzas) if counted else None
+
+
+def _matcher(
+    search: str | None, min_price: float | None, max_price: float | None
+) -> Callable[[Pizza], bool] | None:
+    """Predicate for the substring search and price bounds, or None without any."""
+    if not (search or min_price or max_price):
+        return None
+    term = search.lower() if search else None
+    floor = Money.of(min_price) if min_price else None
+    ceiling = Money.of(max_price) if max_price else None
+
+    def matches(pizza: Pizza) -> bool:
+        if term is not None and term not in pizza.name.lower():
+            return False
+        price = Money.of(pizza.base_price)
+        if floor is not None and price < floor:
+            return False
+        return ceiling is None or price <= ceiling
 
-        query = query.limit(page_size).offset((page - 1) * page_size)
-        result = await self._session.execute(query)
-        return result.scalars().all(), total
+    return matches
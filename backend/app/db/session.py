@@ -1,14 +1,111 @@
+from collections.abc import Callable
 from typing import AsyncGenerator
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import Settings, get_settings
+from app.db.pool_metrics import InstrumentedAsyncAdaptedQueuePool, register_engine
+from app.db.replicas import ReplicaRouter
+
+# One engine (and therefore one connection pool) per worker process.
+_engine: AsyncEngine | None = None
+_session_maker: async_sessionmaker | None = None
+_read_only_session_maker: async_sessionmaker | None = None
+_replicas: ReplicaRouter | None = None
+
+
+def create_engine(settings: Settings, url: str | None = None) -> AsyncEngine:
+    return create_async_engine(
+        url or settings.db_url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+def init_engine(settings: Settings | None = None) -> AsyncEngine:
+    """Create the process-wide engines and session makers if they don't exist yet."""
+    global _engine, _session_maker, _read_only_session_maker, _replicas
+    if _engine is None:
+        settings = settings or get_settings()
+        _engine = create_engine(settings)
+        register_engine("primary", _engine)
+        _session_maker = async_sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=_engine
+        )
+        # Same pool, but transactions start as BEGIN READ ONLY.
+        _read_only_session_maker = async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=_engine.execution_options(postgresql_readonly=True),
+        )
+        if settings.DB_REPLICA_URLS:
+            replica_engines = [
+                create_engine(settings, url) for url in settings.DB_REPLICA_URLS
+            ]
+            for index, replica_engine in enumerate(replica_engines):
+                register_engine(f"replica-{index}", replica_engine)
+            _replicas = ReplicaRouter(
+                replica_engines, settings.DB_REPLICA_MAX_LAG_SECONDS
+            )
+    return _engine
+
+
+def start_replica_monitor(settings: Settings | None = None) -> None:
+    """Poll replica lag in the background so lagging replicas drop out of rotation."""
+    if _replicas is not None:
+        settings = settings or get_settings()
+        _replicas.start_monitor(settings.DB_REPLICA_CHECK_INTERVAL_SECONDS)
+
+
+async def dispose_engine() -> None:
+    """Close every pooled connection and forget the engines."""
+    global _engine, _session_maker, _read_only_session_maker, _replicas
+    if _replicas is not None:
+        await _replicas.close()
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_maker = None
+    _read_only_session_maker = None
+    _replicas = None
+
+
+def get_engine() -> AsyncEngine:
+    return init_engine()
 
 
 def get_session_maker() -> async_sessionmaker:
-    engine = create_async_engine(get_settings().db_url)
-    return async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    init_engine()
+    assert _session_maker is not None
+    return _session_maker
+
+
+def get_read_session() -> AsyncSession:
+    """Session on a healthy replica, or a read-only session on the primary when none is usable."""
+    if _replicas is not None and (replica_session := _replicas.session()) is not None:
+        return replica_session
+    init_engine()
+    assert _read_only_session_maker is not None
+    return _read_only_session_maker()
+
+
+def get_session_factory() -> Callable[[], AsyncSession]:
+    return get_session_maker()
+
+
+def get_read_session_factory() -> Callable[[], AsyncSession]:
+    return get_read_session
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
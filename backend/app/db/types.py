@@ -0,0 +1,28 @@
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Dialect, Numeric
+from sqlalchemy.types import TypeDecorator
+
+from app.core.money import Money
+
+
+class MoneyType(TypeDecorator[Money]):
+    """``NUMERIC(12, 2)`` column that loads as :class:`Money`.
+
+    Binds accept anything ``Money.of`` does, so filters can still compare against
+    plain numbers.
+    """
+
+    impl = Numeric(12, 2)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Decimal | None:
+        if value is None:
+            return None
+        return Money.of(value).to_decimal()
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Money | None:
+        if value is None:
+            return None
+        return Money.of(value)
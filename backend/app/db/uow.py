@@ -1,56 +1,158 @@
-from collections.abc import AsyncGenerator
-from typing import Annotated
+from collections.abc import AsyncGenerator, Callable
+from typing import Annotated, Any, TypeVar
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
+from app.db.catalog_snapshot import CatalogSnapshot
+from app.db.identity_cache import IdentityCache
 from app.db.repositories.cart_repo import CartRepo
 from app.db.repositories.customer_repo import CustomerRepo
 from app.db.repositories.extra_repo import ExtraRepo
 from app.db.repositories.order_repo import OrderRepo
 from app.db.repositories.pizza_repo import PizzaRepo
-from app.db.session import get_db_session
+
+RepoT = TypeVar("RepoT")
 
 
 class UnitOfWork:
-    def __init__(self, session: AsyncSession) -> None:
-        self._session = session
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        read_session_factory: Callable[[], AsyncSession] | None = None,
+        catalog: CatalogSnapshot | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._read_session_factory = read_session_factory
+        # Sessions are opened on first use, so blocks that never query cost nothing.
+        self._session: AsyncSession | None = None
+        self._read_session: AsyncSession | None = None
+        self._read_only_requested = False
+        # Mode of the outermost block; nested blocks run in the same mode.
+        self._read_only = False
+        # One (savepoint, roll back on error) entry per nested block.
+        self._nested: list[tuple[AsyncSessionTransaction | None, bool]] = []
+        self._depth = 0
+        # Repositories are built once per session; catalog rows are shared for the whole request.
+        self._repos: dict[AsyncSession, dict[type, Any]] = {}
+        self.identity = IdentityCache()
+        # Pinned for the unit of work's lifetime, so a refresh mid-request can't mix versions.
+        self.catalog = catalog
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._read_only and self._read_session_factory is not None:
+            if self._read_session is None:
+                self._read_session = self._read_session_factory()
+            return self._read_session
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def _repo(self, repo_cls: type[RepoT], *args: Any) -> RepoT:
+        session = self.session
+        repos = self._repos.setdefault(session, {})
+        if repo_cls not in repos:
+            repos[repo_cls] = repo_cls(session, *args)  # type: ignore[call-arg]
+        return repos[repo_cls]
 
     @property
     def pizzas(self) -> PizzaRepo:
-        return PizzaRepo(self._session)
+        return self._repo(PizzaRepo, self.identity, self.catalog)
 
     @property
     def extras(self) -> ExtraRepo:
-        return ExtraRepo(self._session)
+        return self._repo(ExtraRepo, self.identity, self.catalog)
 
     @property
     def customers(self) -> CustomerRepo:
-        return CustomerRepo(self._session)
+        return self._repo(CustomerRepo)
 
     @property
     def carts(self) -> CartRepo:
-        return CartRepo(self._session)
+        return self._repo(CartRepo)
 
     @property
     def orders(self) -> OrderRepo:
-        return OrderRepo(self._session)
+        return self._repo(OrderRepo)
+
+    def read_only(self) -> "UnitOfWork":
+        """Mark the next ``async with`` block as read-only.
+
+        The block runs in a READ ONLY transaction on a replica or the primary and
+        ends without a commit. Nested inside a write block it simply reads through
+        the write transaction; a write block can't be nested inside it.
+        """
+        self._read_only_requested = True
+        return self
 
     async def __aenter__(self) -> "UnitOfWork":
+        read_only, self._read_only_requested = self._read_only_requested, False
+        if self._depth and self._read_only and not read_only:
+            raise RuntimeError("write unit of work nested inside read_only()")
+        self._depth += 1
+        if self._depth == 1:
+            self._read_only = read_only
+        elif read_only or self._read_only:
+            self._nested.append((None, False))
+        elif self._session is not None:
+            # Nested writes get a savepoint so a failure only undoes their own work;
+            # the outermost block still commits once for everything.
+            self._nested.append((await self._session.begin_nested(), True))
+        else:
+            # Nothing has run yet, so undoing this block means undoing the whole transaction.
+            self._nested.append((None, True))
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:  # type: ignore
+        self._depth -= 1
+        if self._depth > 0:
+            savepoint, owns_rollback = self._nested.pop()
+            if savepoint is not None and savepoint.is_active:
+                if exc_type is not None:
+                    await savepoint.rollback()
+                else:
+                    await savepoint.commit()
+            elif owns_rollback and exc_type is not None:
+                await self.rollback()
+            return
+
+        read_only, self._read_only = self._read_only, False
+        if read_only and self._read_session_factory is not None:
+            if self._read_session is not None:
+                # Nothing can have been written, so closing (and rolling back) is all there is to do.
+                read_session, self._read_session = self._read_session, None
+                self._repos.pop(read_session, None)
+                await read_session.close()
+            return
+        if self._session is None:
+            return
         if exc_type is not None:
             await self.rollback()
         else:
             await self.commit()
-        await self._session.close()
+        session, self._session = self._session, None
+        self._repos.pop(session, None)
+        await session.close()
+
+    async def close(self) -> None:
+        """Roll back and close whatever sessions are still open, e.g. at the end of a request."""
+        self._depth = 0
+        self._nested.clear()
+        self._read_only = self._read_only_requested = False
+        for session in (self._read_session, self._session):
+            if session is not None:
+                self._repos.pop(session, None)
+                await session.close()
+        self._session = self._read_session = None
 
     async def commit(self) -> None:
-        await self._session.commit()
+        if self._session is not None:
+            await self._session.commit()
 
     async def rollback(self) -> None:
-        await self._session.rollback()
+        if self._session is not None:
+            await self._session.rollback()
 
 
 UOWDep = Annotated[UnitOfWork, Depends()]
\ No newline at end of file
@@ -2,6 +2,8 @@ import uuid
 from typing import List
 
 from pydantic import BaseModel, Field, field_validator, AliasChoices
+
+from app.core.money import Money
 from app.schemas.customer import CustomerInfoIn
 
 
@@ -30,8 +32,8 @@ class CartItemOut(BaseModel):
     pizza_id: uuid.UUID
     quantity: int
     extras: List[uuid.UUID]
-    unit_price: float
-    total_price: float
+    unit_price: Money
+    total_price: Money
 
     class Config:
         from_attributes = True
@@ -43,8 +45,10 @@ class CartOut(BaseModel):
         validation_alias=AliasChoices("uniqueIdentifier", "unique_identifier"),
     )
     items: List[CartItemOut]
-    subtotal: float
-    grand_total: float
+    subtotal: Money
+    grand_total: Money
+    # Pizzas across all items.
+    item_count: int
 
     class Config:
         from_attributes = True
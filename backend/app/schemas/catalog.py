@@ -1,12 +1,19 @@
 import uuid
+from typing import Literal
 
 from pydantic import BaseModel
 
+from app.core.money import Money
+
+# "contains" is a case-insensitive substring match; "fuzzy" tolerates typos and
+# orders results by relevance.
+SearchMode = Literal["contains", "fuzzy"]
+
 
 class Pizza(BaseModel):
     id: uuid.UUID
     name: str
-    base_price: float
+    base_price: Money
     image_url: str | None
     is_active: bool
     ingredients: list[str]
@@ -17,7 +24,7 @@ class Pizza(BaseModel):
 
 class PizzaCreate(BaseModel):
     name: str
-    base_price: float
+    base_price: Money
     image_url: str | None
     is_active: bool
     ingredients: list[str]
@@ -26,7 +33,7 @@ class PizzaCreate(BaseModel):
 class PizzaOut(BaseModel):
     id: uuid.UUID
     name: str
-    base_price: float
+    base_price: Money
     image_url: str | None
     is_active: bool
     ingredients: list[str]
@@ -38,7 +45,7 @@ class PizzaOut(BaseModel):
 class ExtraOut(BaseModel):
     id: uuid.UUID
     name: str
-    price: float
+    price: Money
     is_active: bool
 
     class Config:
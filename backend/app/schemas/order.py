@@ -1,8 +1,10 @@
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, AliasChoices
 
+from app.core.money import Money
 from app.schemas.customer import CustomerInfoIn
 
 
@@ -32,9 +34,9 @@ class OrderLineOut(BaseModel):
     extras: List[uuid.UUID] =  Field(
         validation_alias=AliasChoices("extras", "selected_extras"),
     )
-    unit_base_price: float
-    unit_extras_total: float
-    line_total: float
+    unit_base_price: Money
+    unit_extras_total: Money
+    line_total: Money
 
     class Config:
         from_attributes = True
@@ -46,9 +48,9 @@ class QuoteOrderLineOut(BaseModel):
     extras: List[uuid.UUID] =  Field(
         validation_alias=AliasChoices("extras", "selected_extras"),
     )
-    unit_base_price: float
-    unit_extras_total: float
-    line_total: float
+    unit_base_price: Money
+    unit_extras_total: Money
+    line_total: Money
 
     class Config:
         from_attributes = True
@@ -60,9 +62,9 @@ class OrderOut(BaseModel):
         validation_alias=AliasChoices("uniqueIdentifier", "unique_identifier"),
     )
     status: str
-    subtotal: float
-    extras_total: float
-    grand_total: float
+    subtotal: Money
+    extras_total: Money
+    grand_total: Money
     lines: List[OrderLineOut] = Field(validation_alias="items")
 
     class Config:
@@ -70,10 +72,34 @@ class OrderOut(BaseModel):
         populate_by_name = True
 
 
+# "full" renders every order with its lines; "summary" only the header fields.
+OrderView = Literal["full", "summary"]
+
+# Order export encodings: one OrderOut per line, or one CSV row per order line.
+ExportFormat = Literal["ndjson", "csv"]
+
+
+class OrderSummaryOut(BaseModel):
+    id: uuid.UUID
+    unique_identifier: str = Field(
+        validation_alias=AliasChoices("uniqueIdentifier", "unique_identifier"),
+    )
+    status: str
+    item_count: int
+    subtotal: Money
+    extras_total: Money
+    grand_total: Money
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
 class QuoteOut(BaseModel):
-    subtotal: float
-    extras_total: float
-    grand_total: float
+    subtotal: Money
+    extras_total: Money
+    grand_total: Money
     lines: List[QuoteOrderLineOut]
 
     class Config:
@@ -1,21 +1,68 @@
-from typing import Generic, TypeVar, List
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Literal, Mapping, NamedTuple, Sequence, TypeVar
 from pydantic import BaseModel, Field
 from math import ceil
 
+from app.core.exceptions import ValidationAppError
+
 T = TypeVar("T")
 
+# How a page reports its total: "exact" counts every match in the page query,
+# "estimate" takes the planner's row estimate and "none" skips counting.
+TotalMode = Literal["exact", "estimate", "none"]
+
 # ---------- Response models ----------
 class PageMeta(BaseModel):
     page: int
     per_page: int
-    total: int
-    pages: int
+    total: int | None
+    pages: int | None
     has_next: bool
     has_prev: bool
 
+class CursorPageMeta(BaseModel):
+    per_page: int
+    total: int | None
+    has_next: bool
+    next_cursor: str | None = None
+
 class Page(BaseModel, Generic[T]):
     items: List[T]
-    meta: PageMeta
+    meta: PageMeta | CursorPageMeta
+
+# ---------- Keyset cursors ----------
+class Cursor(NamedTuple):
+    """Position after the last row of a page, in (created_at, id) order."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+    @classmethod
+    def after(cls, row) -> "Cursor":
+        if isinstance(row, Mapping):
+            return cls(row["created_at"], row["id"])
+        return cls(row.created_at, row.id)
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor | None":
+        """Parse a token from a previous page; an empty token means the first page."""
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            created_at, _, row_id = raw.partition("|")
+            return cls(datetime.fromisoformat(created_at), uuid.UUID(row_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationAppError(
+                "Invalid cursor", {"cursor": "Pass back the next_cursor of a previous page"}
+            )
 
 # ---------- Query params helper ----------
 class PaginationParams(BaseModel):
@@ -26,7 +73,17 @@ class PaginationParams(BaseModel):
     def offset(self) -> int:
         return (self.page - 1) * self.per_page
 
-    def build_meta(self, total: int) -> PageMeta:
+    def build_meta(self, total: int | None, has_next: bool | None = None) -> PageMeta:
+        """Meta for an offset page; without a ``total``, ``has_next`` comes from a lookahead row."""
+        if total is None:
+            return PageMeta(
+                page=self.page,
+                per_page=self.per_page,
+                total=None,
+                pages=None,
+                has_next=bool(has_next),
+                has_prev=self.page > 1,
+            )
         pages = max(1, ceil(total / self.per_page)) if total else 1
         return PageMeta(
             page=self.page,
@@ -35,4 +92,39 @@ class PaginationParams(BaseModel):
             pages=pages,
             has_next=self.page < pages,
             has_prev=self.page > 1,
-        )
\ No newline at end of file
+        )
+
+    def build_cursor_meta(self, total: int | None, last: object | None) -> CursorPageMeta:
+        """Meta for a keyset page; ``last`` is its final row when more rows follow."""
+        return CursorPageMeta(
+            per_page=self.per_page,
+            total=total,
+            has_next=last is not None,
+            next_cursor=Cursor.after(last).encode() if last is not None else None,
+        )
+
+    def build_page(
+        self,
+        rows: Sequence[Any],
+        total: int | None,
+        to_item: Callable[[Any], T],
+        *,
+        keyset: bool = False,
+        lookahead: bool = False,
+    ) -> "Page[T]":
+        """A page of ``rows`` mapped through ``to_item``, with its meta.
+
+        Keyset pages, and pages fetched with ``lookahead``, may hold one row past
+        ``per_page``; it is dropped and only tells whether more rows follow.
+        """
+        has_next = None
+        if keyset or lookahead:
+            has_next = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+        items = [to_item(row) for row in rows]
+        if keyset:
+            return Page(
+                items=items,
+                meta=self.build_cursor_meta(total, rows[-1] if has_next else None),
+            )
+        return Page(items=items, meta=self.build_meta(total, has_next))
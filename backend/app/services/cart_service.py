@@ -1,9 +1,10 @@
 import uuid
 from typing import Optional
 
-from decimal import Decimal
-from app.core.exceptions import InvalidIdentityAppError, NotFoundAppError
-from app.db.models import Cart, CartItem
+from app.core.exceptions import InvalidIdentityAppError, NotFoundAppError, not_found_message
+from app.core.money import Money
+from app.core.price_rules import PriceCalculator
+from app.db.models import Cart, CartItem, Extra, Pizza
 from app.db.repositories.cart_repo import CartRepo
 from app.db.repositories.extra_repo import ExtraRepo
 from app.db.repositories.pizza_repo import PizzaRepo
@@ -25,43 +26,133 @@ class CartService:
         self._uow = uow
         self._order_service = order_service
 
+    def _catalog_version(self) -> int:
+        # Stored cart prices are only trusted against the request's pinned catalog
+        # snapshot. Without one, or without the version triggers (version 0), carts
+        # are priced from the catalog on every read.
+        catalog = self._uow.catalog
+        return catalog.version if catalog is not None else 0
+
     async def _get_cart(self, unique_identifier: str) -> Cart:
-        return await self._uow.carts.find_or_create(unique_identifier)
+        return await self._uow.carts.find_or_create(unique_identifier, self._catalog_version())
+
+    async def _cart_totals(self, cart: Cart, store: bool = True) -> CartOut:
+        """The cart as stored while its prices are current, otherwise repriced (and stored)."""
+        catalog_version = self._catalog_version()
+        if catalog_version and cart.catalog_version == catalog_version:
+            stored = self._stored_cart_totals(cart)
+            if stored is not None:
+                return stored
+        if cart.catalog_version > catalog_version:
+            # Stored by a worker that has already loaded a newer catalog; price from this
+            # snapshot without rolling the stored totals back to it.
+            return await self._calculate_cart_totals(cart)
+        return await self._calculate_cart_totals(cart, catalog_version if store else 0)
 
-    async def _calculate_cart_totals(self, cart: Cart) -> CartOut:
+    def _stored_cart_totals(self, cart: Cart) -> Optional[CartOut]:
+        """The cart from its stored prices, or None if an item has not been priced."""
         items_out = []
-        subtotal = Decimal(0)
-
         for item in cart.items:
-            pizza = await self._uow.pizzas.get(item.pizza_id)
-            if not pizza:
-                raise NotFoundAppError(f"Pizza with id {item.pizza_id} not found")
+            if item.unit_price is None:
+                return None
+            items_out.append(
+                CartItemOut(
+                    id=item.id,
+                    pizza_id=item.pizza_id,
+                    quantity=item.quantity,
+                    extras=[uuid.UUID(eid) for eid in item.selected_extras],
+                    unit_price=item.unit_price,
+                    total_price=item.unit_price * item.quantity,
+                )
+            )
+        return CartOut(
+            id=cart.id,
+            unique_identifier=cart.uniqueIdentifier,
+            items=items_out,
+            subtotal=cart.subtotal,
+            grand_total=cart.subtotal,
+            item_count=cart.item_count,
+        )
+
+    async def _calculate_cart_totals(self, cart: Cart, catalog_version: int = 0) -> CartOut:
+        """Price every item from the catalog.
+
+        With a ``catalog_version`` the prices are also stored on the cart, to be served
+        from there until the catalog changes.
+        """
+        if catalog_version:
+            # Reprice the items as committed, and hold off concurrent changes to the
+            # totals until the new ones are written.
+            cart = await self._uow.carts.lock(cart)
+            if cart.catalog_version > catalog_version:
+                # A worker on a newer catalog stored the totals since the cart was read,
+                # from items as committed. Leave repricing them to it, and don't trust
+                # them to cover this transaction's changes either.
+                cart.catalog_version = 0
+                catalog_version = 0
+        items_out = []
+        subtotal = Money()
+        item_count = 0
 
-            extras = await self._uow.extras.get_many(
-                [uuid.UUID(str(eid)) for eid in item.selected_extras]
+        # Price the whole cart from one batched load per catalog table.
+        item_extra_ids = {
+            item.id: list(dict.fromkeys(uuid.UUID(str(eid)) for eid in item.selected_extras))
+            for item in cart.items
+        }
+        pizzas: dict[uuid.UUID, Pizza] = {}
+        extras_by_id: dict[uuid.UUID, Extra] = {}
+        if cart.items:
+            pizza_ids = list(dict.fromkeys(item.pizza_id for item in cart.items))
+            extra_ids = list(
+                dict.fromkeys(eid for ids in item_extra_ids.values() for eid in ids)
             )
-            unit_extras_total = sum(Decimal(str(extra.price)) for extra in extras)
-            unit_price = Decimal(str(pizza.base_price)) + unit_extras_total
+            pizzas = {p.id: p for p in await self._uow.pizzas.get_many(pizza_ids)}
+            extras_by_id = {
+                e.id: e for e in await self._uow.extras.get_many(extra_ids)
+            }
+            if missing := [pid for pid in pizza_ids if pid not in pizzas]:
+                raise NotFoundAppError(not_found_message("Pizza", missing))
+
+        for item in cart.items:
+            pizza = pizzas[item.pizza_id]
+            extras = [
+                extras_by_id[eid] for eid in item_extra_ids[item.id] if eid in extras_by_id
+            ]
+            unit_price = PriceCalculator.calculate_unit_price(pizza, extras)
             total_price = unit_price * item.quantity
 
+            if catalog_version:
+                # Stored items carry what was priced, extras gone from the catalog included.
+                selected_extras = [str(extra.id) for extra in extras]
+                if item.selected_extras != selected_extras:
+                    item.selected_extras = selected_extras
+                item.unit_price = unit_price
+
             items_out.append(
                 CartItemOut(
                     id=item.id,
                     pizza_id=item.pizza_id,
                     quantity=item.quantity,
                     extras=[extra.id for extra in extras],
-                    unit_price=float(unit_price),
-                    total_price=float(total_price),
+                    unit_price=unit_price,
+                    total_price=total_price,
                 )
             )
             subtotal += total_price
+            item_count += item.quantity
+
+        if catalog_version:
+            cart.subtotal = subtotal
+            cart.item_count = item_count
+            cart.catalog_version = catalog_version
 
         return CartOut(
             id=cart.id,
             unique_identifier=cart.uniqueIdentifier,
             items=items_out,
-            subtotal=float(subtotal),
-            grand_total=float(subtotal),  # Assuming no additional charges for now
+            subtotal=subtotal,
+            grand_total=subtotal,  # Assuming no additional charges for now
+            item_count=item_count,
         )
 
     async def add_to_cart(
@@ -76,41 +167,58 @@ class CartService:
             if not pizza:
                 raise NotFoundAppError(f"Pizza with id {item_in.pizza_id} not found")
 
-            extras = [
-                await self._uow.extras.get(extra_id) for extra_id in item_in.extras
-            ]
-            if any(e is None for e in extras):
+            extras = await self._uow.extras.get_many(item_in.extras)
+            if len(extras) != len(set(item_in.extras)):
                 raise NotFoundAppError("One or more extras not found")
 
+            unit_price = PriceCalculator.calculate_unit_price(pizza, extras)
             cart_item = CartItem(
                 cart_id=cart.id,
                 pizza_id=item_in.pizza_id,
                 quantity=item_in.quantity,
                 selected_extras=[str(extra.id) for extra in extras if extra],
+                unit_price=unit_price,
             )
+            # The cart came back with its items loaded; extend them rather than reload the cart.
+            cart.items.append(cart_item)
             await self._uow.carts.add_item(cart_item)
-            cart = await self._get_cart(unique_identifier)
-            return await self._calculate_cart_totals(cart)
+
+            catalog_version = self._catalog_version()
+            if catalog_version and cart.catalog_version == catalog_version:
+                if await self._uow.carts.add_to_totals(
+                    cart, unit_price * item_in.quantity, item_in.quantity, catalog_version
+                ):
+                    stored = self._stored_cart_totals(cart)
+                    if stored is not None:
+                        return stored
+            elif not catalog_version or cart.catalog_version > catalog_version:
+                # The stored totals no longer cover the items, and this worker can't price
+                # them at their version; keep later reads from trusting them.
+                cart.catalog_version = 0
+                return await self._calculate_cart_totals(cart)
+            return await self._calculate_cart_totals(cart, catalog_version)
 
     async def get_cart_details(self, unique_identifier: str) -> CartOut:
         async with self._uow:
             cart = await self._get_cart(unique_identifier)
-            return await self._calculate_cart_totals(cart)
+            return await self._cart_totals(cart)
 
     async def checkout(self, customer_in: CustomerInfoIn) -> OrderOut:
-        cart = await self.get_cart_details(customer_in.unique_identifier)
-        if not cart.items:
-            raise NotFoundAppError("Cannot checkout with an empty cart")
-
-        order_lines = [
-            OrderLineIn(
-                pizza_id=item.pizza_id,
-                quantity=item.quantity,
-                extras=item.extras,
-            )
-            for item in cart.items
-        ]
-        order_in = OrderIn(lines=order_lines, customer=customer_in)
-        cart_to_clear = await self._get_cart(customer_in.unique_identifier)
-        order = await self._order_service.create_order_for_cart(order_in, cart_to_clear)
-        return order
+        # One transaction for the whole checkout: the order service's block nests in this one.
+        async with self._uow:
+            cart = await self._get_cart(customer_in.unique_identifier)
+            # The items are cleared once ordered, so there is no point storing new prices.
+            cart_details = await self._cart_totals(cart, store=False)
+            if not cart_details.items:
+                raise NotFoundAppError("Cannot checkout with an empty cart")
+
+            order_lines = [
+                OrderLineIn(
+                    pizza_id=item.pizza_id,
+                    quantity=item.quantity,
+                    extras=item.extras,
+                )
+                for item in cart_details.items
+            ]
+            order_in = OrderIn(lines=order_lines, customer=customer_in)
+            return await self._order_service.create_order_for_cart(order_in, cart)
@@ -1,10 +1,10 @@
 import uuid
 from typing import Sequence
 
-from app.core.exceptions import NotFoundAppError
+from app.core.exceptions import NotFoundAppError, ValidationAppError
 from app.db.models import Extra, Pizza
-from app.schemas.pagination import Page, PaginationParams
-from app.schemas.catalog import PizzaOut
+from app.schemas.pagination import Cursor, Page, PaginationParams, TotalMode
+from app.schemas.catalog import ExtraOut, PizzaOut, SearchMode
 from app.db.repositories.extra_repo import ExtraRepo
 from app.db.repositories.pizza_repo import PizzaRepo
 
@@ -27,25 +27,49 @@ class CatalogService:
         self,
         search: str | None = None,
         ingredients: list[str] | None = None,
+        any_ingredients: list[str] | None = None,
+        exclude_ingredients: list[str] | None = None,
         min_price: float | None = None,
         max_price: float | None = None,
         page: int = 1,
         page_size: int = 10,
+        search_mode: SearchMode = "contains",
+        cursor: str | None = None,
+        total_mode: TotalMode = "exact",
     ) -> Page[PizzaOut]:
-        async with self._uow:
-            pizzas, total = await self._uow.pizzas.get_all(
+        """A page of pizzas; passing ``cursor`` (even empty) switches to keyset paging."""
+        keyset = cursor is not None
+        if keyset and search and search_mode == "fuzzy":
+            raise ValidationAppError(
+                "Fuzzy search is ordered by relevance and can't be paged by cursor",
+                {"cursor": "Use page with search_mode=fuzzy"},
+            )
+        after = Cursor.decode(cursor) if cursor is not None else None
+        async with self._uow.read_only():
+            pizzas, total = await self._uow.pizzas.get_listing(
                 search=search,
                 ingredients=ingredients,
+                any_ingredients=any_ingredients,
+                exclude_ingredients=exclude_ingredients,
                 min_price=min_price,
                 max_price=max_price,
                 page=page,
                 page_size=page_size,
+                search_mode=search_mode,
+                keyset=keyset,
+                after=after,
+                total_mode=total_mode,
             )
             params = PaginationParams(page=page, per_page=page_size)
-            return Page(
-                items=[PizzaOut.from_orm(p) for p in pizzas],
-                meta=params.build_meta(total),
+            return params.build_page(
+                pizzas,
+                total,
+                PizzaOut.model_validate,
+                keyset=keyset,
+                lookahead=total_mode == "none",
             )
 
-    async def list_extras(self) -> Sequence[Extra]:
-        return await self._uow.extras.get_all()
+    async def list_extras(self) -> list[ExtraOut]:
+        async with self._uow.read_only():
+            extras = await self._uow.extras.get_listing()
+            return [ExtraOut.model_validate(e) for e in extras]
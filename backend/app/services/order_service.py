@@ -1,73 +1,186 @@
 import uuid
-from decimal import Decimal
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from app.core.exceptions import NotFoundAppError
-from app.db.models import Cart, Order, OrderItem, CustomerInfo
+from app.core.exceptions import NotFoundAppError, ValidationAppError, not_found_message
+from app.core.money import Money
+from app.db.models import Cart, Extra, Order, CustomerInfo, Pizza
 from app.core.price_rules import PriceCalculator
 from app.db.repositories.cart_repo import CartRepo
 from app.db.repositories.order_repo import OrderRepo
 from app.db.repositories.customer_repo import CustomerRepo
 from app.db.repositories.pizza_repo import PizzaRepo
 from app.db.repositories.extra_repo import ExtraRepo
-from app.schemas.order import OrderIn, OrderLineIn, QuoteOrderLineOut, QuoteOut, OrderLineOut, OrderOut
+from app.schemas.pagination import Cursor, Page, PaginationParams, TotalMode
+from app.schemas.order import OrderIn, OrderLineIn, QuoteOrderLineOut, QuoteOut, OrderLineOut, OrderOut, OrderSummaryOut, OrderView
 from typing import List, Optional
 
 
 from app.db.uow import UOWDep
 
 
+# One CSV row per order line; the order's own fields repeat on each of its lines.
+ORDER_CSV_COLUMNS = (
+    "order_id",
+    "unique_identifier",
+    "status",
+    "subtotal",
+    "extras_total",
+    "grand_total",
+    "line_id",
+    "pizza_id",
+    "quantity",
+    "extras",
+    "unit_base_price",
+    "unit_extras_total",
+    "line_total",
+)
+
+
+def order_csv_rows(order: OrderOut) -> list[tuple]:
+    # Amounts as exact decimal strings, not the floats the JSON API publishes.
+    header = (
+        order.id,
+        order.unique_identifier,
+        order.status,
+        order.subtotal,
+        order.extras_total,
+        order.grand_total,
+    )
+    return [
+        header
+        + (
+            line.id,
+            line.pizza_id,
+            line.quantity,
+            " ".join(str(extra) for extra in line.extras),
+            line.unit_base_price,
+            line.unit_extras_total,
+            line.line_total,
+        )
+        for line in order.lines
+    ]
+
+
+def build_order(
+    quote: QuoteOut, unique_identifier: str, customer_id: uuid.UUID
+) -> tuple[Order, list[dict]]:
+    """The order header and one ``order_items`` row per quote line.
+
+    Lines stay plain dicts, not ``OrderItem`` objects, so catering orders with
+    hundreds of lines cost little per line to build and insert.
+    """
+    order = Order(
+        id=uuid.uuid4(),
+        uniqueIdentifier=unique_identifier,
+        customer_id=customer_id,
+        status="created",
+        subtotal=quote.subtotal,
+        extras_total=quote.extras_total,
+        grand_total=quote.grand_total,
+        item_count=sum(line.quantity for line in quote.lines),
+    )
+    items = [
+        {
+            "id": uuid.uuid4(),
+            "order_id": order.id,
+            "pizza_id": line.pizza_id,
+            "quantity": line.quantity,
+            "selected_extras": [str(e) for e in line.extras],
+            "unit_base_price": line.unit_base_price,
+            "unit_extras_total": line.unit_extras_total,
+            "line_total": line.line_total,
+        }
+        for line in quote.lines
+    ]
+    return order, items
+
+
 class OrderService:
     def __init__(self, uow: UOWDep) -> None:
         self._uow = uow
 
     async def calculate_quote(self, lines: list[OrderLineIn]) -> QuoteOut:
         """Calculate price quote for order lines."""
+        async with self._uow.read_only():
+            return await self._calculate_quote(lines)
+
+    async def _resolve_catalog(
+        self, lines: list[OrderLineIn]
+    ) -> tuple[dict[uuid.UUID, Pizza], dict[uuid.UUID, Extra]]:
+        """Load every pizza and extra the lines refer to, one query per table.
+
+        All unknown ids are reported together rather than failing on the first one.
+        """
+        pizza_ids = list(dict.fromkeys(line.pizza_id for line in lines))
+        extra_ids = list(
+            dict.fromkeys(extra_id for line in lines for extra_id in line.extras)
+        )
+        pizzas = {p.id: p for p in await self._uow.pizzas.get_many(pizza_ids)}
+        extras = (
+            {e.id: e for e in await self._uow.extras.get_many(extra_ids)}
+            if extra_ids
+            else {}
+        )
+
+        errors = []
+        if missing_pizzas := [i for i in pizza_ids if i not in pizzas]:
+            errors.append(not_found_message("Pizza", missing_pizzas))
+        if missing_extras := [i for i in extra_ids if i not in extras]:
+            errors.append(not_found_message("Extra", missing_extras))
+        if errors:
+            raise NotFoundAppError("; ".join(errors))
+        return pizzas, extras
+
+    async def _calculate_quote(self, lines: list[OrderLineIn]) -> QuoteOut:
         order_items = []
-        subtotal = Decimal(0)
-        extras_total = Decimal(0)
+        # Accumulate in int cents and only wrap the amounts the response carries.
+        subtotal = 0
+        extras_total = 0
+        pizzas, extras_by_id = await self._resolve_catalog(lines)
 
         for line in lines:
-            # Validate pizza exists
-            pizza = await self._uow.pizzas.get(line.pizza_id)
-            if not pizza:
-                raise NotFoundAppError(f"Pizza with id {line.pizza_id} not found")
-
-            # Validate extras exist
-            extras = []
-            for extra_id in line.extras:
-                extra = await self._uow.extras.get(extra_id)
-                if not extra:
-                    raise NotFoundAppError(f"Extra with id {extra_id} not found")
-                extras.append(extra)
+            pizza = pizzas[line.pizza_id]
+            extras = [extras_by_id[extra_id] for extra_id in line.extras]
 
             # Calculate prices
-            unit_base_price = Decimal(str(pizza.base_price))
-            unit_extras_total = sum(Decimal(str(extra.price)) for extra in extras)
-            line_total = (unit_base_price + unit_extras_total) * line.quantity
+            unit_base_price = Money.of(pizza.base_price)
+            unit_extras_total = PriceCalculator.calculate_extras_total(extras)
+            unit_price = unit_base_price.cents + unit_extras_total.cents
 
-            subtotal += unit_base_price * line.quantity
-            extras_total += unit_extras_total * line.quantity
+            subtotal += unit_base_price.cents * line.quantity
+            extras_total += unit_extras_total.cents * line.quantity
 
             order_items.append(
                 QuoteOrderLineOut(
                     pizza_id=line.pizza_id,
                     quantity=line.quantity,
                     extras=line.extras,
-                    unit_base_price=float(unit_base_price),
-                    unit_extras_total=float(unit_extras_total),
-                    line_total=float(line_total),
+                    unit_base_price=unit_base_price,
+                    unit_extras_total=unit_extras_total,
+                    line_total=Money(unit_price * line.quantity),
                 )
             )
 
-        grand_total = subtotal + extras_total
-
         return QuoteOut(
-            subtotal=float(subtotal),
-            extras_total=float(extras_total),
-            grand_total=float(grand_total),
+            subtotal=Money(subtotal),
+            extras_total=Money(extras_total),
+            grand_total=Money(subtotal + extras_total),
             lines=order_items,
         )
 
+    @staticmethod
+    def _order_out(order: Order, items: list[dict]) -> OrderOut:
+        return OrderOut(
+            id=order.id,
+            unique_identifier=order.uniqueIdentifier,
+            status=order.status,
+            subtotal=order.subtotal,
+            extras_total=order.extras_total,
+            grand_total=order.grand_total,
+            lines=[OrderLineOut.model_validate(item) for item in items],
+        )
+
     async def create_order(self, order_in: OrderIn) -> OrderOut:
         async with self._uow:
             # Find or create customer
@@ -81,33 +194,10 @@ class OrderService:
             # Calculate order details
             quote = await self.calculate_quote(order_in.lines)
 
-            # Create order items
-            order_items = []
-            for line_data in quote.lines:
-                order_items.append(
-                    OrderItem(
-                        pizza_id=line_data.pizza_id,
-                        quantity=line_data.quantity,
-                        selected_extras=[str(e) for e in line_data.extras],
-                        unit_base_price=Decimal(str(line_data.unit_base_price)),
-                        unit_extras_total=Decimal(
-                            str(line_data.unit_extras_total)
-                        ),
-                        line_total=Decimal(str(line_data.line_total)),
-                    )
-                )
+            order, items = build_order(quote, unique_identifier, customer.id)
+            created_order = await self._uow.orders.create(order, items)
+            return self._order_out(created_order, items)
 
-            order = Order(
-                uniqueIdentifier=unique_identifier,
-                customer_id=customer.id,
-                status="created",
-                subtotal=Decimal(str(quote.subtotal)),
-                extras_total=Decimal(str(quote.extras_total)),
-                grand_total=Decimal(str(quote.grand_total)),
-                items=order_items,
-            )
-            created_order = await self._uow.orders.create(order)
-            return OrderOut.model_validate(created_order)
     async def create_order_for_cart(self, order_in: OrderIn, cart: Cart) -> OrderOut:
         async with self._uow:
             # Find or create customer
@@ -121,54 +211,98 @@ class OrderService:
             # Calculate order details
             quote = await self.calculate_quote(order_in.lines)
 
-            # Create order items
-            order_items = []
-            for line_data in quote.lines:
-                order_items.append(
-                    OrderItem(
-                        pizza_id=line_data.pizza_id,
-                        quantity=line_data.quantity,
-                        selected_extras=[str(e) for e in line_data.extras],
-                        unit_base_price=Decimal(str(line_data.unit_base_price)),
-                        unit_extras_total=Decimal(
-                            str(line_data.unit_extras_total)
-                        ),
-                        line_total=Decimal(str(line_data.line_total)),
-                    )
-                )
-
-            order = Order(
-                uniqueIdentifier=unique_identifier,
-                customer_id=customer.id,
-                status="created",
-                subtotal=Decimal(str(quote.subtotal)),
-                extras_total=Decimal(str(quote.extras_total)),
-                grand_total=Decimal(str(quote.grand_total)),
-                items=order_items,
-            )
-            created_order = await self._uow.orders.create(order)
+            order, items = build_order(quote, unique_identifier, customer.id)
+            created_order = await self._uow.orders.create(order, items)
             await self._uow.carts.clear(cart)
-            return OrderOut.model_validate(created_order)
-   
+            return self._order_out(created_order, items)
+
     async def get_order(self, order_id: uuid.UUID) -> OrderOut:
-        order = await self._uow.orders.get(order_id)
-        if not order:
-            raise NotFoundAppError(f"Order with id {order_id} not found")
-        return OrderOut.model_validate(order)
+        async with self._uow.read_only():
+            order = await self._uow.orders.get(order_id)
+            if not order:
+                raise NotFoundAppError(f"Order with id {order_id} not found")
+            return OrderOut.model_validate(order)
 
     async def get_all_orders(
         self,
         unique_identifier: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> dict:
-        orders = await self._uow.orders.get_all(
-            unique_identifier=unique_identifier, skip=skip, limit=limit
-        )
-        total = await self._uow.orders.count(
-            unique_identifier=unique_identifier
-        )
-        return {
-            "items": [OrderOut.model_validate(order) for order in orders],
-            "total": total,
-        }
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = "exact",
+        view: OrderView = "full",
+    ) -> Page[OrderOut] | Page[OrderSummaryOut]:
+        """A page of orders; passing ``cursor`` (even empty) switches to keyset paging.
+
+        ``view="summary"`` returns only the order headers, from the orders table alone.
+        """
+        keyset = cursor is not None
+        after = Cursor.decode(cursor) if cursor is not None else None
+        params = PaginationParams(page=skip // limit + 1, per_page=limit)
+        async with self._uow.read_only():
+            if view == "summary":
+                summaries, total = await self._uow.orders.get_summaries(
+                    unique_identifier=unique_identifier,
+                    skip=skip,
+                    limit=limit,
+                    keyset=keyset,
+                    after=after,
+                    total_mode=total_mode,
+                )
+                return params.build_page(
+                    summaries,
+                    total,
+                    OrderSummaryOut.model_validate,
+                    keyset=keyset,
+                    lookahead=total_mode == "none",
+                )
+            orders, total = await self._uow.orders.get_listing(
+                unique_identifier=unique_identifier,
+                skip=skip,
+                limit=limit,
+                keyset=keyset,
+                after=after,
+                total_mode=total_mode,
+            )
+            return params.build_page(
+                orders,
+                total,
+                OrderOut.model_validate,
+                keyset=keyset,
+                lookahead=total_mode == "none",
+            )
+
+    def export_orders(
+        self,
+        unique_identifier: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[OrderOut]:
+        """Every matching order, oldest first, streamed from the database.
+
+        The filters are checked here; the orders are read only as the result is
+        iterated, in a read-only block of their own, so it can outlive the request's.
+        """
+        if created_from and created_to and created_from >= created_to:
+            raise ValidationAppError(
+                "Invalid date range", {"created_to": "Must be later than created_from"}
+            )
+        return self._export_orders(unique_identifier, created_from, created_to, batch_size)
+
+    async def _export_orders(
+        self,
+        unique_identifier: Optional[str],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        batch_size: int,
+    ) -> AsyncIterator[OrderOut]:
+        async with self._uow.read_only():
+            orders = self._uow.orders.stream(
+                unique_identifier=unique_identifier,
+                created_from=created_from,
+                created_to=created_to,
+                batch_size=batch_size,
+            )
+            async for order in orders:
+                yield OrderOut.model_validate(order)
@@ -5,7 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from app.api.routers import carts, extras, health, orders, pizzas
+from app.api.routers import carts, extras, health, metrics, orders, pizzas
 from app.core.exception_handler import add_exception_handlers
 from app.core.limiter import limiter
 from app.core.logging import setup_logging
@@ -13,7 +13,13 @@ from scripts.seed import seed_db
 import logging
 
 from app.core.config import get_settings
-from app.db.session import get_session_maker
+from app.db.catalog_snapshot import close_catalog, init_catalog
+from app.db.session import (
+    dispose_engine,
+    get_session_maker,
+    init_engine,
+    start_replica_monitor,
+)
 from app.db.uow import UnitOfWork
 
 log = logging.getLogger("uvicorn")
@@ -21,14 +27,20 @@ log = logging.getLogger("uvicorn")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     log.info("Starting up...")
+    init_engine(get_settings())
+    start_replica_monitor(get_settings())
     log.info("seed database...")
-    session_maker = get_session_maker()
-
-    async with session_maker() as session:
-        uow = UnitOfWork(session)
-        async with uow:
-            await seed_db(uow)
+    uow = UnitOfWork(get_session_maker())
+    async with uow:
+        await seed_db(uow)
+    log.info("load catalog...")
+    await init_catalog(
+        get_session_maker(), get_settings().CATALOG_REFRESH_INTERVAL_SECONDS
+    )
     yield
+    log.info("Shutting down...")
+    await close_catalog()
+    await dispose_engine()
 
 def create_app() -> FastAPI:
     setup_logging()
@@ -58,6 +70,7 @@ def create_app() -> FastAPI:
     app.include_router(carts.router, prefix="/api/carts", tags=["carts"])
     app.include_router(orders.router, prefix="/api/orders", tags=["orders"])
     app.include_router(health.router, prefix="/health", tags=["health"])
+    app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
     add_exception_handlers(app)
 
@@ -0,0 +1,44 @@
+"""Add cart totals
+
+Revision ID: a6c3e9f2b5d8
+Revises: f2a9d4c7e1b8
+Create Date: 2026-10-17 18:05:31.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3e9f2b5d8'
+down_revision: Union[str, Sequence[str], None] = 'f2a9d4c7e1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing carts start at catalog version 0, so each is priced on its next read.
+    op.add_column(
+        'carts',
+        sa.Column('subtotal', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'carts', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'carts', sa.Column('catalog_version', sa.BigInteger(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'cart_items', sa.Column('unit_price', sa.Numeric(precision=12, scale=2), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('cart_items', 'unit_price')
+    op.drop_column('carts', 'catalog_version')
+    op.drop_column('carts', 'item_count')
+    op.drop_column('carts', 'subtotal')
@@ -0,0 +1,57 @@
+"""Add catalog version counter
+
+Revision ID: b3e1c7a9d2f4
+Revises: 37316d9ce11f
+Create Date: 2026-10-17 10:12:41.503112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1c7a9d2f4'
+down_revision: Union[str, Sequence[str], None] = '37316d9ce11f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOG_TABLES = ("pizzas", "extras")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'catalog_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='1', nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 1)")
+    # Statement-level so a bulk import bumps the version once, not once per row.
+    op.execute(
+        """
+        CREATE FUNCTION bump_catalog_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_bump_catalog_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER {table}_bump_catalog_version ON {table}")
+    op.execute("DROP FUNCTION bump_catalog_version()")
+    op.drop_table('catalog_version')
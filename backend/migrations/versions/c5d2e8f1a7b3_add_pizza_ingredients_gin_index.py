@@ -0,0 +1,31 @@
+"""Add GIN index on pizza ingredients
+
+Revision ID: c5d2e8f1a7b3
+Revises: b3e1c7a9d2f4
+Create Date: 2026-10-17 11:03:18.227540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d2e8f1a7b3'
+down_revision: Union[str, Sequence[str], None] = 'b3e1c7a9d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_pizzas_ingredients', 'pizzas', ['ingredients'], unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pizzas_ingredients', table_name='pizzas', postgresql_using='gin')
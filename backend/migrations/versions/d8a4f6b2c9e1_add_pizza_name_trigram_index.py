@@ -0,0 +1,33 @@
+"""Add trigram index on pizza names
+
+Revision ID: d8a4f6b2c9e1
+Revises: c5d2e8f1a7b3
+Create Date: 2026-10-17 11:41:52.918364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a4f6b2c9e1'
+down_revision: Union[str, Sequence[str], None] = 'c5d2e8f1a7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_pizzas_name_trgm', 'pizzas', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pizzas_name_trgm', table_name='pizzas', postgresql_using='gin')
+    # The extension is left installed; other objects may depend on it.
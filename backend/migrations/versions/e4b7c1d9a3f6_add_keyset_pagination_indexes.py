@@ -0,0 +1,35 @@
+"""Add keyset pagination indexes
+
+Revision ID: e4b7c1d9a3f6
+Revises: d8a4f6b2c9e1
+Create Date: 2026-10-17 14:08:31.207415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c1d9a3f6'
+down_revision: Union[str, Sequence[str], None] = 'd8a4f6b2c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_pizzas_created_at_id', 'pizzas', ['created_at', 'id'], unique=False)
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_orders_unique_identifier_created_at_id', 'orders',
+        ['uniqueIdentifier', 'created_at', 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_unique_identifier_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
+    op.drop_index('ix_pizzas_created_at_id', table_name='pizzas')
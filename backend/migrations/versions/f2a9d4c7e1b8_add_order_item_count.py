@@ -0,0 +1,39 @@
+"""Add order item count
+
+Revision ID: f2a9d4c7e1b8
+Revises: e4b7c1d9a3f6
+Create Date: 2026-10-17 16:42:09.518733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9d4c7e1b8'
+down_revision: Union[str, Sequence[str], None] = 'e4b7c1d9a3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'orders', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute(
+        """
+        UPDATE orders SET item_count = counts.item_count
+        FROM (
+            SELECT order_id, SUM(quantity) AS item_count FROM order_items GROUP BY order_id
+        ) AS counts
+        WHERE counts.order_id = orders.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orders', 'item_count')
@@ -0,0 +1,150 @@
+"""
+Benchmark the order and pizza listings served from ORM objects versus column rows.
+
+Creates and seeds the tables in an empty scratch database, then times one page of
+each listing as ORM objects and as rows (``get_listing``), including the DTO mapping
+the service does. CPU is this process's alone, so it leaves out the database's share
+of the wall time; memory is the tracemalloc peak while building one page. The tables
+are dropped again afterwards.
+
+Usage:
+    python -m scripts.bench_listing --database-url postgresql+psycopg://... \
+        [--orders 2000] [--lines 3] [--per-page 100] [--repeat 50]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from decimal import Decimal
+
+from typing import Any
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.core.money import Money
+from app.db.models import Base, CustomerInfo, Order, OrderItem, Pizza
+from app.db.repositories.order_repo import OrderRepo
+from app.db.repositories.pizza_repo import PizzaRepo
+from app.schemas.catalog import PizzaOut
+from app.schemas.order import OrderOut
+
+
+async def seed(session, orders: int, lines: int) -> None:
+    customer_id = uuid.uuid4()
+    await session.execute(
+        insert(CustomerInfo),
+        [{"id": customer_id, "uniqueIdentifier": "bench@example.com",
+          "fullname": "Bench Customer", "full_address": "1 Bench Street"}],
+    )
+    pizzas = [
+        {"id": uuid.uuid4(), "name": f"Pizza {number}", "base_price": Money.of(Decimal("9.90")),
+         "image_url": f"https://example.com/{number}.png",
+         "ingredients": ["cheese", "tomato", "basil"], "is_active": True}
+        for number in range(orders)
+    ]
+    await session.execute(insert(Pizza), pizzas)
+    order_rows: list[dict[str, Any]] = []
+    item_rows: list[dict[str, Any]] = []
+    for number in range(orders):
+        order_id = uuid.uuid4()
+        order_rows.append(
+            {"id": order_id, "uniqueIdentifier": "bench@example.com", "status": "pending",
+             "subtotal": Money.of(Decimal("29.70")), "extras_total": Money.of(Decimal("3.00")),
+             "grand_total": Money.of(Decimal("32.70")), "customer_id": customer_id}
+        )
+        item_rows.extend(
+            {"id": uuid.uuid4(), "order_id": order_id, "pizza_id": pizzas[number]["id"],
+             "quantity": 1, "selected_extras": [],
+             "unit_base_price": Money.of(Decimal("9.90")),
+             "unit_extras_total": Money.of(Decimal("1.00")),
+             "line_total": Money.of(Decimal("10.90"))}
+            for _ in range(lines)
+        )
+    await session.execute(insert(Order), order_rows)
+    await session.execute(insert(OrderItem), item_rows)
+    await session.commit()
+
+
+async def measure(session_factory, build_page, repeat: int) -> tuple[float, float, int]:
+    """Best wall time and mean CPU time of this process per page, and peak memory."""
+    best = float("inf")
+    cpu_start = time.process_time()
+    for _ in range(repeat):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await build_page(session)
+            best = min(best, time.perf_counter() - start)
+    cpu = (time.process_time() - cpu_start) / repeat
+    async with session_factory() as session:
+        tracemalloc.start()
+        await build_page(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best, cpu, peak
+
+
+def order_page(per_page: int, as_rows: bool):
+    async def build(session):
+        if as_rows:
+            orders, _ = await OrderRepo(session).get_listing(limit=per_page)
+            return [OrderOut.model_validate(order) for order in orders]
+        # The ORM page the listing was served from before get_listing.
+        stmt = (
+            select(Order)
+            .options(selectinload(Order.items), selectinload(Order.customer))
+            .order_by(Order.created_at, Order.id)
+            .limit(per_page)
+        )
+        return [OrderOut.model_validate(order) for order in await session.scalars(stmt)]
+
+    return build
+
+
+def pizza_page(per_page: int, as_rows: bool):
+    async def build(session):
+        repo = PizzaRepo(session)
+        pizzas, _ = await (repo.get_listing if as_rows else repo.get_all)(page_size=per_page)
+        return [PizzaOut.model_validate(pizza) for pizza in pizzas]
+
+    return build
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with session_factory() as session:
+            await seed(session, args.orders, args.lines)
+        for label, page in (("orders", order_page), ("pizzas", pizza_page)):
+            orm = await measure(session_factory, page(args.per_page, False), args.repeat)
+            rows = await measure(session_factory, page(args.per_page, True), args.repeat)
+            for name, (wall, cpu, peak) in (("ORM", orm), ("rows", rows)):
+                print(
+                    f"{label:>6} {name:>4}: {wall * 1000:6.2f} ms wall, {cpu * 1000:6.2f} ms CPU,"
+                    f" {peak / 1024:6.0f} KiB peak"
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", required=True, help="SQLAlchemy URL of an empty scratch database")
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark writing an order of 1, 50 and 1000 lines: one ``OrderItem`` object per
+line flushed by the ORM, versus ``OrderRepo.create`` with column dicts sent as a
+multi-row INSERT or through COPY.
+
+Creates the tables in an empty scratch database and rolls every order back, so the
+tables stay small. Each timing covers building the rows from a quote and writing
+them; memory is the tracemalloc peak for one order. The tables are dropped again
+afterwards.
+
+Usage:
+    python -m scripts.bench_order_insert --database-url postgresql+psycopg://... \
+        [--lines 1 50 1000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.money import Money
+from app.db.models import Base, CustomerInfo, OrderItem
+from app.db.repositories.order_repo import OrderRepo
+from app.schemas.order import QuoteOrderLineOut, QuoteOut
+from app.services.order_service import build_order
+
+
+def build_quote(lines: int) -> QuoteOut:
+    line = QuoteOrderLineOut(
+        pizza_id=uuid.uuid4(),
+        quantity=2,
+        extras=[uuid.uuid4(), uuid.uuid4()],
+        unit_base_price=Money.of(Decimal("9.90")),
+        unit_extras_total=Money.of(Decimal("2.00")),
+        line_total=Money.of(Decimal("23.80")),
+    )
+    total = Money.of(Decimal("23.80") * lines)
+    return QuoteOut(
+        subtotal=total, extras_total=Money.of(Decimal("4.00") * lines), grand_total=total,
+        lines=[line] * lines,
+    )
+
+
+async def write_orm(session, quote: QuoteOut, customer_id: uuid.UUID) -> None:
+    """How orders were written before: an OrderItem per line, flushed with the header."""
+    order, items = build_order(quote, "bench@example.com", customer_id)
+    order.items = [
+        OrderItem(**{name: value for name, value in item.items() if name != "order_id"})
+        for item in items
+    ]
+    session.add(order)
+    await session.flush()
+
+
+def write_rows(copy_min_items: int):
+    async def write(session, quote: QuoteOut, customer_id: uuid.UUID) -> None:
+        order, items = build_order(quote, "bench@example.com", customer_id)
+        await OrderRepo(session).create(order, items, copy_min_items=copy_min_items)
+
+    return write
+
+
+async def measure(session_factory, write, quote, customer_id, repeat: int) -> tuple[float, float, int]:
+    """Best wall time and mean CPU time of this process per order, and peak memory."""
+    best = float("inf")
+    cpu_start = time.process_time()
+    for _ in range(repeat):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await write(session, quote, customer_id)
+            best = min(best, time.perf_counter() - start)
+            await session.rollback()
+    cpu = (time.process_time() - cpu_start) / repeat
+    async with session_factory() as session:
+        tracemalloc.start()
+        await write(session, quote, customer_id)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await session.rollback()
+    return best, cpu, peak
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        customer_id = uuid.uuid4()
+        async with session_factory() as session, session.begin():
+            await session.execute(
+                insert(CustomerInfo),
+                [{"id": customer_id, "uniqueIdentifier": "bench@example.com",
+                  "fullname": "Bench Customer", "full_address": "1 Bench Street"}],
+            )
+        for lines in args.lines:
+            quote = build_quote(lines)
+            results = [("ORM", await measure(session_factory, write_orm, quote, customer_id, args.repeat))]
+            for name, copy_min_items in (("INSERT", lines + 1), ("COPY", 1)):
+                write = write_rows(copy_min_items)
+                results.append(
+                    (name, await measure(session_factory, write, quote, customer_id, args.repeat))
+                )
+            for name, (wall, cpu, peak) in results:
+                print(
+                    f"{lines:>5} lines {name:>6}: {wall * 1000:7.2f} ms wall, {cpu * 1000:7.2f} ms CPU,"
+                    f" {peak / 1024:7.0f} KiB peak"
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", required=True, help="SQLAlchemy URL of an empty scratch database")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 50, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Microbenchmark: pricing a large quote with the Decimal/float round trips the
+services used to do versus integer-cents Money.
+
+Usage:
+    python -m scripts.bench_pricing [--lines 5000] [--repeat 5]
+"""
+
+import argparse
+import random
+import timeit
+import uuid
+from decimal import Decimal
+
+from app.core.money import Money
+from app.core.price_rules import PriceCalculator
+
+
+class _Row:
+    __slots__ = ("id", "base_price", "price")
+
+    def __init__(self, price: object) -> None:
+        self.id = uuid.uuid4()
+        self.base_price = self.price = price
+
+
+def build_catalog(as_money: bool) -> tuple[list[_Row], list[_Row]]:
+    rng = random.Random(42)
+    prices = [Decimal(rng.randint(500, 2500)).scaleb(-2) for _ in range(60)]
+    wrap = Money.of if as_money else (lambda price: price)
+    pizzas = [_Row(wrap(price)) for price in prices[:20]]
+    extras = [_Row(wrap(price)) for price in prices[20:]]
+    return pizzas, extras
+
+
+def build_lines(count: int) -> list[tuple[int, list[int], int]]:
+    rng = random.Random(7)
+    return [
+        (rng.randrange(20), rng.sample(range(40), rng.randint(0, 4)), rng.randint(1, 5))
+        for _ in range(count)
+    ]
+
+
+def price_legacy(pizzas, extras, lines) -> float:
+    """The old path: Numeric -> Decimal(str()) -> float in the quote -> Decimal(str()) again for the order."""
+    subtotal = Decimal(0)
+    extras_total = Decimal(0)
+    quote_lines = []
+    for pizza_idx, extra_idxs, quantity in lines:
+        unit_base_price = Decimal(str(pizzas[pizza_idx].base_price))
+        unit_extras_total = sum(Decimal(str(extras[i].price)) for i in extra_idxs)
+        line_total = (unit_base_price + unit_extras_total) * quantity
+        subtotal += unit_base_price * quantity
+        extras_total += unit_extras_total * quantity
+        quote_lines.append(
+            (float(unit_base_price), float(unit_extras_total), float(line_total))
+        )
+    for base, extra, total in quote_lines:
+        Decimal(str(base)), Decimal(str(extra)), Decimal(str(total))
+    grand_total = float(subtotal + extras_total)
+    return float(Decimal(str(grand_total)))
+
+
+def price_money(pizzas, extras, lines) -> float:
+    """The new path, shaped like OrderService._calculate_quote: int cents throughout."""
+    subtotal = 0
+    extras_total = 0
+    quote_lines = []
+    for pizza_idx, extra_idxs, quantity in lines:
+        unit_base_price = Money.of(pizzas[pizza_idx].base_price)
+        unit_extras_total = PriceCalculator.calculate_extras_total(
+            [extras[i] for i in extra_idxs]
+        )
+        unit_price = unit_base_price.cents + unit_extras_total.cents
+        subtotal += unit_base_price.cents * quantity
+        extras_total += unit_extras_total.cents * quantity
+        quote_lines.append(
+            (unit_base_price, unit_extras_total, Money(unit_price * quantity))
+        )
+    return float(Money(subtotal + extras_total))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = build_lines(args.lines)
+    legacy_catalog = build_catalog(as_money=False)
+    money_catalog = build_catalog(as_money=True)
+
+    legacy_total = price_legacy(*legacy_catalog, lines)
+    money_total = price_money(*money_catalog, lines)
+    assert legacy_total == money_total, (legacy_total, money_total)
+
+    results = {}
+    for name, func, catalog in (
+        ("decimal/float", price_legacy, legacy_catalog),
+        ("money (cents)", price_money, money_catalog),
+    ):
+        best = min(
+            timeit.repeat(lambda: func(*catalog, lines), number=1, repeat=args.repeat)
+        )
+        results[name] = best
+        print(f"{name:>14}: {best * 1000:8.2f} ms for {args.lines} lines")
+    print(f"{'speedup':>14}: {results['decimal/float'] / results['money (cents)']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
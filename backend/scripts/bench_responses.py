@@ -0,0 +1,114 @@
+"""
+Benchmark rendering GET /api/orders with 100-item pages through FastAPI's default
+response_model path versus FastJSONRoute.
+
+Both apps mount the real endpoint in-process with a stubbed service, so the numbers
+cover routing, validation and encoding only, not the database.
+
+Usage:
+    python -m scripts.bench_responses [--per-page 100] [--lines 3] [--requests 300]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from decimal import Decimal
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from app.api.deps import get_order_service
+from app.api.routers import orders
+from app.api.routing import FastJSONRoute
+from app.core.money import Money
+from app.core.response import Response
+from app.schemas.order import OrderLineOut, OrderOut
+from app.schemas.pagination import PaginationParams
+
+
+def build_orders(count: int, lines: int) -> list[OrderOut]:
+    return [
+        OrderOut(
+            id=uuid.uuid4(),
+            unique_identifier=f"customer-{number % 17}@example.com",
+            status="pending",
+            subtotal=Money.of(Decimal("23.80")),
+            extras_total=Money.of(Decimal("2.00")),
+            grand_total=Money.of(Decimal("25.80")),
+            lines=[
+                OrderLineOut(
+                    id=uuid.uuid4(),
+                    pizza_id=uuid.uuid4(),
+                    quantity=2,
+                    extras=[uuid.uuid4()],
+                    unit_base_price=Money.of(Decimal("11.90")),
+                    unit_extras_total=Money.of(Decimal("1.00")),
+                    line_total=Money.of(Decimal("25.80")),
+                )
+                for _ in range(lines)
+            ],
+        )
+        for number in range(count)
+    ]
+
+
+class StubOrderService:
+    def __init__(self, page: list[OrderOut]) -> None:
+        self._page = page
+
+    async def get_all_orders(self, skip, limit, **kwargs):
+        params = PaginationParams(page=skip // limit + 1, per_page=limit)
+        return params.build_page(self._page, 10_000, lambda order: order)
+
+
+def build_app(route_class: type[APIRoute], service: StubOrderService) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    # The module attribute is the undecorated endpoint function.
+    router.add_api_route(
+        "/",
+        orders.get_all_orders,
+        response_model=Response[list[OrderOut]],
+        methods=["GET"],
+    )
+    app = FastAPI()
+    app.include_router(router, prefix="/api/orders")
+    app.dependency_overrides[get_order_service] = lambda: service
+    return app
+
+
+async def measure(app: FastAPI, per_page: int, requests: int) -> tuple[float, bytes]:
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        params = {"per_page": per_page}
+        body = (await client.get("/api/orders/", params=params)).content
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/api/orders/", params=params)
+        return (time.perf_counter() - start) / requests, body
+
+
+async def run(per_page: int, lines: int, requests: int) -> None:
+    service = StubOrderService(build_orders(per_page, lines))
+    results = {}
+    bodies = {}
+    for name, route_class in (("response_model", APIRoute), ("FastJSONRoute", FastJSONRoute)):
+        seconds, body = await measure(build_app(route_class, service), per_page, requests)
+        results[name], bodies[name] = seconds, body
+        print(f"{name:>15}: {seconds * 1000:7.2f} ms/request ({len(body)} bytes)")
+    assert json.loads(bodies["response_model"]) == json.loads(bodies["FastJSONRoute"])
+    print(f"{'speedup':>15}: {results['response_model'] / results['FastJSONRoute']:7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(run(args.per_page, args.lines, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark pizza name search on a synthetic 100k-item menu.
+
+Always times the in-memory catalog path (substring scan vs trigram index). With
+--database-url it also loads the menu into a temporary table and times ILIKE
+without an index, ILIKE with the pg_trgm GIN index, and the ranked fuzzy query.
+
+Usage:
+    python -m scripts.bench_search [--size 100000] [--database-url postgresql+psycopg://...]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy import create_engine, text
+
+from app.db.catalog_index import FUZZY_SEARCH_THRESHOLD, TrigramIndex
+from app.db.models import Pizza
+
+T = TypeVar("T")
+
+STYLES = [
+    "Classic", "Spicy", "Smoky", "Garden", "Royal", "Rustic", "Golden", "Double",
+    "Fiery", "Creamy", "Tuscan", "Sicilian", "Nordic", "Texas", "Tandoori", "Hawaiian",
+]
+TOPPINGS = [
+    "Pepperoni", "Margherita", "Mushroom", "Chicken", "Bacon", "Sausage", "Pineapple",
+    "Jalapeno", "Olive", "Spinach", "Artichoke", "Anchovy", "Salami", "Prosciutto",
+    "Gorgonzola", "Truffle", "Chorizo", "Meatball", "Veggie", "Buffalo",
+]
+SUFFIXES = ["Feast", "Supreme", "Deluxe", "Passion", "Special", "Classic", "Lovers", "Melt"]
+# (term, mode) pairs: exact words, typos, and a miss.
+QUERIES = [
+    ("pepperoni", "contains"),
+    ("peperoni", "fuzzy"),
+    ("margarita", "fuzzy"),
+    ("tandori chiken", "fuzzy"),
+    ("zzzz", "fuzzy"),
+]
+
+
+def build_menu(size: int) -> list[str]:
+    rng = random.Random(42)
+    return [
+        f"{rng.choice(STYLES)} {rng.choice(TOPPINGS)} {rng.choice(SUFFIXES)} {number}"
+        for number in range(size)
+    ]
+
+
+def best_of(func: Callable[[], T], repeat: int) -> tuple[float, T]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_memory(names: list[str], repeat: int) -> None:
+    # Unsaved rows: the index only reads their names.
+    pizzas = [Pizza(name=name) for name in names]
+    start = time.perf_counter()
+    index = TrigramIndex(pizzas)
+    print(f"in-memory: built trigram index in {time.perf_counter() - start:.2f} s")
+    for term, _ in QUERIES:
+        lowered = term.lower()
+        scan, scan_hits = best_of(
+            lambda: [p for p in pizzas if lowered in p.name.lower()], repeat
+        )
+        fuzzy, fuzzy_hits = best_of(lambda: index.search(term), repeat)
+        print(
+            f"  {term!r:>18}: substring scan {scan * 1000:7.2f} ms ({len(scan_hits)} hits)"
+            f" | trigram {fuzzy * 1000:7.2f} ms ({len(fuzzy_hits)} hits)"
+        )
+
+
+def bench_database(url: str, names: list[str], repeat: int) -> None:
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text("CREATE TEMP TABLE bench_pizzas (id serial PRIMARY KEY, name text)"))
+        conn.execute(
+            text("INSERT INTO bench_pizzas (name) VALUES (:name)"),
+            [{"name": name} for name in names],
+        )
+        conn.execute(text("ANALYZE bench_pizzas"))
+        conn.execute(
+            text("SELECT set_config('pg_trgm.word_similarity_threshold', :t, false)"),
+            {"t": str(FUZZY_SEARCH_THRESHOLD)},
+        )
+
+        contains = text(
+            "SELECT id, name FROM bench_pizzas WHERE name ILIKE :pattern LIMIT 10"
+        )
+        fuzzy = text(
+            "SELECT id, name FROM bench_pizzas WHERE name %> :term "
+            "ORDER BY word_similarity(:term, name) DESC, name LIMIT 10"
+        )
+
+        def run(label: str) -> None:
+            print(f"database: {label}")
+            for term, mode in QUERIES:
+                if mode == "contains":
+                    seconds, _ = best_of(
+                        lambda: conn.execute(contains, {"pattern": f"%{term}%"}).all(),
+                        repeat,
+                    )
+                else:
+                    seconds, _ = best_of(
+                        lambda: conn.execute(fuzzy, {"term": term}).all(), repeat
+                    )
+                print(f"  {term!r:>18} ({mode}): {seconds * 1000:8.2f} ms")
+
+        run("no index")
+        start = time.perf_counter()
+        conn.execute(
+            text("CREATE INDEX ON bench_pizzas USING gin (name gin_trgm_ops)")
+        )
+        conn.execute(text("ANALYZE bench_pizzas"))
+        print(f"database: built trigram index in {time.perf_counter() - start:.2f} s")
+        run("gin_trgm_ops index")
+        conn.rollback()
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", help="SQLAlchemy URL of a scratch database")
+    args = parser.parse_args()
+
+    names = build_menu(args.size)
+    bench_memory(names, args.repeat)
+    if args.database_url:
+        bench_database(args.database_url, names, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,11 +21,11 @@ async def seed_data(uow: UnitOfWork, data: list, model, name_field: str):
         name_field: The name of the field to check for existence.
     """
     for item in data:
-        instance = await uow._session.execute(
+        instance = await uow.session.execute(
             select(model).where(getattr(model, name_field) == item[name_field])
         )
         if not instance.scalars().first():
-            uow._session.add(model(**item))
+            uow.session.add(model(**item))
 
 
 async def seed_db(uow: UnitOfWork):
@@ -101,6 +101,8 @@ def mock_uow():
     uow.rollback = AsyncMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
     uow.__aexit__ = AsyncMock(return_value=None)
+    uow.read_only = Mock(return_value=uow)
+    uow.catalog = None
     return uow
 
 
@@ -260,6 +262,7 @@ def create_cart(**kwargs):
     defaults = {
         "id": uuid.uuid4(),
         "uniqueIdentifier": f"cart_{uuid.uuid4().hex[:8]}",
+        "catalog_version": 0,
         "created_at": datetime.utcnow(),
         "updated_at": datetime.utcnow()
     }
@@ -291,6 +294,7 @@ def create_order(**kwargs):
         "subtotal": Decimal("10.99"),
         "extras_total": Decimal("0.00"),
         "grand_total": Decimal("10.99"),
+        "item_count": 0,
         "customer_id": uuid.uuid4(),
         "created_at": datetime.utcnow(),
         "updated_at": datetime.utcnow()
@@ -2,16 +2,17 @@ import asyncio
 import json
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Generator
 from httpx import AsyncClient
 from fastapi import FastAPI
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from testcontainers.postgres import PostgresContainer
 from alembic import command
 from alembic.config import Config
 
 from app.core.config import Settings
-from app.db.session import get_db_session
+from app.db.session import get_read_session_factory, get_session_factory
 from app.db.uow import UnitOfWork
 from app.db.models import Pizza, Extra
 from app.db.base import Base
@@ -58,7 +59,9 @@ def e2e_test_engine(e2e_test_settings: E2ETestSettings):
 @pytest.fixture(scope="session")
 def e2e_test_session_maker(e2e_test_engine):
     """Create a test session maker for E2E tests."""
-    return async_sessionmaker(autocommit=False, autoflush=False, bind=e2e_test_engine)
+    return async_sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=e2e_test_engine
+    )
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -73,10 +76,9 @@ async def e2e_create_tables(e2e_test_engine):
 async def e2e_seed_data(e2e_test_session_maker, e2e_create_tables):
     """Seed the E2E test database with pizza and extra data."""
     # Ensure tables have been created before seeding
-    async with e2e_test_session_maker() as session:
-        uow = UnitOfWork(session)
-        async with uow:
-            await seed_test_data(uow)
+    uow = UnitOfWork(e2e_test_session_maker)
+    async with uow:
+        await seed_test_data(uow)
     return True
 
 
@@ -138,11 +140,9 @@ async def e2e_test_app(e2e_test_settings: E2ETestSettings, e2e_test_session: Asy
     
     add_exception_handlers(app)
     
-    # Override the database session dependency
-    async def override_get_db_session():
-        yield e2e_test_session
-    
-    app.dependency_overrides[get_db_session] = override_get_db_session
+    # Override the database session dependencies; reads share the test session
+    app.dependency_overrides[get_session_factory] = lambda: lambda: e2e_test_session
+    app.dependency_overrides[get_read_session_factory] = lambda: None
     
     # Override the settings
     from app.core.config import get_settings
@@ -158,7 +158,20 @@ async def e2e_test_client(e2e_test_app: FastAPI) -> AsyncGenerator[AsyncClient,
         yield client
 
 
+@pytest.fixture(scope="function")
+def e2e_statements(e2e_test_engine) -> Generator[list[str], None, None]:
+    """SQL statements sent to the E2E database while the test runs, in order."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(e2e_test_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(e2e_test_engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def e2e_test_uow(e2e_test_session: AsyncSession) -> UnitOfWork:
     """Create a test Unit of Work for E2E tests."""
-    return UnitOfWork(e2e_test_session)
\ No newline at end of file
+    return UnitOfWork(lambda: e2e_test_session)
\ No newline at end of file
@@ -1,8 +1,21 @@
+import asyncio
+import csv
+import io
+import json
 import pytest
 import uuid
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import get_catalog_service
+from app.api.response_cache import get_response_cache
+from app.db.catalog_snapshot import CatalogSnapshot, get_catalog_snapshot
+from app.core.money import Money
+from app.db.models import Cart, CartItem, Extra, Order, Pizza
+from app.db.repositories.cart_repo import CartRepo
+from app.db.repositories.customer_repo import CustomerRepo
+from app.db.repositories.order_repo import COPY_MIN_ITEMS, OrderRepo
 from app.db.uow import UnitOfWork
 
 pytestmark = pytest.mark.asyncio
@@ -54,6 +67,147 @@ class TestPizzaCatalogAPI:
         assert "tomato" in cheese_tomato["ingredients"]
         assert "cheese" in cheese_tomato["ingredients"]
 
+    async def test_filter_pizzas_by_ingredients(self, e2e_test_client: AsyncClient):
+        """Test GET /api/pizzas with all-of, any-of and exclude ingredient filters."""
+        response = await e2e_test_client.get(
+            "/api/pizzas/",
+            params={
+                "ingredients": ["tomato"],
+                "any_ingredients": ["pepperoni", "ham"],
+                "exclude_ingredients": ["onion"],
+                "page_size": 100,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        pizzas = data["items"]
+        assert data["meta"]["total"] == len(pizzas)
+        assert "Pepperoni Passion" in [pizza["name"] for pizza in pizzas]
+        for pizza in pizzas:
+            assert "tomato" in pizza["ingredients"]
+            assert {"pepperoni", "ham"} & set(pizza["ingredients"])
+            assert "onion" not in pizza["ingredients"]
+
+    async def test_fuzzy_search_pizzas(self, e2e_test_client: AsyncClient):
+        """Test GET /api/pizzas fuzzy search tolerates typos and ranks by relevance."""
+        response = await e2e_test_client.get(
+            "/api/pizzas/", params={"search": "tandori hott", "search_mode": "fuzzy"}
+        )
+
+        assert response.status_code == 200
+        pizzas = response.json()["data"]["items"]
+        assert pizzas[0]["name"] == "Tandoori Hot"
+
+        # The default mode stays a plain substring match
+        response = await e2e_test_client.get("/api/pizzas/", params={"search": "tandori"})
+        assert response.json()["data"]["items"] == []
+
+    async def test_page_pizzas_by_cursor(self, e2e_test_client: AsyncClient):
+        """Test GET /api/pizzas cursor pages cover every pizza exactly once."""
+        seen: list[str] = []
+        cursor = ""
+        while True:
+            response = await e2e_test_client.get(
+                "/api/pizzas/", params={"cursor": cursor, "page_size": 2}
+            )
+            assert response.status_code == 200
+            data = response.json()["data"]
+            seen.extend(pizza["id"] for pizza in data["items"])
+            if not data["meta"]["has_next"]:
+                break
+            cursor = data["meta"]["next_cursor"]
+
+        assert len(seen) == len(set(seen)) == data["meta"]["total"]
+
+        response = await e2e_test_client.get("/api/pizzas/", params={"cursor": "garbage"})
+        assert response.status_code == 422
+
+
+    async def test_pizza_total_modes(self, e2e_test_client: AsyncClient):
+        """Test GET /api/pizzas counts exactly, estimates, or skips the total."""
+        params: dict[str, str | int | list[str]] = {"ingredients": ["tomato"], "page_size": 2}
+        exact = (await e2e_test_client.get("/api/pizzas/", params=params)).json()["data"]
+        estimate = (
+            await e2e_test_client.get("/api/pizzas/", params={**params, "total": "estimate"})
+        ).json()["data"]
+        uncounted = (
+            await e2e_test_client.get("/api/pizzas/", params={**params, "total": "none"})
+        ).json()["data"]
+        past_end = (
+            await e2e_test_client.get("/api/pizzas/", params={**params, "page": 1000})
+        ).json()["data"]
+
+        assert exact["meta"]["total"] > 2
+        assert estimate["meta"]["total"] >= 2
+        assert uncounted["items"] == exact["items"]
+        assert uncounted["meta"]["total"] is None
+        assert uncounted["meta"]["has_next"] is True
+        assert past_end["items"] == []
+        assert past_end["meta"]["total"] == exact["meta"]["total"]
+
+
+    async def test_conditional_get_on_catalog(
+        self, e2e_test_app, e2e_test_client: AsyncClient, e2e_test_session: AsyncSession
+    ):
+        """Test catalog reads carry an ETag and revalidate to 304 without a body."""
+        get_response_cache().clear()
+        pizzas = (await e2e_test_session.scalars(select(Pizza))).all()
+        extras = (await e2e_test_session.scalars(select(Extra))).all()
+        snapshot = CatalogSnapshot(7, pizzas, extras)
+        e2e_test_app.dependency_overrides[get_catalog_snapshot] = lambda: snapshot
+
+        for url in ("/api/pizzas/", "/api/extras/"):
+            response = await e2e_test_client.get(url, headers={"Accept-Encoding": "identity"})
+            assert response.status_code == 200
+            assert response.headers["etag"] == '"catalog-7"'
+            assert "must-revalidate" in response.headers["cache-control"]
+
+            revalidated = await e2e_test_client.get(
+                url, headers={"If-None-Match": 'W/"catalog-6", "catalog-7"'}
+            )
+            assert revalidated.status_code == 304
+            assert revalidated.content == b""
+            assert revalidated.headers["etag"] == '"catalog-7"'
+
+        # A newer catalog version no longer matches
+        e2e_test_app.dependency_overrides[get_catalog_snapshot] = (
+            lambda: CatalogSnapshot(8, pizzas, extras)
+        )
+        response = await e2e_test_client.get(
+            "/api/extras/", headers={"If-None-Match": '"catalog-7"'}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"catalog-8"'
+
+
+    async def test_catalog_responses_are_replayed_from_cache(
+        self, e2e_test_app, e2e_test_client: AsyncClient, e2e_test_session: AsyncSession
+    ):
+        """Test repeated catalog reads are served from the encoded response cache."""
+        get_response_cache().clear()
+        pizzas = (await e2e_test_session.scalars(select(Pizza))).all()
+        snapshot = CatalogSnapshot(11, pizzas, [])
+        e2e_test_app.dependency_overrides[get_catalog_snapshot] = lambda: snapshot
+
+        first = await e2e_test_client.get(
+            "/api/pizzas/", params=[("ingredients", "tomato"), ("page_size", "5")]
+        )
+
+        # Hits never reach the service, and parameter order doesn't matter
+        def unavailable():
+            raise AssertionError("cache hit resolved the service")
+
+        e2e_test_app.dependency_overrides[get_catalog_service] = unavailable
+        replayed = await e2e_test_client.get(
+            "/api/pizzas/", params=[("page_size", "5"), ("ingredients", "tomato")]
+        )
+
+        assert first.status_code == replayed.status_code == 200
+        assert replayed.content == first.content
+        assert replayed.headers["content-encoding"] == "gzip"
+        assert replayed.headers["etag"] == 'W/"catalog-11"'
+
 
 class TestExtrasAPI:
     """Test the extras API endpoints."""
@@ -214,6 +368,90 @@ class TestCartAPI:
         assert cart["grand_total"] == expected_total
 
 
+    async def test_write_path_query_counts(self, e2e_test_client: AsyncClient, e2e_statements):
+        """Test adding to a cart and checking it out each cost a fixed, small number of statements."""
+        pizzas = (await e2e_test_client.get("/api/pizzas/")).json()["data"]["items"]
+        extras = (await e2e_test_client.get("/api/extras/")).json()["data"]
+        unique_identifier = "query-count-customer@example.com"
+
+        e2e_statements.clear()
+        add_response = await e2e_test_client.post(
+            "/api/carts/items",
+            json={
+                "unique_identifier": unique_identifier,
+                "pizza_id": pizzas[0]["id"],
+                "quantity": 2,
+                "extras": [extras[0]["id"]],
+            },
+        )
+        add_statements = list(e2e_statements)
+
+        e2e_statements.clear()
+        checkout_response = await e2e_test_client.post(
+            "/api/carts/checkout",
+            json={
+                "customer": {
+                    "unique_identifier": unique_identifier,
+                    "fullname": "Query Count",
+                    "full_address": "1 Counting Lane",
+                }
+            },
+        )
+        checkout_statements = list(e2e_statements)
+
+        assert add_response.status_code == 200
+        assert checkout_response.status_code == 200
+        # Cart upsert, pizza, extras, then the item INSERT ... RETURNING; nothing is read back.
+        assert len(add_statements) == 4
+        # Cart upsert, pizzas, extras, savepoint, customer upsert, order and items
+        # inserts, one DELETE for the cart's items, release.
+        assert len(checkout_statements) == 9
+        assert not any(statement.startswith("SELECT orders") for statement in checkout_statements)
+
+
+    async def test_cart_totals_are_stored_until_the_catalog_changes(
+        self, e2e_test_app, e2e_test_client: AsyncClient, e2e_test_session: AsyncSession, e2e_statements
+    ):
+        """Test cart reads serve stored totals while the catalog version holds, and reprice once it moves."""
+        pizzas = (await e2e_test_session.scalars(select(Pizza))).all()
+        extras = (await e2e_test_session.scalars(select(Extra))).all()
+        snapshot = CatalogSnapshot(21, pizzas, extras)
+        e2e_test_app.dependency_overrides[get_catalog_snapshot] = lambda: snapshot
+        unique_identifier = "stored-totals@example.com"
+
+        for quantity in (1, 2):
+            added = await e2e_test_client.post(
+                "/api/carts/items",
+                json={
+                    "unique_identifier": unique_identifier,
+                    "pizza_id": str(pizzas[0].id),
+                    "quantity": quantity,
+                    "extras": [str(extras[0].id)],
+                },
+            )
+        e2e_statements.clear()
+        stored = await e2e_test_client.get(f"/api/carts/{unique_identifier}")
+        stored_statements = list(e2e_statements)
+
+        snapshot = CatalogSnapshot(22, pizzas, extras)
+        e2e_statements.clear()
+        repriced = await e2e_test_client.get(f"/api/carts/{unique_identifier}")
+        repriced_statements = list(e2e_statements)
+        catalog_version = await e2e_test_session.scalar(
+            select(Cart.catalog_version).where(Cart.uniqueIdentifier == unique_identifier)
+        )
+
+        assert added.status_code == stored.status_code == repriced.status_code == 200
+        cart = stored.json()["data"]
+        assert cart["item_count"] == 3
+        assert cart["subtotal"] == sum(item["total_price"] for item in cart["items"])
+        assert added.json()["data"] == cart == repriced.json()["data"]
+        # Only the cart upsert: nothing is priced at an unchanged version
+        assert len(stored_statements) == 1
+        assert any("FOR UPDATE" in statement for statement in repriced_statements)
+        assert catalog_version == 22
+
+
 class TestOrderAPI:
     """Test the order management API endpoints."""
     
@@ -296,6 +534,235 @@ class TestOrderAPI:
         assert retrieved_order["unique_identifier"] == "test-customer-3@example.com"
 
 
+    async def test_page_orders_by_cursor(self, e2e_test_client: AsyncClient):
+        """Test GET /api/orders cursor pages cover every order exactly once."""
+        seen = []
+        cursor = ""
+        while True:
+            response = await e2e_test_client.get(
+                "/api/orders/", params={"cursor": cursor, "per_page": 1}
+            )
+            assert response.status_code == 200
+            body = response.json()
+            seen.extend(body["data"])
+            if not body["meta"]["has_next"]:
+                break
+            cursor = body["meta"]["next_cursor"]
+
+        ids = [order["id"] for order in seen]
+        assert len(ids) == len(set(ids)) == body["meta"]["total"]
+        # Listed orders render exactly like the single-order endpoint
+        for order in seen[:3]:
+            single = await e2e_test_client.get(f"/api/orders/{order['id']}")
+            assert single.json()["data"] == order
+
+    async def test_list_order_summaries(self, e2e_test_client: AsyncClient):
+        """Test GET /api/orders?view=summary returns headers that agree with the full orders."""
+        response = await e2e_test_client.get("/api/orders/", params={"view": "summary"})
+        assert response.status_code == 200
+        summaries = response.json()["data"]
+        assert summaries
+
+        full = await e2e_test_client.get("/api/orders/")
+        assert [order["id"] for order in full.json()["data"]] == [s["id"] for s in summaries]
+        for summary, order in zip(summaries, full.json()["data"]):
+            assert "lines" not in summary
+            assert summary["item_count"] == sum(line["quantity"] for line in order["lines"])
+            assert summary["grand_total"] == order["grand_total"]
+            assert summary["created_at"]
+
+    async def test_export_orders_as_ndjson(self, e2e_test_client: AsyncClient):
+        """Test GET /api/orders/export streams every order as one JSON document per line."""
+        response = await e2e_test_client.get("/api/orders/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="orders.ndjson"' in response.headers["content-disposition"]
+
+        exported = [json.loads(line) for line in response.text.splitlines()]
+        listed = (await e2e_test_client.get("/api/orders/", params={"per_page": 100})).json()
+        assert len(exported) == listed["meta"]["total"]
+        by_id = {order["id"]: order for order in exported}
+        for order in listed["data"]:
+            assert by_id[order["id"]] == order
+
+    async def test_export_orders_as_csv_with_filters(self, e2e_test_client: AsyncClient):
+        """Test the CSV export writes one row per order line and applies the filters."""
+        first = (await e2e_test_client.get("/api/orders/")).json()["data"][0]
+        customer = first["unique_identifier"]
+
+        response = await e2e_test_client.get(
+            "/api/orders/export", params={"format": "csv", "unique_identifier": customer}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert rows
+        assert {row["unique_identifier"] for row in rows} == {customer}
+        line = next(row for row in rows if row["order_id"] == first["id"])
+        assert float(line["grand_total"]) == first["grand_total"]
+
+        future = await e2e_test_client.get(
+            "/api/orders/export", params={"created_from": "2999-01-01T00:00:00"}
+        )
+        assert future.status_code == 200
+        assert future.text == ""
+
+    async def test_export_orders_rejects_inverted_date_range(self, e2e_test_client: AsyncClient):
+        response = await e2e_test_client.get(
+            "/api/orders/export",
+            params={"created_from": "2024-02-01T00:00:00", "created_to": "2024-01-01T00:00:00"},
+        )
+        assert response.status_code == 422
+
+    async def test_list_orders_rejects_unknown_view(self, e2e_test_client: AsyncClient):
+        response = await e2e_test_client.get("/api/orders/", params={"view": "compact"})
+        assert response.status_code == 400
+
+
+class TestCustomerRepo:
+    """Test the customer upsert against the database."""
+
+    async def test_find_or_create_writes_only_changes(
+        self, e2e_statements, e2e_test_session_maker, e2e_seed_data
+    ):
+        async def find_or_create(fullname: str, full_address: str):
+            async with e2e_test_session_maker() as session:
+                e2e_statements.clear()
+                customer = await CustomerRepo(session).find_or_create(
+                    "upsert-customer@example.com", fullname, full_address
+                )
+                await session.commit()
+                return customer, len(e2e_statements)
+
+        created, created_queries = await find_or_create("Ada", "1 Main St")
+        same, same_queries = await find_or_create("Ada", "1 Main St")
+        moved, moved_queries = await find_or_create("Ada", "2 High St")
+
+        assert created_queries == same_queries == moved_queries == 1
+        assert created.id == same.id == moved.id
+        # Nothing changed, so nothing was written
+        assert same.updated_at == created.updated_at
+        assert moved.full_address == "2 High St"
+        assert moved.updated_at > created.updated_at
+
+    async def test_concurrent_find_or_create_share_one_customer(self, e2e_test_session_maker, e2e_seed_data):
+        async def find_or_create():
+            async with e2e_test_session_maker() as session:
+                customer = await CustomerRepo(session).find_or_create(
+                    "concurrent-customer@example.com", "Grace", "3 Low St"
+                )
+                await session.commit()
+                return customer.id
+
+        ids = await asyncio.gather(*(find_or_create() for _ in range(5)))
+
+        assert len(set(ids)) == 1
+
+
+class TestCartRepo:
+    """Test cart acquisition against the database."""
+
+    async def test_find_or_create_loads_cart_in_one_statement(
+        self, e2e_statements, e2e_test_session_maker, e2e_seed_data
+    ):
+        async with e2e_test_session_maker() as session:
+            e2e_statements.clear()
+            created = await CartRepo(session).find_or_create("one-statement-cart")
+            created_queries = len(e2e_statements)
+            session.add(
+                CartItem(cart_id=created.id, pizza_id=uuid.uuid4(), quantity=2, selected_extras=[])
+            )
+            await session.commit()
+        async with e2e_test_session_maker() as session:
+            e2e_statements.clear()
+            found = await CartRepo(session).find_or_create("one-statement-cart")
+            found_queries = len(e2e_statements)
+            found_items = [item.quantity for item in found.items]
+
+        assert created_queries == found_queries == 1
+        assert created.items == []
+        assert found.id == created.id
+        assert found_items == [2]
+
+    async def test_concurrent_find_or_create_share_one_cart(self, e2e_test_session_maker, e2e_seed_data):
+        async def find_or_create():
+            async with e2e_test_session_maker() as session:
+                cart = await CartRepo(session).find_or_create("concurrent-cart")
+                await session.commit()
+                return cart.id
+
+        ids = await asyncio.gather(*(find_or_create() for _ in range(5)))
+
+        assert len(set(ids)) == 1
+
+
+    async def test_concurrent_add_to_totals_all_count(self, e2e_test_session_maker, e2e_seed_data):
+        async def add_to_totals(catalog_version: int) -> bool:
+            async with e2e_test_session_maker() as session:
+                repo = CartRepo(session)
+                cart = await repo.find_or_create("concurrent-totals-cart", catalog_version=5)
+                added = await repo.add_to_totals(cart, Money.of("2.50"), 1, catalog_version)
+                await session.commit()
+                return added
+
+        added = await asyncio.gather(*(add_to_totals(5) for _ in range(5)))
+        stale = await add_to_totals(6)
+        async with e2e_test_session_maker() as session:
+            cart = await CartRepo(session).get_by_unique_identifier("concurrent-totals-cart")
+
+        assert added == [True] * 5
+        assert stale is False
+        assert (cart.subtotal, cart.item_count, cart.catalog_version) == (Money.of("12.50"), 5, 5)
+
+
+class TestOrderRepo:
+    """Test order writes against the database."""
+
+    @pytest.mark.parametrize("lines", [3, COPY_MIN_ITEMS + 5])
+    async def test_create_round_trips_every_line(self, lines, e2e_test_session_maker, e2e_seed_data):
+        """Both the multi-row INSERT and the COPY path store lines the way they read back."""
+        async with e2e_test_session_maker() as session:
+            customer = await CustomerRepo(session).find_or_create(
+                f"bulk-order-{lines}@example.com", "Bulk Buyer", "4 Hall St"
+            )
+            order = Order(
+                id=uuid.uuid4(),
+                uniqueIdentifier=customer.uniqueIdentifier,
+                customer_id=customer.id,
+                status="created",
+                subtotal=Money.of(lines * 10),
+                extras_total=Money.of(0),
+                grand_total=Money.of(lines * 10),
+                item_count=lines,
+            )
+            items = [
+                {
+                    "id": uuid.uuid4(),
+                    "order_id": order.id,
+                    "pizza_id": uuid.uuid4(),
+                    "quantity": 1,
+                    "selected_extras": [str(uuid.uuid4())],
+                    "unit_base_price": Money.of("9.50"),
+                    "unit_extras_total": Money.of("0.50"),
+                    "line_total": Money.of(10),
+                }
+                for _ in range(lines)
+            ]
+            await OrderRepo(session).create(order, items)
+            await session.commit()
+        async with e2e_test_session_maker() as session:
+            stored = await OrderRepo(session).get(order.id)
+
+        assert len(stored.items) == lines
+        by_id = {item.id: item for item in stored.items}
+        for item in items:
+            line = by_id[item["id"]]
+            assert line.selected_extras == item["selected_extras"]
+            assert line.unit_base_price == item["unit_base_price"]
+            assert line.line_total == item["line_total"]
+            assert line.created_at == stored.created_at
+
+
 class TestIntegrationWorkflow:
     """Test complete end-to-end workflows."""
     
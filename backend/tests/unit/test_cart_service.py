@@ -3,6 +3,7 @@ import uuid
 from decimal import Decimal
 from unittest.mock import Mock, AsyncMock
 from app.services.cart_service import CartService
+from app.core.money import Money
 from app.core.exceptions import NotFoundAppError
 from app.schemas.cart import CartItemIn
 from app.schemas.customer import CustomerInfoIn
@@ -52,7 +53,7 @@ class TestCartService:
         cart.items = [cart_item]
 
         # Mock repository calls
-        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
         mock_uow.extras.get_many = AsyncMock(return_value=[extra1, extra2])
 
         # Act
@@ -63,15 +64,44 @@ class TestCartService:
         expected_total_price = expected_unit_price * 2  # 36.98
         
         assert len(result.items) == 1
-        assert result.items[0].unit_price == float(expected_unit_price)
-        assert result.items[0].total_price == float(expected_total_price)
-        assert result.subtotal == float(expected_total_price)
-        assert result.grand_total == float(expected_total_price)
+        assert result.items[0].unit_price == Money.of(expected_unit_price)
+        assert result.items[0].total_price == Money.of(expected_total_price)
+        assert result.subtotal == Money.of(expected_total_price)
+        assert result.grand_total == Money.of(expected_total_price)
         
         # Verify repository calls
-        mock_uow.pizzas.get.assert_called_once_with(pizza.id)
+        mock_uow.pizzas.get_many.assert_called_once_with([pizza.id])
         mock_uow.extras.get_many.assert_called_once_with([extra1.id, extra2.id])
 
+    @pytest.mark.asyncio
+    async def test_calculate_cart_totals_loads_catalog_once(self, cart_service, mock_uow):
+        """Test that a multi-item cart is priced from one load per catalog table"""
+        # Arrange
+        pizza1 = create_pizza(name="Margherita", base_price=Decimal("10.00"))
+        pizza2 = create_pizza(name="Hawaiian", base_price=Decimal("12.00"))
+        extra = create_extra(name="Cheese", price=Decimal("1.50"))
+
+        cart = create_cart(uniqueIdentifier="test_cart")
+        cart.items = [
+            create_cart_item(cart_id=cart.id, pizza_id=pizza1.id, quantity=1, selected_extras=[str(extra.id)]),
+            create_cart_item(cart_id=cart.id, pizza_id=pizza2.id, quantity=2, selected_extras=[str(extra.id)]),
+            create_cart_item(cart_id=cart.id, pizza_id=pizza1.id, quantity=1, selected_extras=[]),
+        ]
+
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza1, pizza2])
+        mock_uow.extras.get_many = AsyncMock(return_value=[extra])
+
+        # Act
+        result = await cart_service._calculate_cart_totals(cart)
+
+        # Assert
+        assert [item.total_price for item in result.items] == [
+            Money.of("11.50"), Money.of("27.00"), Money.of("10.00")
+        ]
+        assert result.subtotal == Money.of("48.50")
+        mock_uow.pizzas.get_many.assert_called_once_with([pizza1.id, pizza2.id])
+        mock_uow.extras.get_many.assert_called_once_with([extra.id])
+
     @pytest.mark.asyncio
     async def test_add_to_cart_pizza_not_found(self, cart_service, mock_uow):
         """Test error handling when pizza doesn't exist"""
@@ -97,6 +127,242 @@ class TestCartService:
         assert f"Pizza with id {pizza_id} not found" in str(exc_info.value)
         mock_uow.pizzas.get.assert_called_once_with(pizza_id)
 
+    @pytest.mark.asyncio
+    async def test_add_to_cart_acquires_cart_once(self, cart_service, mock_uow):
+        """Test the new item joins the loaded cart instead of the cart being fetched again"""
+        # Arrange
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        existing = create_cart_item(pizza_id=pizza.id, quantity=1, selected_extras=[])
+        cart = create_cart(uniqueIdentifier="test_cart", items=[existing])
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+
+        def flush_item(item):
+            item.id = uuid.uuid4()
+            return item
+
+        mock_uow.carts.add_item = AsyncMock(side_effect=flush_item)
+        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.add_to_cart(
+            CartItemIn(unique_identifier="test_cart", pizza_id=pizza.id, quantity=2, extras=[]),
+            "test_cart",
+        )
+
+        # Assert
+        assert [item.quantity for item in result.items] == [1, 2]
+        assert result.subtotal == Money.of("30.00")
+        mock_uow.carts.find_or_create.assert_called_once_with("test_cart", 0)
+
+    @pytest.mark.asyncio
+    async def test_get_cart_details_serves_stored_totals(self, cart_service, mock_uow):
+        """Test a cart priced at the current catalog version is served without pricing"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        item = create_cart_item(quantity=2, selected_extras=[], unit_price=Money.of("10.00"))
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[item],
+            subtotal=Money.of("20.00"), item_count=2, catalog_version=7,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+        mock_uow.pizzas.get_many = AsyncMock()
+
+        # Act
+        result = await cart_service.get_cart_details("test_cart")
+
+        # Assert
+        assert result.items[0].total_price == Money.of("20.00")
+        assert (result.subtotal, result.item_count) == (Money.of("20.00"), 2)
+        mock_uow.carts.find_or_create.assert_called_once_with("test_cart", 7)
+        mock_uow.pizzas.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_to_cart_adds_line_to_stored_totals(self, cart_service, mock_uow):
+        """Test adding to a current cart adds the line's share instead of repricing"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        existing = create_cart_item(quantity=1, selected_extras=[], unit_price=Money.of("12.00"))
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[existing],
+            subtotal=Money.of("12.00"), item_count=1, catalog_version=7,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+
+        def flush_item(item):
+            item.id = uuid.uuid4()
+            return item
+
+        mock_uow.carts.add_item = AsyncMock(side_effect=flush_item)
+        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
+        mock_uow.pizzas.get_many = AsyncMock()
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        def add_to_totals(cart, subtotal, item_count, catalog_version):
+            cart.subtotal += subtotal
+            cart.item_count += item_count
+            return True
+
+        mock_uow.carts.add_to_totals = AsyncMock(side_effect=add_to_totals)
+
+        # Act
+        result = await cart_service.add_to_cart(
+            CartItemIn(unique_identifier="test_cart", pizza_id=pizza.id, quantity=2, extras=[]),
+            "test_cart",
+        )
+
+        # Assert
+        mock_uow.carts.add_to_totals.assert_called_once_with(cart, Money.of("20.00"), 2, 7)
+        mock_uow.pizzas.get_many.assert_not_called()
+        assert [item.total_price for item in result.items] == [Money.of("12.00"), Money.of("20.00")]
+        assert (result.subtotal, result.item_count) == (Money.of("32.00"), 3)
+
+    @pytest.mark.asyncio
+    async def test_get_cart_details_reprices_after_catalog_change(self, cart_service, mock_uow):
+        """Test a cart priced at an older catalog version is repriced and stored again"""
+        # Arrange
+        mock_uow.catalog = Mock(version=8)
+        pizza = create_pizza(base_price=Decimal("11.00"))
+        item = create_cart_item(
+            pizza_id=pizza.id, quantity=2, selected_extras=[], unit_price=Money.of("10.00")
+        )
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[item],
+            subtotal=Money.of("20.00"), item_count=2, catalog_version=7,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+        mock_uow.carts.lock = AsyncMock(return_value=cart)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.get_cart_details("test_cart")
+
+        # Assert
+        mock_uow.carts.lock.assert_called_once_with(cart)
+        assert result.subtotal == Money.of("22.00")
+        assert (cart.subtotal, cart.item_count, cart.catalog_version) == (Money.of("22.00"), 2, 8)
+        assert item.unit_price == Money.of("11.00")
+
+    @pytest.mark.asyncio
+    async def test_get_cart_details_on_stale_catalog_does_not_store(self, cart_service, mock_uow):
+        """Test a worker behind the cart's catalog version prices it without storing"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        item = create_cart_item(
+            pizza_id=pizza.id, quantity=2, selected_extras=[], unit_price=Money.of("11.00")
+        )
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[item],
+            subtotal=Money.of("22.00"), item_count=2, catalog_version=8,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+        mock_uow.carts.lock = AsyncMock()
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.get_cart_details("test_cart")
+
+        # Assert
+        assert result.subtotal == Money.of("20.00")
+        mock_uow.carts.lock.assert_not_called()
+        assert (cart.subtotal, cart.catalog_version) == (Money.of("22.00"), 8)
+        assert item.unit_price == Money.of("11.00")
+
+    @pytest.mark.asyncio
+    async def test_reprice_skips_storing_when_cart_moved_ahead(self, cart_service, mock_uow):
+        """Test a cart stored at a newer version while waiting for the lock isn't rolled back"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        item = create_cart_item(
+            pizza_id=pizza.id, quantity=1, selected_extras=[], unit_price=Money.of("9.00")
+        )
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[item],
+            subtotal=Money.of("9.00"), item_count=1, catalog_version=6,
+        )
+
+        def lock(cart):
+            cart.catalog_version = 8
+            return cart
+
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+        mock_uow.carts.lock = AsyncMock(side_effect=lock)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.get_cart_details("test_cart")
+
+        # Assert: the totals are left for a worker on the newer catalog to reprice
+        assert result.subtotal == Money.of("10.00")
+        assert (cart.subtotal, cart.catalog_version) == (Money.of("9.00"), 0)
+        assert item.unit_price == Money.of("9.00")
+
+    @pytest.mark.asyncio
+    async def test_add_to_cart_on_stale_catalog_invalidates_totals(self, cart_service, mock_uow):
+        """Test adding on a worker behind the cart's version clears the stored version"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[],
+            subtotal=Money.of("0.00"), item_count=0, catalog_version=8,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+
+        def flush_item(item):
+            item.id = uuid.uuid4()
+            return item
+
+        mock_uow.carts.add_item = AsyncMock(side_effect=flush_item)
+        mock_uow.carts.add_to_totals = AsyncMock()
+        mock_uow.carts.lock = AsyncMock()
+        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.add_to_cart(
+            CartItemIn(unique_identifier="test_cart", pizza_id=pizza.id, quantity=1, extras=[]),
+            "test_cart",
+        )
+
+        # Assert
+        assert result.subtotal == Money.of("10.00")
+        mock_uow.carts.add_to_totals.assert_not_called()
+        mock_uow.carts.lock.assert_not_called()
+        assert (cart.subtotal, cart.catalog_version) == (Money.of("0.00"), 0)
+
+    @pytest.mark.asyncio
+    async def test_get_cart_details_reprices_unpriced_item(self, cart_service, mock_uow):
+        """Test a current cart holding an item without a stored price is repriced"""
+        # Arrange
+        mock_uow.catalog = Mock(version=7)
+        pizza = create_pizza(base_price=Decimal("10.00"))
+        item = create_cart_item(pizza_id=pizza.id, quantity=2, selected_extras=[], unit_price=None)
+        cart = create_cart(
+            uniqueIdentifier="test_cart", items=[item],
+            subtotal=Money.of("0.00"), item_count=0, catalog_version=7,
+        )
+        mock_uow.carts.find_or_create = AsyncMock(return_value=cart)
+        mock_uow.carts.lock = AsyncMock(return_value=cart)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act
+        result = await cart_service.get_cart_details("test_cart")
+
+        # Assert
+        mock_uow.pizzas.get_many.assert_called_once_with([pizza.id])
+        assert (result.subtotal, result.item_count) == (Money.of("20.00"), 2)
+        assert item.unit_price == Money.of("10.00")
+
     @pytest.mark.asyncio
     async def test_checkout_empty_cart(self, cart_service, mock_uow, order_service_mock):
         """Test validation for empty cart checkout"""
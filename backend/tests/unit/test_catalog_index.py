@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.db.catalog_index import IngredientIndex, TrigramIndex, iter_bits, trigrams
+from app.db.catalog_snapshot import CatalogSnapshot
+from app.db.repositories.pizza_repo import PizzaRepo
+from app.schemas.pagination import Cursor
+from tests.conftest import create_pizza
+
+
+@pytest.fixture
+def menu():
+    return [
+        create_pizza(name="Cheese & Tomato", base_price=Decimal("11.90"), ingredients=["tomato", "cheese"]),
+        create_pizza(name="Pepperoni Passion", base_price=Decimal("16.90"), ingredients=["tomato", "pepperoni", "cheese"]),
+        create_pizza(name="Hawaiian", base_price=Decimal("14.90"), ingredients=["tomato", "ham", "pineapple", "cheese"]),
+        create_pizza(name="Vegi Supreme", base_price=Decimal("15.90"), ingredients=["tomato", "onion", "mushrooms"]),
+        create_pizza(name="Retired", ingredients=["tomato"], is_active=False),
+    ]
+
+
+def names(pizzas):
+    return [pizza.name for pizza in pizzas]
+
+
+class TestIngredientIndex:
+    """Test cases for the in-memory ingredient bitset index"""
+
+    def test_iter_bits(self):
+        assert list(iter_bits(0)) == []
+        assert list(iter_bits(0b101001)) == [0, 3, 5]
+        assert list(iter_bits(1 << 500)) == [500]
+
+    def test_all_any_and_exclude_filters(self, menu):
+        index = IngredientIndex(menu[:4])
+
+        assert names(index.select(index.match(all_of=["tomato", "cheese"]))) == [
+            "Cheese & Tomato", "Pepperoni Passion", "Hawaiian",
+        ]
+        assert names(index.select(index.match(any_of=["ham", "onion"]))) == [
+            "Hawaiian", "Vegi Supreme",
+        ]
+        assert names(index.select(index.match(all_of=["tomato"], none_of=["cheese"]))) == [
+            "Vegi Supreme",
+        ]
+        assert index.match(all_of=["anchovies"]) == 0
+        assert index.match(none_of=["anchovies"]) == index.all
+
+    def test_select_slices_in_index_order(self, menu):
+        index = IngredientIndex(menu[:4])
+        mask = index.match(all_of=["tomato"])
+
+        assert names(index.select(mask, 1, 3)) == ["Pepperoni Passion", "Hawaiian"]
+
+
+class TestTrigramIndex:
+    """Test cases for the in-memory fuzzy name index"""
+
+    def test_trigrams_match_pg_trgm(self):
+        # SELECT show_trgm('Cheese & Tomato')
+        assert trigrams("Cheese & Tomato") == {
+            "  c", " ch", "che", "hee", "ees", "ese", "se ",
+            "  t", " to", "tom", "oma", "mat", "ato", "to ",
+        }
+
+    def test_typos_match_and_rank_by_relevance(self, menu):
+        index = TrigramIndex(menu[:4])
+
+        assert names(index.search("peperoni")) == ["Pepperoni Passion"]
+        assert names(index.search("hawaian")) == ["Hawaiian"]
+        assert names(index.search("tomato")) == ["Cheese & Tomato"]
+        assert index.search("anchovies") == []
+        assert index.search("") == []
+
+    def test_exact_matches_rank_first(self):
+        index = TrigramIndex([
+            create_pizza(name="Pepperoni Feast"),
+            create_pizza(name="Pepperoni"),
+            create_pizza(name="Peperonata"),
+        ])
+
+        assert names(index.search("pepperoni")) == ["Pepperoni", "Pepperoni Feast"]
+
+    def test_search_restricted_to_positions(self, menu):
+        index = TrigramIndex(menu[:4])
+
+        assert index.search("peperoni", positions=[0, 2]) == []
+
+
+class TestCachedPizzaListing:
+    """Test cases for PizzaRepo.get_all served from the catalog snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_pages_without_queries(self, menu):
+        # Arrange
+        session = Mock()
+        repo = PizzaRepo(session, catalog=CatalogSnapshot(1, menu, []))
+
+        # Act
+        page, total = await repo.get_all(
+            ingredients=["cheese"], exclude_ingredients=["ham"], page=1, page_size=1
+        )
+        searched, searched_total = await repo.get_all(search="PEPP")
+        priced, priced_total = await repo.get_all(min_price=12.0, max_price=15.0)
+
+        # Assert
+        assert names(page) == ["Cheese & Tomato"]
+        assert total == 2
+        assert names(searched) == ["Pepperoni Passion"]
+        assert searched_total == 1
+        assert names(priced) == ["Hawaiian"]
+        assert priced_total == 1
+        assert not session.mock_calls
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_search_combines_with_ingredient_filters(self, menu):
+        repo = PizzaRepo(Mock(), catalog=CatalogSnapshot(1, menu, []))
+
+        matched, total = await repo.get_all(search="hawaian", search_mode="fuzzy")
+        excluded, _ = await repo.get_all(
+            search="hawaian", search_mode="fuzzy", exclude_ingredients=["ham"]
+        )
+
+        assert names(matched) == ["Hawaiian"]
+        assert total == 1
+        assert excluded == []
+
+    @pytest.mark.asyncio
+    async def test_inactive_pizzas_are_not_listed(self, menu):
+        repo = PizzaRepo(Mock(), catalog=CatalogSnapshot(1, menu, []))
+
+        pizzas, total = await repo.get_all(page_size=100)
+
+        assert "Retired" not in names(pizzas)
+        assert total == 4
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_follow_creation_order(self, menu):
+        # Arrange: created newest first, so keyset order reverses load order
+        start = datetime(2024, 1, 1)
+        for age, pizza in enumerate(reversed(menu)):
+            pizza.created_at = start + timedelta(minutes=age)
+        repo = PizzaRepo(Mock(), catalog=CatalogSnapshot(1, menu, []))
+
+        # Act
+        first, total = await repo.get_all(keyset=True, page_size=2)
+        second, _ = await repo.get_all(keyset=True, after=Cursor.after(first[1]), page_size=2)
+        second_again, _ = await repo.get_all(
+            keyset=True, after=Cursor.after(first[1]), page=3, page_size=2
+        )
+        cheesy, cheesy_total = await repo.get_all(
+            keyset=True, ingredients=["cheese"], min_price=12.0, page_size=1
+        )
+
+        # Assert: each page carries one lookahead row when more follow
+        assert names(first) == ["Vegi Supreme", "Hawaiian", "Pepperoni Passion"]
+        assert total == 4
+        assert names(second) == ["Pepperoni Passion", "Cheese & Tomato"]
+        assert names(second_again) == names(second)
+        assert names(cheesy) == ["Hawaiian", "Pepperoni Passion"]
+        assert cheesy_total == 2
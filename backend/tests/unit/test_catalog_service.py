@@ -35,7 +35,7 @@ class TestCatalogService:
         total_count = 2
 
         # Mock repository calls
-        mock_uow.pizzas.get_all = AsyncMock(return_value=(pizzas, total_count))
+        mock_uow.pizzas.get_listing = AsyncMock(return_value=(pizzas, total_count))
 
         # Act
         result = await catalog_service.list_pizzas(
@@ -56,13 +56,19 @@ class TestCatalogService:
         assert result.meta.per_page == 10
 
         # Verify repository was called with correct parameters
-        mock_uow.pizzas.get_all.assert_called_once_with(
+        mock_uow.pizzas.get_listing.assert_called_once_with(
             search="pizza",
             ingredients=["tomato"],
+            any_ingredients=None,
+            exclude_ingredients=None,
             min_price=10.0,
             max_price=20.0,
             page=1,
-            page_size=10
+            page_size=10,
+            search_mode="contains",
+            keyset=False,
+            after=None,
+            total_mode="exact",
         )
 
     @pytest.mark.asyncio
@@ -0,0 +1,106 @@
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.db.catalog_snapshot import CatalogCache, CatalogSnapshot
+from app.db.repositories.extra_repo import ExtraRepo
+from app.db.repositories.pizza_repo import PizzaRepo
+from tests.conftest import create_extra, create_pizza
+
+
+def create_catalog_session(version, pizzas, extras):
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.scalar = AsyncMock(return_value=version)
+    session.scalars = AsyncMock(
+        side_effect=lambda query: Mock(
+            all=Mock(return_value=pizzas if "pizzas" in str(query) else extras)
+        )
+    )
+    return session
+
+
+class TestCatalogSnapshot:
+    """Test cases for the cached catalog and the repositories reading from it"""
+
+    def test_snapshot_is_read_only(self):
+        pizza = create_pizza()
+        active = create_extra(name="Cheese")
+        inactive = create_extra(name="Anchovies", is_active=False)
+
+        snapshot = CatalogSnapshot(3, [pizza], [active, inactive])
+
+        assert snapshot.version == 3
+        assert snapshot.pizzas[pizza.id] is pizza
+        assert snapshot.active_extras == (active,)
+        with pytest.raises(TypeError):
+            snapshot.pizzas[uuid.uuid4()] = pizza  # type: ignore[index]
+
+    @pytest.mark.asyncio
+    async def test_repositories_serve_snapshot_rows_without_queries(self):
+        """Hot-path lookups are answered from the snapshot with no DB round trip"""
+        # Arrange
+        pizza = create_pizza()
+        extra = create_extra()
+        snapshot = CatalogSnapshot(1, [pizza], [extra])
+        session = Mock()
+        session.get = AsyncMock()
+        session.execute = AsyncMock()
+        pizzas = PizzaRepo(session, catalog=snapshot)
+        extras = ExtraRepo(session, catalog=snapshot)
+
+        # Act
+        fetched_pizza = await pizzas.get(pizza.id)
+        many_pizzas = await pizzas.get_many([pizza.id])
+        fetched_extras = await extras.get_many([extra.id])
+        all_extras = await extras.get_all()
+
+        # Assert
+        assert fetched_pizza is pizza
+        assert many_pizzas == [pizza]
+        assert fetched_extras == [extra]
+        assert list(all_extras) == [extra]
+        session.get.assert_not_awaited()
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rows_missing_from_snapshot_fall_back_to_db(self):
+        """Rows added after the snapshot was taken are still found"""
+        # Arrange
+        cached = create_pizza(name="Cached")
+        new = create_pizza(name="New")
+        session = Mock()
+        session.execute = AsyncMock(
+            return_value=Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[new]))))
+        )
+        repo = PizzaRepo(session, catalog=CatalogSnapshot(1, [cached], []))
+
+        # Act
+        result = await repo.get_many([cached.id, new.id])
+
+        # Assert
+        assert result == [cached, new]
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_reloads_only_when_version_changes(self):
+        # Arrange
+        pizza = create_pizza()
+        session = create_catalog_session(1, [pizza], [])
+        cache = CatalogCache(lambda: session)
+        await cache.load()
+        first = cache.snapshot
+
+        # Act
+        unchanged = await cache.refresh()
+        session.scalar.return_value = 2
+        changed = await cache.refresh()
+
+        # Assert
+        assert unchanged is False
+        assert changed is True
+        assert first is not None and first.version == 1
+        assert cache.snapshot is not first
+        assert cache.snapshot.version == 2
@@ -0,0 +1,82 @@
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.money import Money
+from app.core.price_rules import PriceCalculator
+from app.db.types import MoneyType
+from tests.conftest import create_extra, create_pizza
+
+
+class PriceOut(BaseModel):
+    price: Money
+
+
+class TestMoney:
+    """Unit tests for the integer-cents money type"""
+
+    @pytest.mark.parametrize(
+        "amount, cents",
+        [
+            (Decimal("12.99"), 1299),
+            (Decimal("2.5"), 250),
+            (12.99, 1299),
+            (0.1, 10),
+            (7, 700),
+            ("15.30", 1530),
+            (Decimal("0.125"), 12),  # half-even
+        ],
+    )
+    def test_of_converts_major_units_to_cents(self, amount, cents):
+        assert Money.of(amount).cents == cents
+
+    def test_arithmetic_is_exact(self):
+        """Test that adding cents never drifts the way floats do"""
+        total = sum(Money.of(0.1) for _ in range(10))
+
+        assert total == Money.of(1)
+        assert Money.of("11.90") + Money.of("2.00") + Money.of("1.40") == Money.of("15.30")
+        assert Money.of("15.30") * 3 == Money.of("45.90")
+        assert Money.of("5.00") - Money.of("1.25") == Money.of("3.75")
+
+    def test_conversions(self):
+        money = Money.of("30.60")
+
+        assert money.to_decimal() == Decimal("30.60")
+        assert float(money) == 30.6
+        assert str(money) == "30.60"
+
+    def test_pydantic_validates_and_serializes_as_number(self):
+        model = PriceOut(price=Decimal("12.99"))
+
+        assert model.price == Money(1299)
+        assert model.model_dump() == {"price": 12.99}
+        assert json.loads(model.model_dump_json()) == {"price": 12.99}
+        assert PriceOut.model_validate_json('{"price": 2.5}').price == Money(250)
+        assert PriceOut.model_json_schema()["properties"]["price"]["type"] == "number"
+
+    def test_column_type_round_trip(self):
+        column = MoneyType()
+
+        assert column.process_bind_param(Money(1299), None) == Decimal("12.99")
+        assert column.process_bind_param(10.5, None) == Decimal("10.50")
+        assert column.process_result_value(Decimal("12.99"), None) == Money(1299)
+        assert column.process_result_value(None, None) is None
+
+
+class TestPriceCalculator:
+    """Unit tests for line pricing"""
+
+    def test_line_total(self):
+        pizza = create_pizza(base_price=Decimal("11.90"))
+        extras = [
+            create_extra(price=Decimal("2.00")),
+            create_extra(price=Decimal("1.40")),
+        ]
+
+        assert PriceCalculator.calculate_extras_total(extras) == Money.of("3.40")
+        assert PriceCalculator.calculate_unit_price(pizza, extras) == Money.of("15.30")
+        assert PriceCalculator.calculate_line_total(pizza, extras, 2) == Money.of("30.60")
+        assert PriceCalculator.calculate_unit_price(pizza, []) == Money.of("11.90")
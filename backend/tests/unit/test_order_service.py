@@ -1,11 +1,14 @@
 import pytest
 import uuid
 from decimal import Decimal
+from datetime import datetime
 from unittest.mock import Mock, AsyncMock
 from app.services.order_service import OrderService
-from app.core.exceptions import NotFoundAppError
+from app.core.money import Money
+from app.core.exceptions import NotFoundAppError, ValidationAppError
 from app.schemas.order import OrderLineIn, OrderIn, QuoteOut
 from app.schemas.customer import CustomerInfoIn
+from app.schemas.pagination import Cursor
 from tests.conftest import create_pizza, create_extra, create_customer, create_order
 
 
@@ -56,22 +59,8 @@ class TestOrderService:
         ]
 
         # Mock repository calls
-        async def mock_pizza_get(pizza_id):
-            if pizza_id == pizza1.id:
-                return pizza1
-            elif pizza_id == pizza2.id:
-                return pizza2
-            return None
-
-        async def mock_extra_get(extra_id):
-            if extra_id == extra1.id:
-                return extra1
-            elif extra_id == extra2.id:
-                return extra2
-            return None
-
-        mock_uow.pizzas.get = AsyncMock(side_effect=mock_pizza_get)
-        mock_uow.extras.get = AsyncMock(side_effect=mock_extra_get)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza1, pizza2])
+        mock_uow.extras.get_many = AsyncMock(return_value=[extra1, extra2])
 
         # Act
         result = await order_service.calculate_quote(order_lines)
@@ -84,21 +73,25 @@ class TestOrderService:
         line1 = result.lines[0]
         assert line1.pizza_id == pizza1.id
         assert line1.quantity == 2
-        assert line1.unit_base_price == 12.99
-        assert line1.unit_extras_total == 2.50
-        assert line1.line_total == 30.98
+        assert line1.unit_base_price == Money.of("12.99")
+        assert line1.unit_extras_total == Money.of("2.50")
+        assert line1.line_total == Money.of("30.98")
 
         # Second line: 1 x (15.99 + 2.50 + 1.75) = 20.24
         line2 = result.lines[1]
         assert line2.pizza_id == pizza2.id
         assert line2.quantity == 1
-        assert line2.unit_base_price == 15.99
-        assert line2.unit_extras_total == 4.25
-        assert line2.line_total == 20.24
+        assert line2.unit_base_price == Money.of("15.99")
+        assert line2.unit_extras_total == Money.of("4.25")
+        assert line2.line_total == Money.of("20.24")
+
+        # Catalog rows are loaded in one batch per table
+        mock_uow.pizzas.get_many.assert_called_once_with([pizza1.id, pizza2.id])
+        mock_uow.extras.get_many.assert_called_once_with([extra1.id, extra2.id])
 
         # Totals
-        expected_subtotal = (12.99 * 2) + (15.99 * 1)  # 41.97
-        expected_extras_total = (2.50 * 2) + (4.25 * 1)  # 9.25
+        expected_subtotal = Money.of("12.99") * 2 + Money.of("15.99") * 1  # 41.97
+        expected_extras_total = Money.of("2.50") * 2 + Money.of("4.25") * 1  # 9.25
         expected_grand_total = expected_subtotal + expected_extras_total  # 51.22
 
         assert result.subtotal == expected_subtotal
@@ -150,8 +143,8 @@ class TestOrderService:
         )
 
         # Mock repository calls
-        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
-        mock_uow.extras.get = AsyncMock(return_value=extra)
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[extra])
         mock_uow.customers.find_or_create = AsyncMock(return_value=customer)
         mock_uow.orders.create = AsyncMock(return_value=created_order)
 
@@ -161,9 +154,9 @@ class TestOrderService:
         # Assert
         assert result.unique_identifier == "test_customer"
         assert result.status == "created"
-        assert result.subtotal == 12.99
-        assert result.extras_total == 2.50
-        assert result.grand_total == 15.49
+        assert result.subtotal == Money.of("12.99")
+        assert result.extras_total == Money.of("2.50")
+        assert result.grand_total == Money.of("15.49")
 
         # Verify repository calls
         mock_uow.customers.find_or_create.assert_called_once_with(
@@ -172,6 +165,12 @@ class TestOrderService:
             full_address="123 Test St"
         )
         mock_uow.orders.create.assert_called_once()
+        # Lines are passed as order_items rows and rendered from them
+        order, items = mock_uow.orders.create.call_args.args
+        assert [item["order_id"] for item in items] == [order.id]
+        assert [line.id for line in result.lines] == [items[0]["id"]]
+        assert result.lines[0].extras == [extra.id]
+        assert result.lines[0].line_total == Money.of("15.49")
 
     @pytest.mark.asyncio
     async def test_calculate_quote_invalid_extra(self, order_service, mock_uow):
@@ -193,12 +192,152 @@ class TestOrderService:
         ]
 
         # Mock repository calls
-        mock_uow.pizzas.get = AsyncMock(return_value=pizza)
-        mock_uow.extras.get = AsyncMock(return_value=None)  # Extra not found
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])  # Extra not found
 
         # Act & Assert
         with pytest.raises(NotFoundAppError) as exc_info:
             await order_service.calculate_quote(order_lines)
         
         assert f"Extra with id {invalid_extra_id} not found" in str(exc_info.value)
-        mock_uow.extras.get.assert_called_with(invalid_extra_id)
\ No newline at end of file
+        mock_uow.extras.get_many.assert_called_with([invalid_extra_id])
+
+    @pytest.mark.asyncio
+    async def test_calculate_quote_reports_all_unknown_ids(self, order_service, mock_uow):
+        """Test that every unknown pizza and extra is reported in one error"""
+        # Arrange
+        pizza = create_pizza(id=uuid.uuid4())
+        missing_pizza_id = uuid.uuid4()
+        missing_extra_ids = [uuid.uuid4(), uuid.uuid4()]
+
+        order_lines = [
+            OrderLineIn(pizza_id=pizza.id, quantity=1, extras=[missing_extra_ids[0]]),
+            OrderLineIn(pizza_id=missing_pizza_id, quantity=1, extras=[missing_extra_ids[1]]),
+        ]
+
+        mock_uow.pizzas.get_many = AsyncMock(return_value=[pizza])
+        mock_uow.extras.get_many = AsyncMock(return_value=[])
+
+        # Act & Assert
+        with pytest.raises(NotFoundAppError) as exc_info:
+            await order_service.calculate_quote(order_lines)
+
+        message = str(exc_info.value)
+        assert f"Pizza with id {missing_pizza_id} not found" in message
+        assert f"Extras with ids {missing_extra_ids[0]}, {missing_extra_ids[1]} not found" in message
+    @pytest.mark.asyncio
+    async def test_get_all_orders_by_cursor(self, order_service, mock_uow):
+        """Test keyset paging trims the lookahead row and hands out the next cursor"""
+        # Arrange
+        orders = [create_order(items=[]) for _ in range(3)]
+        after = Cursor.after(create_order())
+        mock_uow.orders.get_listing = AsyncMock(return_value=(orders, 7))
+
+        # Act
+        result = await order_service.get_all_orders(limit=2, cursor=after.encode())
+
+        # Assert
+        assert [order.id for order in result.items] == [orders[0].id, orders[1].id]
+        assert result.meta.total == 7
+        assert Cursor.decode(result.meta.next_cursor) == Cursor.after(orders[1])
+        mock_uow.orders.get_listing.assert_called_once_with(
+            unique_identifier=None,
+            skip=0,
+            limit=2,
+            keyset=True,
+            after=after,
+            total_mode="exact",
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_all_orders_without_total(self, order_service, mock_uow):
+        """Test total=none skips counting and reads has_next off the lookahead row"""
+        orders = [create_order(items=[]) for _ in range(3)]
+        mock_uow.orders.get_listing = AsyncMock(return_value=(orders, None))
+
+        result = await order_service.get_all_orders(skip=2, limit=2, total_mode="none")
+
+        assert len(result.items) == 2
+        assert result.meta.page == 2
+        assert result.meta.total is None
+        assert result.meta.pages is None
+        assert result.meta.has_next is True
+        assert result.meta.has_prev is True
+
+    @pytest.mark.asyncio
+    async def test_get_all_orders_rejects_malformed_cursor(self, order_service, mock_uow):
+        """Test a tampered cursor is a validation error raised before any query"""
+        mock_uow.orders.get_listing = AsyncMock()
+
+        with pytest.raises(ValidationAppError):
+            await order_service.get_all_orders(cursor="not-a-cursor")
+
+        mock_uow.orders.get_listing.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_orders_from_row_dicts(self, order_service, mock_uow):
+        """Test listing rows come back as dicts and map straight onto OrderOut"""
+        # Arrange
+        extra_id = uuid.uuid4()
+        orders = [
+            {
+                "id": uuid.uuid4(),
+                "uniqueIdentifier": "customer@example.com",
+                "status": "pending",
+                "subtotal": Money.of("12.99"),
+                "extras_total": Money.of("2.50"),
+                "grand_total": Money.of("15.49"),
+                "created_at": datetime(2024, 1, 1, 12, 0),
+                "items": [
+                    {
+                        "order_id": None,
+                        "id": uuid.uuid4(),
+                        "pizza_id": uuid.uuid4(),
+                        "quantity": 1,
+                        "selected_extras": [str(extra_id)],
+                        "unit_base_price": Money.of("12.99"),
+                        "unit_extras_total": Money.of("2.50"),
+                        "line_total": Money.of("15.49"),
+                    }
+                ],
+            }
+            for _ in range(2)
+        ]
+        mock_uow.orders.get_listing = AsyncMock(return_value=(orders, 2))
+
+        # Act
+        result = await order_service.get_all_orders(limit=1, cursor="")
+
+        # Assert
+        [order] = result.items
+        assert order.unique_identifier == "customer@example.com"
+        assert order.grand_total == Money.of("15.49")
+        assert order.lines[0].extras == [extra_id]
+        assert Cursor.decode(result.meta.next_cursor) == Cursor.after(orders[0])
+
+    @pytest.mark.asyncio
+    async def test_get_all_orders_summary_view(self, order_service, mock_uow):
+        """Test view=summary pages order headers without loading lines"""
+        # Arrange
+        summary = {
+            "id": uuid.uuid4(),
+            "uniqueIdentifier": "customer@example.com",
+            "status": "created",
+            "item_count": 3,
+            "subtotal": Money.of("30.00"),
+            "extras_total": Money.of("0.00"),
+            "grand_total": Money.of("30.00"),
+            "created_at": datetime(2024, 1, 1, 12, 0),
+        }
+        mock_uow.orders.get_summaries = AsyncMock(return_value=([summary], 1))
+        mock_uow.orders.get_listing = AsyncMock()
+
+        # Act
+        result = await order_service.get_all_orders(view="summary")
+
+        # Assert
+        [item] = result.items
+        assert item.item_count == 3
+        assert item.unique_identifier == "customer@example.com"
+        assert result.meta.total == 1
+        mock_uow.orders.get_listing.assert_not_called()
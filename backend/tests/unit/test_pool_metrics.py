@@ -0,0 +1,87 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool_metrics import Histogram, InstrumentedPoolMixin, instrument_pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class TestPoolMetrics:
+    """Test cases for connection-pool instrumentation"""
+
+    @pytest.fixture
+    def pool(self):
+        return InstrumentedQueuePool(creator=Mock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    def test_tracks_checkouts_overflow_and_churn(self, pool):
+        """Checked-out, idle and overflow gauges follow the pool, counters follow its events"""
+        # Arrange
+        metrics = instrument_pool(pool)
+
+        # Act
+        first = pool.connect()
+        second = pool.connect()
+        busy = metrics.snapshot()
+        second.close()
+        first.close()
+        idle = metrics.snapshot()
+
+        # Assert
+        assert busy["checked_out"] == 2
+        assert busy["overflow"] == 1
+        assert busy["saturation"] == 1.0
+        assert idle["checked_out"] == 0
+        assert idle["idle"] == 1
+        assert idle["checkouts"] == 2
+        assert idle["checkins"] == 2
+        assert idle["connects"] == 2
+        # The overflow connection is closed on checkin because the pool is full.
+        assert idle["disconnects"] == 1
+        assert idle["checkout_wait_seconds"]["count"] == 2
+
+    def test_counts_checkout_timeouts(self, pool):
+        """A caller that gives up waiting for a connection is counted as a timeout"""
+        # Arrange
+        metrics = instrument_pool(pool)
+        held = [pool.connect(), pool.connect()]
+
+        # Act
+        with pytest.raises(Exception):
+            pool.connect()
+
+        # Assert
+        assert metrics.checkout_timeouts == 1
+        assert metrics.checkout_wait.count == 3
+        for conn in held:
+            conn.close()
+
+    def test_metrics_survive_pool_recreate(self, pool):
+        """engine.dispose() recreates the pool; metrics keep pointing at the live pool"""
+        # Arrange
+        metrics = instrument_pool(pool)
+
+        # Act
+        new_pool = pool.recreate()
+        new_pool.connect().close()
+
+        # Assert
+        assert metrics.pool is new_pool
+        assert metrics.checkouts == 1
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram snapshots report cumulative counts per upper bound"""
+        # Arrange
+        histogram = Histogram((0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value)
+
+        # Assert
+        snapshot = histogram.snapshot()
+        assert [b["count"] for b in snapshot["buckets"]] == [1, 3, 4]
+        assert snapshot["count"] == 4
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+from app.db.replicas import ReplicaRouter
+
+
+class TestReplicaRouter:
+    """Test cases for read-replica selection"""
+
+    def test_round_robins_over_healthy_replicas(self):
+        """Sessions rotate across replicas and skip the ones out of rotation"""
+        # Arrange
+        router = ReplicaRouter([Mock(), Mock(), Mock()], max_lag_seconds=5)
+        for replica in router.replicas:
+            replica.session_maker = Mock(return_value=replica)
+        router.replicas[1].healthy = False
+
+        # Act
+        picked = [router.session() for _ in range(4)]
+
+        # Assert
+        assert picked == [
+            router.replicas[0],
+            router.replicas[2],
+            router.replicas[0],
+            router.replicas[2],
+        ]
+
+    def test_returns_none_when_no_replica_is_healthy(self):
+        """Callers fall back to the primary when every replica is lagging"""
+        # Arrange
+        router = ReplicaRouter([Mock(), Mock()], max_lag_seconds=5)
+        for replica in router.replicas:
+            replica.healthy = False
+
+        # Act & Assert
+        assert router.session() is None
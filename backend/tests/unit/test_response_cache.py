@@ -0,0 +1,73 @@
+import gzip
+from unittest.mock import Mock
+
+from fastapi import Response
+
+from app.api.response_cache import ResponseCache, etag_matches
+
+
+def create_response(body: bytes, version: int = 1) -> Response:
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"ETag": f'"catalog-{version}"', "Cache-Control": "public, max-age=0"},
+    )
+
+
+def create_request(**headers):
+    return Mock(headers=headers)
+
+
+class TestResponseCache:
+    """Test cases for the encoded catalog response cache"""
+
+    def test_etag_matches_uses_weak_comparison(self):
+        assert etag_matches('"catalog-2"', '"catalog-2"')
+        assert etag_matches('W/"catalog-1", W/"catalog-2"', '"catalog-2"')
+        assert etag_matches("*", '"catalog-2"')
+        assert not etag_matches('"catalog-1"', '"catalog-2"')
+        assert not etag_matches(None, '"catalog-2"')
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(1, ("/api/pizzas/", ""), create_response(b"a"))
+        cache.put(1, ("/api/extras/", ""), create_response(b"b"))
+
+        # Touch the pizzas entry so extras is the least recently used
+        assert cache.get(1, ("/api/pizzas/", "")) is not None
+        cache.put(1, ("/api/pizzas/", "page=2"), create_response(b"c"))
+
+        assert len(cache) == 2
+        assert cache.get(1, ("/api/extras/", "")) is None
+        assert cache.get(1, ("/api/pizzas/", "")).body == b"a"
+
+    def test_new_catalog_version_invalidates_entries(self):
+        cache = ResponseCache(max_entries=10)
+        cache.put(1, ("/api/extras/", ""), create_response(b"old"))
+
+        assert cache.get(2, ("/api/extras/", "")) is None
+        cache.put(2, ("/api/pizzas/", ""), create_response(b"new", version=2))
+        # Late writes from requests that started on the old snapshot are not kept
+        cache.put(1, ("/api/extras/", ""), create_response(b"old"))
+
+        assert cache.get(1, ("/api/extras/", "")) is None
+        assert cache.get(2, ("/api/extras/", "")) is None
+        assert len(cache) == 1
+
+    def test_replays_bytes_gzip_and_not_modified(self):
+        cache = ResponseCache(max_entries=10, compress_min_bytes=10)
+        body = b'{"data": "' + b"x" * 100 + b'"}'
+        entry = cache.put(1, ("/api/extras/", ""), create_response(body))
+
+        plain = entry.respond(create_request())
+        compressed = entry.respond(create_request(**{"accept-encoding": "gzip, br"}))
+        not_modified = entry.respond(create_request(**{"if-none-match": 'W/"catalog-1"'}))
+
+        assert plain.body == body
+        assert plain.headers["etag"] == '"catalog-1"'
+        assert plain.headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(compressed.body) == body
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["etag"] == 'W/"catalog-1"'
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
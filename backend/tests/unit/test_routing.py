@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Response as HTTPResponse
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from app.api.routing import FastJSONRoute
+from app.core.money import Money
+from app.core.response import Response, ok
+from app.schemas.catalog import ExtraOut
+
+
+EXTRA_ID = uuid.uuid4()
+
+
+def tag_response(response: HTTPResponse) -> None:
+    response.headers["X-Tag"] = "dependency"
+
+
+def build_app(route_class: type[APIRoute]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.post(
+        "/extras",
+        response_model=Response[list[ExtraOut]],
+        status_code=201,
+        dependencies=[Depends(tag_response)],
+    )
+    async def create_extras():
+        extra = ExtraOut(id=EXTRA_ID, name="Cheese", price=Money.of("1.50"), is_active=True)
+        return ok([extra])
+
+    @router.get("/raw")
+    async def raw():
+        return {"plain": "dict"}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+class TestFastJSONRoute:
+    """Test cases for rendering already-validated models in one pass"""
+
+    @pytest.mark.asyncio
+    async def test_matches_response_model_rendering(self):
+        responses = {}
+        for route_class in (APIRoute, FastJSONRoute):
+            async with AsyncClient(app=build_app(route_class), base_url="http://test") as client:
+                responses[route_class] = await client.post("/extras")
+
+        default, fast = responses[APIRoute], responses[FastJSONRoute]
+        assert fast.status_code == default.status_code == 201
+        assert fast.json() == default.json()
+        assert fast.json()["data"][0]["price"] == 1.5
+        assert fast.headers["x-tag"] == "dependency"
+        assert fast.headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_non_model_results_take_the_default_path(self):
+        async with AsyncClient(app=build_app(FastJSONRoute), base_url="http://test") as client:
+            response = await client.get("/raw")
+
+        assert response.json() == {"plain": "dict"}
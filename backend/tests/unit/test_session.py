@@ -0,0 +1,49 @@
+import pytest
+import pytest_asyncio
+
+from app.core.config import Settings
+from app.db import session as db_session
+
+
+class TestEngineLifecycle:
+    """Test cases for the process-wide engine in app.db.session"""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reset_engine(self):
+        await db_session.dispose_engine()
+        yield
+        await db_session.dispose_engine()
+
+    @pytest.mark.asyncio
+    async def test_engine_is_shared_and_uses_pool_settings(self):
+        """The engine is built once from Settings and reused by every session maker call"""
+        # Arrange
+        settings = Settings(
+            DB_POOL_SIZE=3,
+            DB_MAX_OVERFLOW=4,
+            DB_POOL_TIMEOUT=5,
+            DB_POOL_RECYCLE=60,
+        )
+
+        # Act
+        engine = db_session.init_engine(settings)
+
+        # Assert
+        assert db_session.get_engine() is engine
+        assert db_session.get_session_maker() is db_session.get_session_maker()
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 4
+        assert engine.pool._timeout == 5
+        assert engine.pool._recycle == 60
+
+    @pytest.mark.asyncio
+    async def test_dispose_engine_forgets_engine(self):
+        """Disposing the engine lets the next caller build a fresh one"""
+        # Arrange
+        engine = db_session.init_engine(Settings())
+
+        # Act
+        await db_session.dispose_engine()
+
+        # Assert
+        assert db_session.get_engine() is not engine
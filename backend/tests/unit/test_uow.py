@@ -0,0 +1,205 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.db.uow import UnitOfWork
+from tests.conftest import create_pizza
+
+
+def create_session_mock():
+    session = Mock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    return session
+
+
+class TestUnitOfWork:
+    """Test cases for UnitOfWork transaction handling"""
+
+    @pytest.mark.asyncio
+    async def test_read_only_block_uses_read_session(self):
+        """Read-only blocks run repositories on the read session and never commit"""
+        # Arrange
+        primary = create_session_mock()
+        replica = create_session_mock()
+        session_factory = Mock(return_value=primary)
+        uow = UnitOfWork(session_factory, read_session_factory=lambda: replica)
+
+        # Act
+        async with uow.read_only():
+            repo_session = uow.pizzas._session
+
+        # Assert
+        assert repo_session is replica
+        replica.close.assert_awaited_once()
+        replica.commit.assert_not_awaited()
+        session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_read_only_without_read_factory_uses_primary(self):
+        """Without a read session factory, read-only blocks behave like regular ones"""
+        # Arrange
+        primary = create_session_mock()
+        uow = UnitOfWork(lambda: primary)
+
+        # Act
+        async with uow.read_only():
+            repo_session = uow.extras._session
+
+        # Assert
+        assert repo_session is primary
+        primary.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_block_commits_on_primary(self):
+        """Regular blocks ignore the read factory and commit on the primary session"""
+        # Arrange
+        primary = create_session_mock()
+        read_session_factory = Mock()
+        uow = UnitOfWork(lambda: primary, read_session_factory=read_session_factory)
+
+        # Act
+        async with uow:
+            repo_session = uow.carts._session
+
+        # Assert
+        assert repo_session is primary
+        read_session_factory.assert_not_called()
+        primary.commit.assert_awaited_once()
+        primary.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_session_is_opened_lazily(self):
+        """A block that never touches a repository opens no session and commits nothing"""
+        # Arrange
+        session_factory = Mock()
+        read_session_factory = Mock()
+        uow = UnitOfWork(session_factory, read_session_factory=read_session_factory)
+
+        # Act
+        async with uow:
+            pass
+        async with uow.read_only():
+            pass
+
+        # Assert
+        session_factory.assert_not_called()
+        read_session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repositories_are_memoized_per_session(self):
+        """Repository properties return the same instance until the session is closed"""
+        # Arrange
+        uow = UnitOfWork(create_session_mock)
+
+        # Act
+        async with uow:
+            first, again = uow.pizzas, uow.pizzas
+        async with uow:
+            next_block = uow.pizzas
+
+        # Assert
+        assert first is again
+        assert next_block is not first
+
+    @pytest.mark.asyncio
+    async def test_catalog_rows_are_shared_across_blocks(self):
+        """A pizza loaded in one block is served from the identity cache in the next"""
+        # Arrange
+        pizza = create_pizza()
+        first_session = create_session_mock()
+        first_session.get = AsyncMock(return_value=pizza)
+        second_session = create_session_mock()
+        second_session.get = AsyncMock()
+        uow = UnitOfWork(Mock(side_effect=[first_session, second_session]))
+
+        # Act
+        async with uow:
+            await uow.pizzas.get(pizza.id)
+        async with uow:
+            cached = await uow.pizzas.get(pizza.id)
+
+        # Assert
+        assert cached is pizza
+        second_session.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_nested_block_uses_savepoint_and_commits_once(self):
+        """A nested block releases a savepoint; only the outermost block commits"""
+        # Arrange
+        session = create_session_mock()
+        savepoint = Mock(is_active=True, commit=AsyncMock(), rollback=AsyncMock())
+        session.begin_nested = AsyncMock(return_value=savepoint)
+        uow = UnitOfWork(lambda: session)
+
+        # Act
+        async with uow:
+            uow.carts
+            async with uow:
+                uow.orders
+            session.commit.assert_not_awaited()
+
+        # Assert
+        savepoint.commit.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_nested_block_rolls_back_to_savepoint(self):
+        """A failure caught by the outer block only undoes the nested block"""
+        # Arrange
+        session = create_session_mock()
+        savepoint = Mock(is_active=True, commit=AsyncMock(), rollback=AsyncMock())
+        session.begin_nested = AsyncMock(return_value=savepoint)
+        uow = UnitOfWork(lambda: session)
+
+        # Act
+        async with uow:
+            uow.carts
+            with pytest.raises(ValueError):
+                async with uow:
+                    raise ValueError("boom")
+
+        # Assert
+        savepoint.rollback.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_read_only_block_reads_through_write_transaction(self):
+        """Read-only blocks inside a write block stay on the write session without a savepoint"""
+        # Arrange
+        session = create_session_mock()
+        session.begin_nested = AsyncMock()
+        read_session_factory = Mock()
+        uow = UnitOfWork(lambda: session, read_session_factory=read_session_factory)
+
+        # Act
+        async with uow:
+            uow.carts
+            async with uow.read_only():
+                repo_session = uow.pizzas._session
+
+        # Assert
+        assert repo_session is session
+        read_session_factory.assert_not_called()
+        session.begin_nested.assert_not_awaited()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_block_inside_read_only_block_is_rejected(self):
+        """A write block can't run on the read-only block's session"""
+        # Arrange
+        replica = create_session_mock()
+        session_factory = Mock()
+        uow = UnitOfWork(session_factory, read_session_factory=lambda: replica)
+
+        # Act / Assert
+        async with uow.read_only():
+            uow.pizzas
+            with pytest.raises(RuntimeError, match="nested inside read_only"):
+                async with uow:
+                    pass
+
+        session_factory.assert_not_called()
+        replica.close.assert_awaited_once()